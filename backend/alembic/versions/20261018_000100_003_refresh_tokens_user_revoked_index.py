@@ -0,0 +1,38 @@
+"""Composite (user_id, is_revoked) index on refresh_tokens
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 00:01:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 사용자별 일괄 무효화(UPDATE ... WHERE user_id=? AND is_revoked=0)용 복합 인덱스
+    op.create_index(
+        "ix_refresh_tokens_user_id_is_revoked",
+        "refresh_tokens",
+        ["user_id", "is_revoked"],
+        unique=False,
+    )
+    # 복합 인덱스가 user_id 외래 키 인덱스를 대신하므로 단일 컬럼 인덱스 제거
+    op.drop_index(op.f("ix_refresh_tokens_user_id"), table_name="refresh_tokens")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_refresh_tokens_user_id"),
+        "refresh_tokens",
+        ["user_id"],
+        unique=False,
+    )
+    op.drop_index("ix_refresh_tokens_user_id_is_revoked", table_name="refresh_tokens")
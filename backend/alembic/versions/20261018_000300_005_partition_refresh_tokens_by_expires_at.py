@@ -0,0 +1,87 @@
+"""Range-partition refresh_tokens by expires_at (daily)
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 00:03:00.000000
+
+MySQL 전용 마이그레이션입니다.
+- 파티션 테이블은 외래 키를 가질 수 없으므로 user_id 외래 키 제거
+  (사용자 완전 삭제 시 UserCRUD.delete_user가 토큰을 직접 삭제)
+- 모든 유니크 키에 파티션 키가 포함되어야 하므로
+  기본 키를 (id, expires_at), token_hash 유니크 인덱스를 (token_hash, expires_at)로 변경
+- 기존 행은 p_history, 오늘부터는 일 단위 파티션, 그 이후는 pmax에 저장
+이후 파티션 생성/삭제는 python -m app.commands.refresh_token_partitions 로 수행합니다.
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 마이그레이션 시점에 미리 만들어 둘 일 단위 파티션 수
+# (REFRESH_TOKEN_PARTITION_PRECREATE_DAYS 기본값과 동일)
+PRECREATE_DAYS = 14
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    # 외래 키 제거 (001에서 이름 없이 생성되어 InnoDB 기본 이름 사용)
+    op.drop_constraint("refresh_tokens_ibfk_1", "refresh_tokens", type_="foreignkey")
+
+    # 유니크 키에 파티션 키(expires_at) 포함
+    op.execute(
+        "ALTER TABLE refresh_tokens "
+        "DROP PRIMARY KEY, ADD PRIMARY KEY (id, expires_at), "
+        "DROP INDEX ix_refresh_tokens_token_hash, "
+        "ADD UNIQUE INDEX ix_refresh_tokens_token_hash (token_hash, expires_at)"
+    )
+
+    # 일 단위 RANGE 파티션 생성
+    today = datetime.utcnow().date()
+    partitions = [f"PARTITION p_history VALUES LESS THAN ('{today.isoformat()}')"]
+    for offset in range(PRECREATE_DAYS + 1):
+        day = today + timedelta(days=offset)
+        upper = day + timedelta(days=1)
+        partitions.append(
+            f"PARTITION p{day:%Y%m%d} VALUES LESS THAN ('{upper.isoformat()}')"
+        )
+    partitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    op.execute(
+        "ALTER TABLE refresh_tokens PARTITION BY RANGE COLUMNS(expires_at) ("
+        + ", ".join(partitions)
+        + ")"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    op.execute("ALTER TABLE refresh_tokens REMOVE PARTITIONING")
+    op.execute(
+        "ALTER TABLE refresh_tokens "
+        "DROP INDEX ix_refresh_tokens_token_hash, "
+        "ADD UNIQUE INDEX ix_refresh_tokens_token_hash (token_hash), "
+        "DROP PRIMARY KEY, ADD PRIMARY KEY (id)"
+    )
+
+    # 외래 키 복원 전 삭제된 사용자의 토큰 정리
+    op.execute(
+        "DELETE rt FROM refresh_tokens rt "
+        "LEFT JOIN users u ON u.id = rt.user_id WHERE u.id IS NULL"
+    )
+    op.create_foreign_key(
+        "refresh_tokens_ibfk_1",
+        "refresh_tokens",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
@@ -0,0 +1,62 @@
+"""Add BINARY(32) token hash column with covering index (expand)
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 00:04:00.000000
+
+token_hash(VARCHAR(64) 16진수)를 BINARY(32)로 바꾸는 온라인 전환의 1단계입니다.
+1. (006) token_hash_bin 컬럼과 커버링 인덱스 추가, INSERT 트리거로 새 행 자동 채움
+   → 기존 애플리케이션 코드를 그대로 둔 채 적용 가능
+2. python -m app.commands.backfill_token_hash 로 기존 행을 배치 단위로 채움
+3. (007) 기존 컬럼 제거 후 token_hash_bin을 token_hash로 변경 (애플리케이션 배포와 함께)
+바이너리 로그가 켜진 MySQL에서 SUPER 권한 없이 트리거를 만들려면
+log_bin_trust_function_creators=1이 필요합니다.
+007과 같이 MySQL 전용 마이그레이션입니다 (다른 DB는 token_hash 컬럼을 그대로 사용).
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGGER_NAME = "trg_refresh_tokens_token_hash_bin"
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    # 백필 전까지 NULL 허용 (MySQL 8에서 INSTANT 컬럼 추가)
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("token_hash_bin", sa.BINARY(length=32), nullable=True),
+    )
+
+    # 검증 쿼리용 커버링 인덱스 (id는 기본 키로 포함, expires_at은 파티션 유니크 키 제약)
+    op.create_index(
+        "ix_refresh_tokens_token_hash_bin",
+        "refresh_tokens",
+        ["token_hash_bin", "expires_at", "is_revoked"],
+        unique=True,
+    )
+
+    # 전환 기간 동안 기존 코드가 저장하는 행도 바이너리 해시를 갖도록 함
+    op.execute(
+        f"CREATE TRIGGER {TRIGGER_NAME} BEFORE INSERT ON refresh_tokens "
+        "FOR EACH ROW SET NEW.token_hash_bin = "
+        "COALESCE(NEW.token_hash_bin, UNHEX(NEW.token_hash))"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    op.execute(f"DROP TRIGGER IF EXISTS {TRIGGER_NAME}")
+    op.drop_index("ix_refresh_tokens_token_hash_bin", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "token_hash_bin")
@@ -0,0 +1,62 @@
+"""Replace VARCHAR token hash with BINARY(32) column (contract)
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 00:05:00.000000
+
+BINARY(32) 전환의 마지막 단계로, 백필 완료 후 hash_token이 바이트를 반환하는
+애플리케이션 배포와 함께 적용합니다. 남은 NULL 행은 여기서 마저 채웁니다.
+MySQL 전용 마이그레이션입니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGGER_NAME = "trg_refresh_tokens_token_hash_bin"
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    op.execute(f"DROP TRIGGER IF EXISTS {TRIGGER_NAME}")
+    op.execute(
+        "UPDATE refresh_tokens SET token_hash_bin = UNHEX(token_hash) "
+        "WHERE token_hash_bin IS NULL"
+    )
+    op.execute(
+        "ALTER TABLE refresh_tokens "
+        "DROP INDEX ix_refresh_tokens_token_hash, "
+        "DROP COLUMN token_hash, "
+        "CHANGE COLUMN token_hash_bin token_hash BINARY(32) NOT NULL, "
+        "RENAME INDEX ix_refresh_tokens_token_hash_bin TO ix_refresh_tokens_token_hash"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "mysql":
+        return
+
+    op.execute(
+        "ALTER TABLE refresh_tokens "
+        "RENAME INDEX ix_refresh_tokens_token_hash TO ix_refresh_tokens_token_hash_bin, "
+        "CHANGE COLUMN token_hash token_hash_bin BINARY(32) NULL, "
+        "ADD COLUMN token_hash VARCHAR(64) NULL AFTER user_id"
+    )
+    op.execute("UPDATE refresh_tokens SET token_hash = LOWER(HEX(token_hash_bin))")
+    op.execute(
+        "ALTER TABLE refresh_tokens "
+        "MODIFY COLUMN token_hash VARCHAR(64) NOT NULL, "
+        "ADD UNIQUE INDEX ix_refresh_tokens_token_hash (token_hash, expires_at)"
+    )
+    op.execute(
+        f"CREATE TRIGGER {TRIGGER_NAME} BEFORE INSERT ON refresh_tokens "
+        "FOR EACH ROW SET NEW.token_hash_bin = "
+        "COALESCE(NEW.token_hash_bin, UNHEX(NEW.token_hash))"
+    )
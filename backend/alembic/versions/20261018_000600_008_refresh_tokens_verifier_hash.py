@@ -0,0 +1,31 @@
+"""Add verifier_hash column for opaque refresh tokens
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 00:06:00.000000
+
+Opaque Refresh Token("{selector}.{verifier}")은 token_hash에 selector 해시를,
+verifier_hash에 verifier 해시를 저장합니다. 기존 JWT 토큰 행은 NULL로 남습니다.
+NULL 허용 컬럼 추가이므로 MySQL 8에서 INSTANT로 적용됩니다.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("verifier_hash", sa.BINARY(length=32), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("refresh_tokens", "verifier_hash")
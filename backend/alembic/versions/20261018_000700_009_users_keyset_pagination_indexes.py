@@ -0,0 +1,39 @@
+"""Add (created_at, id) indexes on users for keyset pagination
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 00:07:00.000000
+
+관리자 사용자 목록은 (created_at, id) 순서로 키셋 페이지네이션하므로
+페이지 깊이와 무관하게 인덱스 범위 탐색으로 limit + 1 행만 읽습니다.
+is_active 필터를 함께 쓰는 경우를 위해 (is_active, created_at, id) 인덱스도 추가합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_users_created_at_id",
+        "users",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_users_is_active_created_at_id",
+        "users",
+        ["is_active", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_is_active_created_at_id", table_name="users")
+    op.drop_index("ix_users_created_at_id", table_name="users")
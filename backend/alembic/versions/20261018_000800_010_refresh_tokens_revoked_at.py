@@ -0,0 +1,76 @@
+"""Add revoked_at column to refresh_tokens
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18 00:08:00.000000
+
+무효화된 토큰의 보존 기간(REFRESH_TOKEN_GC_RETENTION_HOURS)을 발급 시각이 아닌
+무효화 시각부터 세기 위한 컬럼입니다. 정리 작업은 revoked_at < cutoff만으로
+ix_refresh_tokens_revoked_at 범위를 탐색합니다.
+NULL 허용 컬럼 추가이므로 MySQL 8에서 INSTANT로 적용됩니다.
+
+기존 무효화 행은 무효화 시각을 알 수 없으므로 revoked_at = created_at으로 채웁니다
+(id 범위 배치마다 커밋하여 잠금 시간을 제한). 배포 중 이전 버전 애플리케이션이
+무효화한 행은 NULL로 남지만, 만료 후 만료 토큰 정리(또는 파티션 삭제)로 삭제됩니다.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 백필 배치당 id 범위
+BACKFILL_BATCH_SIZE = 5000
+
+BACKFILL_SQL = sa.text(
+    "UPDATE refresh_tokens SET revoked_at = created_at "
+    "WHERE id >= :low AND id < :high AND is_revoked = 1 AND revoked_at IS NULL"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("revoked_at", sa.DateTime(), nullable=True),
+    )
+
+    # 오프라인(--sql) 모드는 범위를 조회할 수 없으므로 한 문장으로 백필
+    if op.get_context().as_sql:
+        op.execute(
+            "UPDATE refresh_tokens SET revoked_at = created_at "
+            "WHERE is_revoked = 1 AND revoked_at IS NULL"
+        )
+    else:
+        _backfill_revoked_at()
+
+    op.create_index(
+        "ix_refresh_tokens_revoked_at",
+        "refresh_tokens",
+        ["revoked_at"],
+        unique=False,
+    )
+
+
+def _backfill_revoked_at() -> None:
+    """기본 키(id) 범위로 나누어 백필 (MySQL은 배치마다 커밋)"""
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        low, high = conn.execute(
+            sa.text("SELECT MIN(id), MAX(id) FROM refresh_tokens")
+        ).one()
+        if low is None:
+            return
+        for start in range(low, high + 1, BACKFILL_BATCH_SIZE):
+            conn.execute(
+                BACKFILL_SQL, {"low": start, "high": start + BACKFILL_BATCH_SIZE}
+            )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_revoked_at", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "revoked_at")
@@ -3,15 +3,26 @@ API 의존성 모듈
 인증 및 세션 의존성
 """
 
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Any, Optional
 
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.core.database import get_async_session
-from app.core.security import decode_token
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.core.database import (
+    get_async_session,
+    get_read_session,
+    is_routed_to_replica,
+    use_primary,
+)
+from app.core.replica import is_primary_pinned, replica_state
+from app.core.security import create_access_token, decode_token_cached
+from app.crud.token_store import TokenStore, get_token_store
 from app.crud.user import user_crud
 from app.models.user import User
 
@@ -19,15 +30,95 @@ from app.models.user import User
 security = HTTPBearer()
 
 
+def create_user_access_token(user: User) -> str:
+    """
+    사용자 Access Token 발급
+
+    무상태 모드(ACCESS_TOKEN_STATELESS)에서는 인증에 필요한 사용자 스냅샷과
+    token_version을 클레임에 포함하여 DB 조회 없이 인증할 수 있도록 합니다.
+    """
+    if not settings.ACCESS_TOKEN_STATELESS:
+        return create_access_token(subject=user.id)
+
+    return create_access_token(
+        subject=user.id,
+        extra_claims={
+            "ver": user.token_version,
+            "usr": {
+                "em": user.email,
+                "un": user.username,
+                "fn": user.full_name,
+                "act": user.is_active,
+                "su": user.is_superuser,
+                "ca": user.created_at.isoformat(),
+                "ua": user.updated_at.isoformat(),
+            },
+        },
+    )
+
+
+def user_from_token_claims(payload: dict[str, Any]) -> Optional[User]:
+    """
+    Access Token 클레임의 사용자 스냅샷으로 User 복원
+
+    스냅샷이 없는 토큰(무상태 모드 이전 발급)이면 None을 반환합니다.
+    반환된 User는 분리(detached) 상태이므로 쓰기 경로에서 세션에 add할 수 있습니다.
+    """
+    snapshot = payload.get("usr")
+    if not isinstance(snapshot, dict) or "ver" not in payload:
+        return None
+
+    user = User(
+        id=int(payload["sub"]),
+        email=snapshot["em"],
+        username=snapshot["un"],
+        full_name=snapshot.get("fn"),
+        is_active=snapshot["act"],
+        is_superuser=snapshot.get("su", False),
+        token_version=payload["ver"],
+        created_at=datetime.fromisoformat(snapshot["ca"]),
+        updated_at=datetime.fromisoformat(snapshot["ua"]),
+    )
+    make_transient_to_detached(user)
+    return user
+
+
+async def load_user_for_auth(session: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    읽기 세션으로 인증 사용자 조회
+
+    - 최근 정보를 변경한 사용자는 주 DB에서 조회 (read-your-writes)
+    - 복제본 조회가 실패하면 복제본을 비정상으로 표시하고 주 DB에서 다시 조회
+    - 읽기 풀은 pre-ping을 하지 않으므로 끊긴 연결(connection_invalidated)이면 새 연결로 한 번 재조회
+    - 조회 후 세션을 닫아 연결을 바로 반납하고, 반환한 User를 분리(detached) 상태로 만들어
+      쓰기 세션에 add할 수 있도록 함
+    """
+    if is_primary_pinned(user_id):
+        use_primary(session)
+    try:
+        user = await user_crud.get_user_for_auth(session, user_id)
+    except DBAPIError as e:
+        if is_routed_to_replica(session):
+            replica_state.mark_unhealthy(f"조회 실패: {e!r}")
+            use_primary(session)
+        elif not e.connection_invalidated:
+            raise
+        await session.rollback()
+        user = await user_crud.get_user_for_auth(session, user_id)
+    await session.close()
+    return user
+
+
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> User:
     """
     현재 인증된 사용자 조회
 
     Authorization 헤더에서 JWT 토큰을 추출하고 검증하여
-    해당 사용자를 반환합니다.
+    해당 사용자를 반환합니다. 무상태 모드에서는 토큰 클레임만으로 응답합니다.
+    DB 조회는 읽기 세션(복제본 우선)을 사용합니다.
 
     Raises:
         HTTPException 401: 토큰이 유효하지 않거나 만료됨
@@ -37,7 +128,7 @@ async def get_current_user(
     token = credentials.credentials
 
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
 
         # Access Token인지 확인
         if payload.get("type") != "access":
@@ -68,7 +159,34 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await user_crud.get_user_by_id(session, int(user_id))
+    # 무상태 모드: 클레임의 사용자 스냅샷으로 응답 (DB 조회 없음)
+    if settings.ACCESS_TOKEN_STATELESS:
+        try:
+            claims_user = user_from_token_claims(payload)
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="유효하지 않은 토큰입니다",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if claims_user is not None:
+            if user_crud.is_token_version_revoked(
+                claims_user.id, claims_user.token_version
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="무효화된 토큰입니다",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            if not claims_user.is_active:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="비활성화된 계정입니다",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return claims_user
+
+    user = await load_user_for_auth(session, int(user_id))
 
     if user is None:
         raise HTTPException(
@@ -87,6 +205,26 @@ async def get_current_user(
     return user
 
 
+async def get_current_superuser(
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> User:
+    """
+    현재 사용자가 관리자인지 확인
+
+    Raises:
+        HTTPException 403: 관리자가 아닌 경우
+    """
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다",
+        )
+    return current_user
+
+
 # 타입 어노테이션 단축
 CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentSuperuser = Annotated[User, Depends(get_current_superuser)]
 DbSession = Annotated[AsyncSession, Depends(get_async_session)]
+ReadSession = Annotated[AsyncSession, Depends(get_read_session)]
+RefreshTokenStore = Annotated[TokenStore, Depends(get_token_store)]
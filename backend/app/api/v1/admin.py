@@ -0,0 +1,163 @@
+"""
+관리자 API 엔드포인트
+사용자 목록 조회(키셋 페이지네이션), NDJSON 내보내기, DB 연결 풀 상태
+"""
+
+import base64
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from datetime import datetime
+from typing import Annotated, Any
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import CurrentSuperuser, ReadSession
+from app.core.config import settings
+from app.core.database import (
+    get_async_engine,
+    get_read_engine,
+    get_read_session_factory,
+    get_replica_engine,
+)
+from app.core.pool import pool_status
+from app.crud.user import user_crud
+from app.schemas.user import AdminUserRead, UserListFilter, UserListParams, UserPage
+from app.tasks.pool_advisor import pool_advisor
+
+router = APIRouter(prefix="/admin", tags=["관리자"])
+
+# 내보내기 시 서버 측 커서에서 한 번에 가져올 행 수
+EXPORT_BATCH_SIZE = 1000
+
+
+def encode_cursor(created_at: datetime, user_id: int) -> str:
+    """페이지 커서 생성 (마지막 행의 created_at, id)"""
+    raw = f"{created_at.isoformat()}|{user_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    페이지 커서 해석
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    # base64/UTF-8 디코딩 오류도 ValueError의 하위 클래스
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    created_at, user_id = raw.split("|")
+    return datetime.fromisoformat(created_at), int(user_id)
+
+
+@router.get(
+    "/users",
+    response_model=UserPage,
+    summary="사용자 목록 조회",
+)
+async def list_users(
+    params: Annotated[UserListParams, Query()],
+    _: CurrentSuperuser,
+    session: ReadSession,
+) -> UserPage:
+    """
+    사용자 목록 조회 (관리자 전용)
+
+    - (created_at, id) 키셋 페이지네이션: 응답의 next_cursor를 cursor로 전달하여 다음 페이지 조회
+    - 필터: is_active, email_prefix, created_from ~ created_to (가입일 범위, 끝 미포함)
+    - 정렬: order=desc(최신 가입 순, 기본값) 또는 asc
+    """
+    after = None
+    if params.cursor is not None:
+        try:
+            after = decode_cursor(params.cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 커서입니다",
+            )
+
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    rows = await user_crud.list_users(
+        session,
+        params,
+        params.limit + 1,
+        after=after,
+        descending=params.order == "desc",
+    )
+    items = [AdminUserRead.model_validate(dict(row)) for row in rows[: params.limit]]
+    next_cursor = None
+    if len(rows) > params.limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return UserPage(items=items, next_cursor=next_cursor)
+
+
+async def _export_ndjson(filters: UserListFilter) -> AsyncIterator[str]:
+    """서버 측 커서로 읽은 배치를 NDJSON 청크로 변환 (메모리 사용량은 배치 크기로 고정)"""
+    # 응답 본문 전송 중에도 유지되어야 하므로 요청 세션과 별도의 읽기 세션 사용
+    async with get_read_session_factory()() as session:
+        async for rows in user_crud.stream_users(session, filters, EXPORT_BATCH_SIZE):
+            yield "".join(
+                AdminUserRead.model_validate(dict(row)).model_dump_json() + "\n"
+                for row in rows
+            )
+
+
+@router.get(
+    "/users/export",
+    response_class=StreamingResponse,
+    summary="사용자 NDJSON 내보내기",
+)
+async def export_users(
+    filters: Annotated[UserListFilter, Query()],
+    _: CurrentSuperuser,
+) -> StreamingResponse:
+    """
+    사용자 전체 내보내기 (관리자 전용)
+
+    - 한 줄에 사용자 하나인 NDJSON을 (created_at, id) 순으로 스트리밍
+    - 목록 조회와 같은 필터 사용
+    """
+    return StreamingResponse(
+        _export_ndjson(filters),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="users.ndjson"'},
+    )
+
+
+@router.get("/db-pool", summary="DB 연결 풀 상태")
+async def db_pool(_: CurrentSuperuser) -> dict[str, Any]:
+    """
+    DB 연결 풀 상태 (관리자 전용)
+
+    - pools: 풀(primary: 주 DB 쓰기, read: 주 DB 읽기, replica: 읽기 복제본)별
+      - status: 사용 중/대기 연결 수, 오버플로, 연결 획득 대기 시간(p50/p95/p99), 무효화 수
+      - recommendation: DB_POOL_ADAPTIVE=true일 때 마지막 구간의 풀 크기 권장값
+    - settings: 현재 풀 설정
+    """
+    engines = {"primary": get_async_engine(), "read": get_read_engine()}
+    replica = get_replica_engine()
+    if replica is not None:
+        engines["replica"] = replica
+    pools = {}
+    for name, engine in engines.items():
+        recommendation = pool_advisor.last_recommendations.get(name)
+        pools[name] = {
+            "status": pool_status(engine.pool, name),
+            "recommendation": asdict(recommendation) if recommendation else None,
+        }
+    return {
+        "pools": pools,
+        "settings": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout_seconds": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_recycle_seconds": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+            "read_pool_size": settings.DB_READ_POOL_SIZE,
+            "read_max_overflow": settings.DB_READ_MAX_OVERFLOW,
+            "read_pool_pre_ping": settings.DB_READ_POOL_PRE_PING,
+        },
+    }
@@ -3,16 +3,26 @@
 회원가입, 로그인, 토큰 갱신
 """
 
+from typing import Optional
+
 import jwt
 from fastapi import APIRouter, HTTPException, status
 
-from app.api.deps import CurrentUser, DbSession
+from app.api.deps import (
+    CurrentUser,
+    DbSession,
+    RefreshTokenStore,
+    create_user_access_token,
+)
+from app.core.config import settings
 from app.core.security import (
     create_access_token,
-    create_refresh_token,
+    create_opaque_refresh_token,
     decode_token,
+    is_opaque_token,
+    issue_refresh_token,
 )
-from app.crud.user import user_crud
+from app.crud.user import DuplicateUserError, user_crud
 from app.schemas.auth import (
     LoginRequest,
     RefreshTokenRequest,
@@ -33,42 +43,29 @@ router = APIRouter(prefix="/auth", tags=["인증"])
 async def register(
     user_create: UserCreate,
     session: DbSession,
+    token_store: RefreshTokenStore,
 ) -> TokenWithUser:
     """
     새 사용자 등록
 
-    - 이메일 중복 확인
-    - 사용자명 중복 확인
+    - 이메일/사용자명 중복은 사전 조회 없이 INSERT 시 고유 인덱스 위반으로 판정
     - 비밀번호 Argon2 해싱
     - Access Token + Refresh Token 발급
     """
-    # 이메일 중복 확인
-    existing_user = await user_crud.get_user_by_email(session, user_create.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 등록된 이메일입니다",
-        )
-
-    # 사용자명 중복 확인
-    existing_username = await user_crud.get_user_by_username(
-        session, user_create.username
-    )
-    if existing_username:
+    try:
+        user = await user_crud.create_user(session, user_create)
+    except DuplicateUserError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 사용 중인 사용자명입니다",
+            detail=e.detail,
         )
 
-    # 사용자 생성
-    user = await user_crud.create_user(session, user_create)
-
     # 토큰 발급
-    access_token = create_access_token(subject=user.id)
-    refresh_token = create_refresh_token(subject=user.id)
+    access_token = create_user_access_token(user)
+    refresh_token = issue_refresh_token(subject=user.id)
 
-    # Refresh Token DB 저장
-    await user_crud.save_refresh_token(session, user.id, refresh_token)
+    # Refresh Token 저장
+    await token_store.save(session, user.id, refresh_token)
 
     return TokenWithUser(
         access_token=access_token,
@@ -85,6 +82,7 @@ async def register(
 async def login(
     login_request: LoginRequest,
     session: DbSession,
+    token_store: RefreshTokenStore,
 ) -> TokenWithUser:
     """
     사용자 로그인
@@ -105,11 +103,11 @@ async def login(
         )
 
     # 토큰 발급
-    access_token = create_access_token(subject=user.id)
-    refresh_token = create_refresh_token(subject=user.id)
+    access_token = create_user_access_token(user)
+    refresh_token = issue_refresh_token(subject=user.id)
 
-    # Refresh Token DB 저장
-    await user_crud.save_refresh_token(session, user.id, refresh_token)
+    # Refresh Token 저장
+    await token_store.save(session, user.id, refresh_token)
 
     return TokenWithUser(
         access_token=access_token,
@@ -126,61 +124,75 @@ async def login(
 async def refresh_token(
     refresh_request: RefreshTokenRequest,
     session: DbSession,
+    token_store: RefreshTokenStore,
 ) -> Token:
     """
     Access Token 갱신 (Refresh Token 로테이션)
 
-    - 기존 Refresh Token 검증
-    - 기존 Refresh Token 무효화
+    - 기존 Refresh Token 검증 및 무효화 (조건부 UPDATE 한 번, 동시 갱신 시 하나만 성공)
+    - 새 Refresh Token 저장
     - 새 Access Token + Refresh Token 발급
+
+    Opaque 토큰은 JWT 디코딩 없이 저장소에서 selector 조회와 verifier 비교로 검증하고,
+    기존 JWT 토큰은 서명 검증 후 로테이션합니다 (REFRESH_TOKEN_FORMAT에 따라 새 형식 발급).
     """
     token = refresh_request.refresh_token
-
-    # JWT 토큰 디코딩
-    try:
-        payload = decode_token(token)
-
-        if payload.get("type") != "refresh":
+    user_id: Optional[int] = None
+
+    if is_opaque_token(token):
+        new_refresh_token = create_opaque_refresh_token()
+    else:
+        # JWT 토큰 디코딩
+        try:
+            payload = decode_token(token)
+
+            if payload.get("type") != "refresh":
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="유효하지 않은 토큰 타입입니다",
+                )
+
+            subject = payload.get("sub")
+            if subject is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="유효하지 않은 토큰입니다",
+                )
+            user_id = int(subject)
+
+        except jwt.ExpiredSignatureError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="유효하지 않은 토큰 타입입니다",
+                detail="Refresh Token이 만료되었습니다",
             )
-
-        user_id = payload.get("sub")
-        if user_id is None:
+        except jwt.InvalidTokenError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="유효하지 않은 토큰입니다",
             )
+        new_refresh_token = issue_refresh_token(subject=user_id)
 
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Refresh Token이 만료되었습니다",
-        )
-    except jwt.InvalidTokenError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 토큰입니다",
-        )
-
-    # DB에서 Refresh Token 검증
-    stored_token = await user_crud.verify_refresh_token(session, token)
-    if not stored_token:
+    # 토큰 로테이션: 기존 토큰 검증과 소비를 원자적으로 수행
+    user_id = await token_store.rotate(
+        session, token, new_refresh_token, user_id=user_id
+    )
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh Token이 유효하지 않거나 이미 사용되었습니다",
         )
 
-    # 기존 토큰 무효화 (토큰 로테이션)
-    await user_crud.revoke_refresh_token(session, token)
-
-    # 새 토큰 발급
-    new_access_token = create_access_token(subject=user_id)
-    new_refresh_token = create_refresh_token(subject=user_id)
-
-    # 새 Refresh Token DB 저장
-    await user_crud.save_refresh_token(session, int(user_id), new_refresh_token)
+    # 새 Access Token 발급 (무상태 모드에서는 최신 사용자 스냅샷을 담기 위해 사용자 조회)
+    if settings.ACCESS_TOKEN_STATELESS:
+        user = await user_crud.get_user_for_auth(session, user_id)
+        if user is None or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="비활성화된 계정입니다",
+            )
+        new_access_token = create_user_access_token(user)
+    else:
+        new_access_token = create_access_token(subject=user_id)
 
     return Token(
         access_token=new_access_token,
@@ -196,10 +208,15 @@ async def refresh_token(
 async def logout(
     current_user: CurrentUser,
     session: DbSession,
+    token_store: RefreshTokenStore,
 ) -> None:
     """
     로그아웃
 
     - 현재 사용자의 모든 Refresh Token 무효화
+    - 무상태 모드에서는 token_version 증가로 기존 Access Token 일괄 무효화
+      (그 외에는 인증 시 token_version을 확인하지 않으므로 UPDATE 생략)
     """
-    await user_crud.revoke_all_user_tokens(session, current_user.id)
+    await token_store.revoke_all(session, current_user.id)
+    if settings.ACCESS_TOKEN_STATELESS:
+        await user_crud.revoke_access_tokens(session, current_user)
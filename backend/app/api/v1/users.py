@@ -5,9 +5,15 @@
 
 from fastapi import APIRouter, HTTPException, status
 
-from app.api.deps import CurrentUser, DbSession
-from app.crud.user import user_crud
-from app.schemas.user import UserRead, UserUpdate
+from app.api.deps import (
+    CurrentUser,
+    DbSession,
+    RefreshTokenStore,
+    create_user_access_token,
+)
+from app.core.config import settings
+from app.crud.user import TOKEN_VERSION_FIELDS, DuplicateUserError, user_crud
+from app.schemas.user import UserRead, UserUpdate, UserUpdateResponse
 
 router = APIRouter(prefix="/users", tags=["사용자"])
 
@@ -28,43 +34,36 @@ async def get_current_user_info(
 
 @router.put(
     "/me",
-    response_model=UserRead,
+    response_model=UserUpdateResponse,
     summary="내 정보 수정",
 )
 async def update_current_user(
     user_update: UserUpdate,
     current_user: CurrentUser,
     session: DbSession,
-) -> UserRead:
+) -> UserUpdateResponse:
     """
     현재 로그인한 사용자 정보 수정
 
-    - 이메일 변경 시 중복 확인
-    - 사용자명 변경 시 중복 확인
+    - 이메일/사용자명 중복은 사전 조회 없이 UPDATE 시 고유 인덱스 위반으로 판정
     - 비밀번호 변경 시 Argon2 해싱
+    - 이메일/사용자명/비밀번호 변경 시 기존 Access Token 무효화 (token_version 증가)
+    - 무상태 모드에서는 변경된 정보로 새 Access Token 발급 (access_token)
     """
-    # 이메일 중복 확인 (변경 요청 시)
-    if user_update.email and user_update.email != current_user.email:
-        existing_user = await user_crud.get_user_by_email(session, user_update.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 등록된 이메일입니다",
-            )
-
-    # 사용자명 중복 확인 (변경 요청 시)
-    if user_update.username and user_update.username != current_user.username:
-        existing_username = await user_crud.get_user_by_username(
-            session, user_update.username
+    try:
+        updated_user = await user_crud.update_user(session, current_user, user_update)
+    except DuplicateUserError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.detail,
         )
-        if existing_username:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용 중인 사용자명입니다",
-            )
-
-    updated_user = await user_crud.update_user(session, current_user, user_update)
-    return UserRead.model_validate(updated_user)
+    response = UserUpdateResponse.model_validate(updated_user)
+    if settings.ACCESS_TOKEN_STATELESS:
+        # 증가식으로 갱신된 token_version을 새 토큰에 담기 위해 다시 조회
+        if TOKEN_VERSION_FIELDS & user_update.model_fields_set:
+            await session.refresh(updated_user, ["token_version"])
+        response.access_token = create_user_access_token(updated_user)
+    return response
 
 
 @router.delete(
@@ -75,6 +74,7 @@ async def update_current_user(
 async def delete_current_user(
     current_user: CurrentUser,
     session: DbSession,
+    token_store: RefreshTokenStore,
 ) -> None:
     """
     현재 로그인한 사용자 계정 삭제 (soft delete)
@@ -83,7 +83,7 @@ async def delete_current_user(
     - 모든 Refresh Token 무효화
     """
     # 모든 토큰 무효화
-    await user_crud.revoke_all_user_tokens(session, current_user.id)
+    await token_store.revoke_all(session, current_user.id)
 
     # 계정 비활성화 (soft delete)
     await user_crud.delete_user(session, current_user, soft_delete=True)
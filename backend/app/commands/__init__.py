@@ -0,0 +1 @@
+# 운영 명령 패키지 (python -m app.commands.<name>)
@@ -0,0 +1,109 @@
+"""
+refresh_tokens 바이너리 해시 백필 명령
+마이그레이션 006 적용 후 기존 행의 token_hash_bin을 배치 단위로 채움
+
+배치마다 커밋하고 잠시 대기하여 잠금 시간과 복제 지연을 제한하므로
+서비스 중에 실행할 수 있습니다. 중단 후 다시 실행하면 남은 행부터 이어서 처리합니다.
+완료 후 마이그레이션 007을 적용합니다.
+
+실행:
+    uv run python -m app.commands.backfill_token_hash
+    uv run python -m app.commands.backfill_token_hash --batch-size 2000 --pause 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.database import (
+    close_db,
+    get_async_engine,
+    release_advisory_lock,
+    try_advisory_lock,
+)
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_LOCK_NAME = "refresh_token_hash_backfill"
+
+# token_hash_bin 인덱스로 NULL 행을 찾으므로 배치마다 전체 스캔하지 않음
+BACKFILL_BATCH_SQL = text(
+    "UPDATE refresh_tokens SET token_hash_bin = UNHEX(token_hash) "
+    "WHERE token_hash_bin IS NULL LIMIT :batch_size"
+)
+REMAINING_SQL = text("SELECT COUNT(*) FROM refresh_tokens WHERE token_hash_bin IS NULL")
+
+
+async def backfill(
+    conn: AsyncConnection,
+    batch_size: int,
+    pause: float,
+) -> int:
+    """
+    NULL 행이 없을 때까지 배치 단위로 채움
+
+    Args:
+        conn: 네임드 락을 보유한 연결
+        batch_size: 배치당 행 수
+        pause: 배치 사이 대기 시간(초)
+
+    Returns:
+        채운 행 수
+    """
+    remaining = (await conn.execute(REMAINING_SQL)).scalar_one()
+    await conn.commit()
+    logger.info(f"백필 대상: {remaining}행")
+
+    total = 0
+    started = time.perf_counter()
+    while True:
+        result = await conn.execute(BACKFILL_BATCH_SQL, {"batch_size": batch_size})
+        await conn.commit()
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            break
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"{total}/{remaining}행 완료 ({total / elapsed:.0f} rows/s)"
+        )
+        await asyncio.sleep(pause)
+    return total
+
+
+async def main(args: argparse.Namespace) -> None:
+    if settings.VAULT_ENABLED:
+        from app.core.vault import load_secrets_to_settings, vault_client
+
+        await load_secrets_to_settings()
+        await vault_client.aclose()
+    try:
+        async with get_async_engine().connect() as conn:
+            if not await try_advisory_lock(conn, BACKFILL_LOCK_NAME):
+                print("다른 프로세스가 백필을 실행 중입니다")
+                return
+            try:
+                total = await backfill(conn, args.batch_size, args.pause)
+            finally:
+                await release_advisory_lock(conn, BACKFILL_LOCK_NAME)
+    finally:
+        await close_db()
+    print(f"백필 완료: {total}행 (이제 마이그레이션 007을 적용할 수 있습니다)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=1000, help="배치당 행 수")
+    parser.add_argument(
+        "--pause", type=float, default=0.1, help="배치 사이 대기 시간(초)"
+    )
+    asyncio.run(main(parser.parse_args()))
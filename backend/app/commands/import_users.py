@@ -0,0 +1,343 @@
+"""
+사용자 일괄 가져오기 명령
+CSV 또는 NDJSON 입력을 스트리밍으로 읽어 배치 단위 다중 행 INSERT로 사용자 생성
+
+- 평문 password는 프로세스 풀에서 Argon2로 해싱 (다음 배치 해싱과 현재 배치 INSERT를 겹쳐 실행)
+- 레거시 password_hash(Argon2, bcrypt)는 그대로 저장하고 로그인 시 Argon2로 재해싱
+  (bcrypt 해시는 uv sync --extra bcrypt 필요)
+- 이메일/사용자명이 이미 있는 레코드는 건너뜀
+- 배치 커밋마다 체크포인트 파일에 처리한 레코드 수를 기록하므로
+  중단 후 같은 명령을 다시 실행하면 이어서 처리 (중복 생성 없음)
+
+입력 필드: email, username, full_name, password 또는 password_hash, is_active, created_at
+
+실행:
+    uv run python -m app.commands.import_users users.csv
+    uv run python -m app.commands.import_users users.ndjson --batch-size 2000 --workers 8
+    cat users.ndjson | uv run python -m app.commands.import_users - --format ndjson
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.core.database import close_db, get_session_factory
+from app.core.security import get_password_hash, is_supported_password_hash
+from app.crud.user import user_crud
+from app.schemas.user import UserImport
+
+logger = logging.getLogger(__name__)
+
+# (입력 레코드 번호, 원본 레코드)
+Record = tuple[int, dict[str, Any]]
+
+
+@dataclass
+class ImportStats:
+    """가져오기 진행 상황 (체크포인트 파일에 저장)"""
+
+    records: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    elapsed: float = 0.0
+
+
+@dataclass
+class PreparedBatch:
+    """검증과 해싱을 마친 배치"""
+
+    last_record: int
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    rejected: list[dict[str, Any]] = field(default_factory=list)
+
+
+def detect_format(path: str, fmt: str) -> str:
+    """입력 형식 결정 (auto면 확장자로 판단)"""
+    if fmt != "auto":
+        return fmt
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    raise ValueError(f"입력 형식을 알 수 없습니다: {path} (--format 지정 필요)")
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[Record]:
+    """
+    입력 레코드를 한 건씩 읽음 (파일 전체를 메모리에 올리지 않음)
+
+    CSV의 빈 칸은 값이 없는 것으로 처리합니다.
+    NDJSON에서 JSON 객체가 아닌 줄은 빈 레코드로 반환되어 검증 단계에서 거절됩니다.
+    """
+    if fmt == "csv":
+        for number, row in enumerate(csv.DictReader(stream), start=1):
+            yield number, {key: value for key, value in row.items() if value != ""}
+        return
+
+    number = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            record = None
+        yield number, record if isinstance(record, dict) else {}
+
+
+def load_checkpoint(path: Path) -> ImportStats:
+    """체크포인트 로드 (없으면 처음부터)"""
+    if not path.exists():
+        return ImportStats()
+    return ImportStats(**json.loads(path.read_text()))
+
+
+def save_checkpoint(path: Path, stats: ImportStats) -> None:
+    """체크포인트 저장 (임시 파일 후 교체하여 중단 시에도 손상되지 않음)"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(asdict(stats)))
+    os.replace(tmp_path, path)
+
+
+def _to_row(item: UserImport, now: datetime) -> dict[str, Any]:
+    """users 컬럼 값 (INSERT 후 다시 조회하지 않도록 모든 값을 채움)"""
+    return {
+        "email": item.email,
+        "username": item.username,
+        "hashed_password": item.password_hash,
+        "full_name": item.full_name,
+        "is_active": item.is_active,
+        "is_superuser": False,
+        "token_version": 0,
+        "created_at": item.created_at or now,
+        "updated_at": now,
+    }
+
+
+async def prepare_batch(records: list[Record], executor: Executor) -> PreparedBatch:
+    """
+    배치 검증 및 평문 비밀번호 해싱
+
+    Args:
+        records: 입력 레코드 목록
+        executor: 해싱 프로세스 풀
+
+    Returns:
+        PreparedBatch (거절된 레코드는 rejected에 사유와 함께 포함)
+    """
+    batch = PreparedBatch(last_record=records[-1][0])
+    passwords: list[str] = []
+    hash_targets: list[dict[str, Any]] = []
+    now = datetime.utcnow()
+
+    for number, record in records:
+        try:
+            item = UserImport.model_validate(record)
+        except ValidationError as e:
+            errors = "; ".join(
+                f"{'.'.join(map(str, error['loc'])) or 'record'}: {error['msg']}"
+                for error in e.errors()
+            )
+            batch.rejected.append({"record": number, "error": errors})
+            continue
+        if item.password_hash is not None and not is_supported_password_hash(
+            item.password_hash
+        ):
+            batch.rejected.append(
+                {"record": number, "error": "지원하지 않는 password_hash 형식"}
+            )
+            continue
+
+        row = _to_row(item, now)
+        if item.password is not None:
+            passwords.append(item.password)
+            hash_targets.append(row)
+        batch.rows.append(row)
+
+    loop = asyncio.get_running_loop()
+    hashes = await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, get_password_hash, password)
+            for password in passwords
+        )
+    )
+    for row, hashed_password in zip(hash_targets, hashes):
+        row["hashed_password"] = hashed_password
+    return batch
+
+
+def _batches(records: Iterator[Record], batch_size: int) -> Iterator[list[Record]]:
+    while batch := list(islice(records, batch_size)):
+        yield batch
+
+
+async def import_users(
+    records: Iterator[Record],
+    batch_size: int,
+    workers: int,
+    checkpoint_path: Path,
+    stats: ImportStats,
+    rejects: Optional[TextIO] = None,
+) -> ImportStats:
+    """
+    사용자 가져오기 실행
+
+    배치마다 별도 트랜잭션으로 INSERT하고 커밋 후 체크포인트를 기록합니다.
+    커밋과 체크포인트 기록 사이에 중단되어도 재실행 시 해당 배치는 중복으로 건너뜁니다.
+
+    Args:
+        records: 체크포인트 이후의 입력 레코드
+        batch_size: 배치당 레코드 수 (다중 행 INSERT 한 번)
+        workers: 해싱 프로세스 수
+        checkpoint_path: 체크포인트 파일 경로
+        stats: 이전 실행까지의 진행 상황
+        rejects: 거절된 레코드를 NDJSON으로 기록할 스트림
+
+    Returns:
+        최종 ImportStats
+    """
+    session_factory = get_session_factory()
+    started = time.perf_counter() - stats.elapsed
+    session_started = time.perf_counter()
+    session_records = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        batches = _batches(records, batch_size)
+        first = next(batches, None)
+        pending = asyncio.create_task(prepare_batch(first, executor)) if first else None
+
+        while pending is not None:
+            batch = await pending
+            # 현재 배치를 INSERT하는 동안 다음 배치를 해싱
+            following = next(batches, None)
+            pending = (
+                asyncio.create_task(prepare_batch(following, executor))
+                if following
+                else None
+            )
+
+            async with session_factory() as session:
+                inserted = await user_crud.bulk_insert_users(session, batch.rows)
+                await session.commit()
+
+            batch_records = batch.last_record - stats.records
+            stats.records = batch.last_record
+            stats.inserted += inserted
+            stats.duplicates += len(batch.rows) - inserted
+            stats.invalid += len(batch.rejected)
+            stats.elapsed = time.perf_counter() - started
+            save_checkpoint(checkpoint_path, stats)
+            if rejects is not None:
+                for rejected in batch.rejected:
+                    rejects.write(json.dumps(rejected, ensure_ascii=False) + "\n")
+                rejects.flush()
+
+            session_records += batch_records
+            rate = session_records / (time.perf_counter() - session_started)
+            logger.info(
+                f"{stats.records}건 처리 (생성 {stats.inserted}, 중복 {stats.duplicates}, "
+                f"거절 {stats.invalid}) {rate:.0f} records/s"
+            )
+    return stats
+
+
+async def main(args: argparse.Namespace) -> None:
+    fmt = detect_format(args.input, args.format)
+    checkpoint_path = Path(
+        args.checkpoint
+        or (
+            f"{args.input}.checkpoint"
+            if args.input != "-"
+            else "import_users.checkpoint"
+        )
+    )
+    if args.restart and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    stats = load_checkpoint(checkpoint_path)
+    if stats.records:
+        logger.info(f"체크포인트에서 재개: {stats.records}건 건너뜀")
+
+    if settings.VAULT_ENABLED:
+        from app.core.vault import load_secrets_to_settings, vault_client
+
+        await load_secrets_to_settings()
+        await vault_client.aclose()
+    stream = (
+        sys.stdin
+        if args.input == "-"
+        else open(args.input, newline="", encoding="utf-8-sig")
+    )
+    rejects = open(args.rejects, "a", encoding="utf-8") if args.rejects else None
+    try:
+        records = islice(read_records(stream, fmt), stats.records, None)
+        stats = await import_users(
+            records,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            checkpoint_path=checkpoint_path,
+            stats=stats,
+            rejects=rejects,
+        )
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if rejects is not None:
+            rejects.close()
+        await close_db()
+
+    rate = stats.records / stats.elapsed if stats.elapsed else 0.0
+    print(
+        f"가져오기 완료: {stats.records}건 "
+        f"(생성 {stats.inserted}, 중복 {stats.duplicates}, 거절 {stats.invalid}), "
+        f"{stats.elapsed:.1f}초, 평균 {rate:.0f} records/s"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="입력 파일 경로 (- 이면 표준 입력)")
+    parser.add_argument(
+        "--format",
+        choices=("auto", "csv", "ndjson"),
+        default="auto",
+        help="입력 형식 (auto: 확장자로 판단)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="다중 행 INSERT당 레코드 수"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="비밀번호 해싱 프로세스 수",
+    )
+    parser.add_argument(
+        "--checkpoint", help="체크포인트 파일 경로 (기본값: <input>.checkpoint)"
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="체크포인트를 무시하고 처음부터 실행"
+    )
+    parser.add_argument("--rejects", help="거절된 레코드를 NDJSON으로 추가 기록할 파일")
+    asyncio.run(main(parser.parse_args()))
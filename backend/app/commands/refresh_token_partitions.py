@@ -0,0 +1,248 @@
+"""
+refresh_tokens 파티션 유지보수 명령
+미래 일 단위 파티션을 미리 생성하고, 완전히 만료된 파티션을 DROP
+
+만료 토큰 정리가 행 단위 DELETE가 아닌 파티션 DROP(메타데이터 작업)이 되므로
+InnoDB purge 지연이나 복제 부하가 생기지 않습니다. 마이그레이션 005 적용 후
+하루 한 번 이상(cron 등) 실행합니다.
+
+실행:
+    uv run python -m app.commands.refresh_token_partitions
+    uv run python -m app.commands.refresh_token_partitions --dry-run
+"""
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.database import (
+    close_db,
+    get_async_engine,
+    release_advisory_lock,
+    try_advisory_lock,
+)
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAME = "refresh_tokens"
+MAXVALUE_PARTITION = "pmax"
+
+# 여러 곳에서 동시에 실행되어 DDL이 충돌하지 않도록 하는 네임드 락 이름
+PARTITION_LOCK_NAME = "refresh_token_partitions"
+
+
+@dataclass(frozen=True)
+class Partition:
+    """RANGE 파티션 (upper_bound가 None이면 MAXVALUE)"""
+
+    name: str
+    upper_bound: Optional[date]
+
+
+@dataclass(frozen=True)
+class PartitionPlan:
+    """생성할 일 단위 파티션과 삭제할 파티션"""
+
+    create_days: list[date]
+    drop_names: list[str]
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.create_days and not self.drop_names
+
+
+def partition_name(day: date) -> str:
+    """day 하루치 행을 담는 파티션 이름"""
+    return f"p{day:%Y%m%d}"
+
+
+def parse_upper_bound(description: Optional[str]) -> Optional[date]:
+    """information_schema.PARTITIONS.PARTITION_DESCRIPTION 파싱"""
+    if description is None or description.upper() == "MAXVALUE":
+        return None
+    return datetime.fromisoformat(description.strip("'")).date()
+
+
+def plan_partitions(
+    partitions: list[Partition],
+    today: date,
+    precreate_days: int,
+    retention_days: int,
+) -> PartitionPlan:
+    """
+    파티션 유지보수 계획 수립
+
+    Args:
+        partitions: 현재 파티션 목록
+        today: 기준 날짜 (UTC)
+        precreate_days: 오늘 이후 미리 만들어 둘 일수
+        retention_days: 상한이 오늘 - retention_days 이하인 파티션을 삭제
+
+    Returns:
+        PartitionPlan
+    """
+    bounds = [p.upper_bound for p in partitions if p.upper_bound is not None]
+    next_day = max(bounds) if bounds else today
+    last_day = today + timedelta(days=precreate_days)
+    create_days = []
+    while next_day <= last_day:
+        create_days.append(next_day)
+        next_day += timedelta(days=1)
+
+    cutoff = today - timedelta(days=retention_days)
+    drop_names = [
+        p.name
+        for p in partitions
+        if p.upper_bound is not None and p.upper_bound <= cutoff
+    ]
+    return PartitionPlan(create_days=create_days, drop_names=drop_names)
+
+
+def render_statements(plan: PartitionPlan, has_maxvalue: bool) -> list[str]:
+    """계획을 ALTER TABLE 문으로 변환"""
+    statements = []
+    if plan.create_days:
+        definitions = [
+            f"PARTITION {partition_name(day)} VALUES LESS THAN "
+            f"('{(day + timedelta(days=1)).isoformat()}')"
+            for day in plan.create_days
+        ]
+        if has_maxvalue:
+            # pmax가 비어 있으면 데이터 이동 없이 메타데이터만 변경됨
+            definitions.append(
+                f"PARTITION {MAXVALUE_PARTITION} VALUES LESS THAN (MAXVALUE)"
+            )
+            statements.append(
+                f"ALTER TABLE {TABLE_NAME} REORGANIZE PARTITION {MAXVALUE_PARTITION} "
+                f"INTO ({', '.join(definitions)})"
+            )
+        else:
+            statements.append(
+                f"ALTER TABLE {TABLE_NAME} ADD PARTITION ({', '.join(definitions)})"
+            )
+    if plan.drop_names:
+        statements.append(
+            f"ALTER TABLE {TABLE_NAME} DROP PARTITION {', '.join(plan.drop_names)}"
+        )
+    return statements
+
+
+async def fetch_partitions(conn: AsyncConnection) -> list[Partition]:
+    """
+    현재 파티션 목록 조회
+
+    Raises:
+        RuntimeError: 테이블이 파티션되어 있지 않은 경우
+    """
+    result = await conn.execute(
+        text(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION "
+            "FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        ),
+        {"table": TABLE_NAME},
+    )
+    rows = result.all()
+    if not rows or rows[0][0] is None:
+        raise RuntimeError(
+            f"{TABLE_NAME} 테이블이 파티션되어 있지 않습니다 (마이그레이션 005 확인)"
+        )
+    return [Partition(name, parse_upper_bound(description)) for name, description in rows]
+
+
+async def maintain_partitions(
+    precreate_days: int,
+    retention_days: int,
+    dry_run: bool = False,
+) -> Optional[list[str]]:
+    """
+    파티션 유지보수 실행
+
+    Args:
+        precreate_days: 오늘 이후 미리 만들어 둘 일수
+        retention_days: 만료 후 파티션 보존 일수
+        dry_run: True면 실행하지 않고 SQL만 반환
+
+    Returns:
+        실행(또는 실행 예정)한 SQL 목록 (다른 곳에서 실행 중이면 None)
+    """
+    async with get_async_engine().connect() as conn:
+        if not await try_advisory_lock(conn, PARTITION_LOCK_NAME):
+            return None
+        try:
+            partitions = await fetch_partitions(conn)
+            plan = plan_partitions(
+                partitions,
+                today=datetime.utcnow().date(),
+                precreate_days=precreate_days,
+                retention_days=retention_days,
+            )
+            has_maxvalue = any(p.upper_bound is None for p in partitions)
+            statements = render_statements(plan, has_maxvalue)
+            if not dry_run:
+                for statement in statements:
+                    logger.info(statement)
+                    await conn.execute(text(statement))
+                await conn.commit()
+            return statements
+        finally:
+            await release_advisory_lock(conn, PARTITION_LOCK_NAME)
+
+
+async def main(args: argparse.Namespace) -> None:
+    if settings.VAULT_ENABLED:
+        from app.core.vault import load_secrets_to_settings, vault_client
+
+        await load_secrets_to_settings()
+        await vault_client.aclose()
+    if args.precreate_days < settings.REFRESH_TOKEN_EXPIRE_DAYS:
+        logger.warning(
+            "미리 생성하는 일수가 Refresh Token 수명보다 짧습니다. "
+            "새 토큰이 pmax 파티션에 저장되어 다음 실행 시 재배치됩니다."
+        )
+    try:
+        statements = await maintain_partitions(
+            args.precreate_days, args.retention_days, dry_run=args.dry_run
+        )
+    finally:
+        await close_db()
+
+    if statements is None:
+        print("다른 프로세스가 파티션 유지보수를 실행 중입니다")
+    elif not statements:
+        print("변경할 파티션이 없습니다")
+    else:
+        for statement in statements:
+            print(f"{'(dry-run) ' if args.dry_run else ''}{statement};")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--precreate-days",
+        type=int,
+        default=settings.REFRESH_TOKEN_PARTITION_PRECREATE_DAYS,
+        help="오늘 이후 미리 만들어 둘 일 단위 파티션 수",
+    )
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=settings.REFRESH_TOKEN_PARTITION_RETENTION_DAYS,
+        help="완전히 만료된 후 파티션을 보존할 일수",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="실행하지 않고 SQL만 출력"
+    )
+    asyncio.run(main(parser.parse_args()))
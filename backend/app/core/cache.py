@@ -0,0 +1,144 @@
+"""
+인메모리 캐시 모듈
+TTL + LRU 캐시와 동시 미스 병합 (single-flight)
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, Optional, TypeVar
+
+from app.core.metrics import counter, gauge
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    TTL + LRU 캐시
+
+    - 항목은 ttl초(또는 항목별 ttl) 후 만료되며,
+      maxsize 초과 시 가장 오래 사용되지 않은 항목 제거
+    - get_or_load: 같은 키에 대한 동시 미스를 하나의 로드로 병합
+    - invalidate: 진행 중인 로드 결과도 캐시에 저장되지 않도록 무효화
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[K, asyncio.Future[Optional[V]]] = {}
+        self._hits = counter(f"{name}_cache_hits_total", f"{name} 캐시 히트 수")
+        self._misses = counter(f"{name}_cache_misses_total", f"{name} 캐시 미스 수")
+        gauge(f"{name}_cache_size", f"{name} 캐시 항목 수").set_function(
+            lambda: len(self._data)
+        )
+
+    def get(self, key: K) -> Optional[V]:
+        """캐시 조회 (만료 항목은 제거, 히트/미스 집계 없음)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """캐시 저장 (ttl 지정 시 항목별 만료 시간 사용)"""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def record_hit(self) -> None:
+        """get_or_load를 거치지 않는 조회의 히트 집계"""
+        self._hits.inc()
+
+    def record_miss(self) -> None:
+        """get_or_load를 거치지 않는 조회의 미스 집계"""
+        self._misses.inc()
+
+    def invalidate(self, key: K) -> None:
+        """항목 무효화 (진행 중인 로드는 결과를 저장하지 않음)"""
+        self._data.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 무효화"""
+        self._data.clear()
+        self._inflight.clear()
+
+    async def get_or_load(
+        self,
+        key: K,
+        loader: Callable[[], Awaitable[Optional[V]]],
+    ) -> Optional[V]:
+        """
+        캐시 조회 후 미스 시 로드
+
+        같은 키로 동시에 미스가 발생하면 첫 요청만 loader를 실행하고
+        나머지는 그 결과를 기다립니다. None 결과는 캐시하지 않습니다.
+
+        Args:
+            key: 캐시 키
+            loader: 미스 시 값을 조회하는 코루틴 함수
+
+        Returns:
+            캐시된 값 또는 로드된 값
+        """
+        value = self.get(key)
+        if value is not None:
+            self._hits.inc()
+            return value
+
+        self._misses.inc()
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # 선행 로드만 취소된 경우 직접 로드 (자신이 취소된 경우는 전파)
+                if not pending.cancelled():
+                    raise
+                return await loader()
+
+        future: asyncio.Future[Optional[V]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # 대기자가 없어도 "exception was never retrieved" 경고가 나지 않도록 소비
+                future.exception()
+            raise
+
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+            if value is not None:
+                self.set(key, value)
+        future.set_result(value)
+        return value
+
+    def stats(self) -> dict[str, Any]:
+        """히트/미스 통계"""
+        hits = self._hits.value()
+        misses = self._misses.value()
+        total = hits + misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": int(hits),
+            "misses": int(misses),
+            "hit_rate": hits / total if total else 0.0,
+        }
@@ -4,7 +4,7 @@ Pydantic Settings를 사용하여 환경 변수 관리
 """
 
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -30,16 +30,112 @@ class Settings(BaseSettings):
     MYSQL_USER: str = "root"
     MYSQL_PASSWORD: str = ""
     MYSQL_DATABASE: str = "starterkit_db"
-
-    # Vault 설정
+    # 시작 시 SQLModel.metadata.create_all 실행 (개발용, 그 외에는 Alembic 마이그레이션)
+    DB_CREATE_SCHEMA: bool = False
+
+    # DB 연결 풀 설정
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = -1  # -1이면 수명 제한 없음
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_USE_LIFO: bool = False
+    # 시작 시 미리 열어 둘 풀 연결 수 (0이면 첫 요청에서 연결)
+    DB_POOL_WARM_SIZE: int = 2
+    # 관측한 연결 대기 시간으로 풀 크기 권장값을 주기적으로 로그 (설정은 바꾸지 않음)
+    DB_POOL_ADAPTIVE: bool = False
+    DB_POOL_ADAPTIVE_INTERVAL_SECONDS: int = 300
+    DB_POOL_WAIT_TARGET_MS: float = 5.0
+    # 읽기 세션 전용 autocommit 연결 풀 (get_current_user 등 읽기 경로, 복제본에도 같은 설정)
+    # 트랜잭션 없이 SQL 문만 보내므로 pre-ping도 기본으로 끄고 오류 시 재조회로 대응
+    DB_READ_POOL_SIZE: int = 5
+    DB_READ_MAX_OVERFLOW: int = 10
+    DB_READ_POOL_PRE_PING: bool = False
+
+    # 읽기 복제본 설정 (MYSQL_REPLICA_HOST를 지정하면 인증 조회 등 읽기 경로를 복제본으로 보냄,
+    # 사용자/비밀번호/DB 이름은 주 DB와 같음)
+    MYSQL_REPLICA_HOST: Optional[str] = None
+    MYSQL_REPLICA_PORT: int = 3306
+    # 복제본 상태 확인 주기와 허용 복제 지연 (0이면 지연 확인 안 함, REPLICATION CLIENT 권한 필요)
+    REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    REPLICA_MAX_LAG_SECONDS: float = 0.0
+    # 사용자 정보를 변경한 뒤 이 시간 동안 해당 사용자의 읽기는 주 DB에서 처리 (read-your-writes)
+    REPLICA_READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # Vault 설정 (VAULT_ENABLED=false면 환경 변수 설정만 사용)
+    VAULT_ENABLED: bool = True
     VAULT_ADDR: str = "http://vault:8200"
     VAULT_TOKEN: str = "dev-root-token"
+    VAULT_TIMEOUT_SECONDS: float = 5.0
+    # lease_duration이 없는 KV 시크릿의 캐시 수명
+    VAULT_SECRET_CACHE_TTL_SECONDS: int = 300
+    # 캐시 수명의 이 비율이 지나면 백그라운드에서 갱신 (만료 전까지 기존 값 사용)
+    VAULT_REFRESH_ENABLED: bool = True
+    VAULT_REFRESH_RATIO: float = 0.75
+    # Vault Database 시크릿 엔진의 동적 자격 증명 경로 (예: database/creds/app)
+    # 설정하면 lease 만료 전에 새 자격 증명으로 엔진을 교체하고 기존 풀을 정리
+    VAULT_DATABASE_CREDS_PATH: Optional[str] = None
+    DB_POOL_DRAIN_TIMEOUT_SECONDS: float = 30.0
 
     # JWT 설정 (Vault에서 로드되거나 환경 변수에서 설정)
     JWT_SECRET_KEY: Optional[str] = None
-    JWT_ALGORITHM: str = "HS256"
+    JWT_ALGORITHM: str = "HS256"  # HS256 또는 비대칭 서명 EdDSA/RS256
+    JWT_KEYS_VAULT_PATH: str = "jwt_keys"  # 비대칭 서명 키 링 Vault 경로
+    JWKS_CACHE_MAX_AGE_SECONDS: int = 300
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # 무상태 Access Token 모드 (사용자 스냅샷을 클레임에 담아 DB 조회 없이 인증)
+    ACCESS_TOKEN_STATELESS: bool = False
+    # 검증된 JWT 페이로드 캐시 (같은 Access Token의 반복 디코딩/서명 검증 생략)
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+
+    # Refresh Token 저장소 설정 (sql: refresh_tokens 테이블, redis: 키-값 + TTL,
+    # memory: 프로세스 내 대체 구현으로 단일 인스턴스 개발/벤치마크 전용)
+    TOKEN_STORE_BACKEND: Literal["sql", "redis", "memory"] = "sql"
+    # 새로 발급하는 Refresh Token 형식 (opaque: selector.verifier, 기존 JWT도 계속 허용)
+    REFRESH_TOKEN_FORMAT: Literal["jwt", "opaque"] = "jwt"
+    TOKEN_STORE_KEY_PREFIX: str = "rt:"
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # 만료/무효화된 Refresh Token 정리 작업 설정
+    REFRESH_TOKEN_GC_ENABLED: bool = True
+    REFRESH_TOKEN_GC_INTERVAL_SECONDS: float = 300.0
+    REFRESH_TOKEN_GC_RETENTION_HOURS: float = 24.0  # 만료/무효화 후 보존 기간
+    REFRESH_TOKEN_GC_BATCH_SIZE: int = 500
+    REFRESH_TOKEN_GC_BATCH_PAUSE_SECONDS: float = 0.1  # 배치 사이 대기 (부하 조절)
+
+    # refresh_tokens 일 단위 파티션 설정 (마이그레이션 005 적용 시)
+    REFRESH_TOKEN_PARTITIONED: bool = False
+    REFRESH_TOKEN_PARTITION_PRECREATE_DAYS: int = 14  # 미리 만들어 둘 미래 파티션 일수
+    REFRESH_TOKEN_PARTITION_RETENTION_DAYS: int = 1  # 만료 후 파티션 보존 일수
+
+    # 비밀번호 해싱 워커 풀 설정 (Argon2 연산을 이벤트 루프 밖에서 실행)
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+
+    # 비밀번호 해싱 승인 제어 (초과 요청은 503 + Retry-After로 즉시 거절)
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_MAX_QUEUE_WAIT_SECONDS: float = 2.0
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+
+    # 인증 사용자 캐시 설정 (get_current_user의 사용자 조회 결과 캐시)
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # 메트릭 설정 (라우트별 요청 처리 시간 수집)
+    METRICS_ENABLED: bool = True
+    # /metrics 엔드포인트 등록 여부 (내부 정보가 담기므로 기본값은 등록 안 함)
+    METRICS_ENDPOINT_ENABLED: bool = False
+    # /metrics 접근을 허용할 클라이언트 네트워크 (CIDR, 프록시 뒤에서는 프록시 주소 기준)
+    METRICS_ALLOWED_NETWORKS: list[str] = ["127.0.0.1/32", "::1/128"]
+    # 응답에 Server-Timing 헤더(DB 왕복 수, DB 시간, 영향받은 행 수) 추가
+    # 익명 클라이언트에도 내부 처리 시간이 노출되므로 부하 테스트/개발 환경에서만 켬
+    SERVER_TIMING_ENABLED: bool = False
+    # 요청당 DB 왕복(SQL 문 + COMMIT/ROLLBACK) 수가 이 값을 넘으면 경고 로그 (0이면 끔)
+    SQL_QUERY_BUDGET: int = 8
 
     # CORS 설정
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:3000"]
@@ -52,6 +148,16 @@ class Settings(BaseSettings):
             f"@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
         )
 
+    @property
+    def async_replica_database_url(self) -> Optional[str]:
+        """읽기 복제본 비동기 MySQL 연결 URL (복제본 미설정 시 None)"""
+        if not self.MYSQL_REPLICA_HOST:
+            return None
+        return (
+            f"mysql+asyncmy://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}"
+            f"@{self.MYSQL_REPLICA_HOST}:{self.MYSQL_REPLICA_PORT}/{self.MYSQL_DATABASE}"
+        )
+
     @property
     def sync_database_url(self) -> str:
         """동기 MySQL 연결 URL (Alembic 마이그레이션용)"""
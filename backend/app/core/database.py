@@ -1,37 +1,130 @@
 """
 데이터베이스 모듈
 SQLModel 기반 비동기 MySQL 연결 (asyncmy 드라이버)
+쓰기 세션은 주 DB, 읽기 세션은 읽기 복제본(설정 시)을 사용
+읽기 세션은 별도의 autocommit 연결 풀을 사용하여 BEGIN/COMMIT/ROLLBACK 왕복이 없음
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import URL, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
 from sqlmodel import SQLModel
 
 from app.core.config import settings
+from app.core.pool import (
+    InstrumentedPool,
+    instrument_pool,
+    instrumented_pool_class,
+    overflow_in_use,
+)
+from app.core.query_stats import instrument_queries
+from app.core.replica import read_routes_total, replica_state
 
 # 지연 초기화를 위한 전역 변수
 _async_engine: Optional[AsyncEngine] = None
 _async_session_factory: Optional[sessionmaker] = None
+_read_engine: Optional[AsyncEngine] = None
+_replica_engine: Optional[AsyncEngine] = None
+_read_session_factory: Optional[sessionmaker] = None
+
+# 읽기 세션을 주 DB로 고정하는 session.info 키
+USE_PRIMARY = "use_primary"
+
+
+def create_engine(
+    url: str | URL, read_only: bool = False, pool_name: Optional[str] = None
+) -> AsyncEngine:
+    """
+    애플리케이션 설정으로 비동기 엔진 생성 (풀 계측, 요청별 SQL 통계 포함)
+
+    Args:
+        url: 데이터베이스 URL
+        read_only: 읽기 세션용 엔진 여부. 연결을 AUTOCOMMIT으로 열어 SQL 문마다
+            자체 일관된 스냅샷으로 실행하고, BEGIN/COMMIT과 반납 시 ROLLBACK을 보내지 않음
+            (DB_READ_POOL_* 설정 사용, pre-ping 기본 끔)
+        pool_name: 풀 메트릭의 engine 라벨 (기본값: read_only면 "read", 아니면 "primary",
+            읽기 복제본은 "replica")
+    """
+    if pool_name is None:
+        pool_name = "read" if read_only else "primary"
+    if read_only:
+        options: dict[str, Any] = {
+            "isolation_level": "AUTOCOMMIT",
+            "skip_autocommit_rollback": True,
+            "pool_pre_ping": settings.DB_READ_POOL_PRE_PING,
+            "pool_size": settings.DB_READ_POOL_SIZE,
+            "max_overflow": settings.DB_READ_MAX_OVERFLOW,
+        }
+    else:
+        options = {
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+        }
+    engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=instrumented_pool_class(pool_name),
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        **options,
+    )
+    instrument_pool(engine.pool, pool_name)
+    instrument_queries(engine)
+    return engine
 
 
 def get_async_engine() -> AsyncEngine:
     """비동기 엔진 반환 (지연 초기화)"""
     global _async_engine
     if _async_engine is None:
-        _async_engine = create_async_engine(
-            settings.async_database_url,
-            echo=settings.DEBUG,
-            future=True,
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-        )
+        _async_engine = create_engine(settings.async_database_url)
     return _async_engine
 
 
+def get_read_engine() -> AsyncEngine:
+    """주 DB 읽기 전용(autocommit) 엔진 반환 (지연 초기화)"""
+    global _read_engine
+    if _read_engine is None:
+        _read_engine = create_engine(settings.async_database_url, read_only=True)
+    return _read_engine
+
+
+def get_replica_engine() -> Optional[AsyncEngine]:
+    """읽기 복제본 엔진 반환 (MYSQL_REPLICA_HOST 미설정 시 None, 지연 초기화)"""
+    global _replica_engine
+    if _replica_engine is None:
+        url = settings.async_replica_database_url
+        if url is not None:
+            _replica_engine = create_engine(url, read_only=True, pool_name="replica")
+    return _replica_engine
+
+
+def _current_overflow(engine: Optional[AsyncEngine]) -> float:
+    """현재 엔진의 오버플로 연결 수 (db_pool_overflow 게이지)"""
+    if engine is None or not isinstance(engine.pool, InstrumentedPool):
+        return 0.0
+    return float(max(0, engine.pool.overflow()))
+
+
+overflow_in_use.set_function(lambda: _current_overflow(_async_engine), engine="primary")
+overflow_in_use.set_function(lambda: _current_overflow(_read_engine), engine="read")
+overflow_in_use.set_function(
+    lambda: _current_overflow(_replica_engine), engine="replica"
+)
+
+
 def get_session_factory() -> sessionmaker:
     """세션 팩토리 반환 (지연 초기화)"""
     global _async_session_factory
@@ -46,6 +139,142 @@ def get_session_factory() -> sessionmaker:
     return _async_session_factory
 
 
+class RoutingSession(Session):
+    """
+    읽기 세션 라우팅 (읽기 세션 AsyncSession의 sync_session_class)
+
+    SQL을 실행할 때마다 대상 엔진을 고릅니다.
+    - 복제본이 정상이면 읽기 복제본
+    - 복제본이 없거나 비정상이면, 또는 use_primary()로 고정한 세션이면 주 DB 읽기 엔진
+    두 엔진 모두 autocommit 연결이라 세션을 닫을 때 COMMIT/ROLLBACK 왕복이 없습니다.
+    엔진 교체(replace_read_engine 등)도 다음 실행부터 바로 반영됩니다.
+    """
+
+    def get_bind(self, *args: Any, **kwargs: Any) -> Any:
+        if (
+            _replica_engine is not None
+            and replica_state.healthy
+            and not self.info.get(USE_PRIMARY)
+        ):
+            read_routes_total.inc(target="replica")
+            return _replica_engine.sync_engine
+        read_routes_total.inc(target="primary")
+        return get_read_engine().sync_engine
+
+
+def get_read_session_factory() -> sessionmaker:
+    """읽기 세션 팩토리 반환 (지연 초기화)"""
+    global _read_session_factory
+    if _read_session_factory is None:
+        get_replica_engine()
+        _read_session_factory = sessionmaker(
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+    return _read_session_factory
+
+
+def use_primary(session: AsyncSession) -> None:
+    """
+    읽기 세션을 주 DB로 고정 (read-your-writes, 복제본 오류 후 재시도)
+
+    이미 연결을 연 세션이면 트랜잭션을 끝낸 뒤(rollback/close) 다음 실행부터 적용됩니다.
+    """
+    session.info[USE_PRIMARY] = True
+
+
+def is_routed_to_replica(session: AsyncSession) -> bool:
+    """읽기 세션의 다음 SQL이 복제본으로 가는지 확인"""
+    return (
+        _replica_engine is not None
+        and replica_state.healthy
+        and not session.info.get(USE_PRIMARY)
+    )
+
+
+def replace_engine(engine: AsyncEngine) -> Optional[AsyncEngine]:
+    """
+    전역 엔진 교체
+
+    이후 생성되는 세션과 연결부터 새 엔진을 사용합니다.
+    이미 열린 세션은 기존 엔진의 연결로 끝까지 처리됩니다.
+
+    Args:
+        engine: 새 엔진
+
+    Returns:
+        기존 엔진 (없으면 None, 호출자가 drain_engine으로 정리)
+    """
+    global _async_engine
+    previous, _async_engine = _async_engine, engine
+    if _async_session_factory is not None:
+        _async_session_factory.configure(bind=engine)
+    return previous
+
+
+def replace_read_engine(engine: AsyncEngine) -> Optional[AsyncEngine]:
+    """
+    주 DB 읽기 엔진 교체 (동적 DB 자격 증명 교체 시)
+
+    Args:
+        engine: 새 읽기 엔진 (create_engine(url, read_only=True))
+
+    Returns:
+        기존 읽기 엔진 (없으면 None, 호출자가 drain_engine으로 정리)
+    """
+    global _read_engine
+    previous, _read_engine = _read_engine, engine
+    return previous
+
+
+def replace_replica_engine(engine: AsyncEngine) -> Optional[AsyncEngine]:
+    """
+    읽기 복제본 엔진 교체 (동적 DB 자격 증명 교체 시)
+
+    Args:
+        engine: 새 복제본 엔진
+
+    Returns:
+        기존 복제본 엔진 (없으면 None, 호출자가 drain_engine으로 정리)
+    """
+    global _replica_engine
+    previous, _replica_engine = _replica_engine, engine
+    return previous
+
+
+def checked_out_connections(engine: AsyncEngine) -> int:
+    """사용 중인 풀 연결 수 (QueuePool 외 풀은 0)"""
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout is not None else 0
+
+
+async def drain_engine(
+    engine: AsyncEngine,
+    timeout: float,
+    poll_interval: float = 0.1,
+) -> bool:
+    """
+    사용 중인 연결이 모두 반납될 때까지 기다린 후 엔진 종료
+
+    Args:
+        engine: 교체된 엔진
+        timeout: 최대 대기 시간(초), 지나면 반납되지 않은 연결이 있어도 종료
+        poll_interval: 확인 간격(초)
+
+    Returns:
+        제한 시간 안에 모두 반납되었는지 여부
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while checked_out_connections(engine) and loop.time() < deadline:
+        await asyncio.sleep(poll_interval)
+    drained = checked_out_connections(engine) == 0
+    await engine.dispose()
+    return drained
+
+
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     비동기 세션 의존성
@@ -66,9 +295,98 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 세션 의존성 (읽기 복제본 우선, 복제본이 없거나 비정상이면 주 DB)
+
+    autocommit 연결을 사용하므로 명시적 트랜잭션과 커밋이 없고, SQL 문마다 그 시점의
+    일관된 스냅샷을 읽습니다 (여러 SQL 문 사이의 일관성은 보장하지 않음).
+    쓰기에는 사용하지 않습니다. 방금 변경한 데이터를 읽어야 하면 use_primary()로
+    주 DB에 고정합니다.
+
+    사용법:
+        async def endpoint(session: AsyncSession = Depends(get_read_session)):
+            ...
+    """
+    factory = get_read_session_factory()
+    async with factory() as session:
+        yield session
+
+
+async def try_advisory_lock(conn: AsyncConnection, name: str) -> bool:
+    """
+    네임드 락 획득 시도 (대기 없음)
+
+    MySQL GET_LOCK은 연결 단위 락이므로 작업이 끝날 때까지 같은 연결을 유지해야 합니다.
+    MySQL 외 DB(개발용 SQLite 등)는 단일 인스턴스로 간주하여 항상 성공합니다.
+
+    Args:
+        conn: 락을 보유할 연결
+        name: 락 이름
+
+    Returns:
+        획득 여부
+    """
+    if conn.dialect.name != "mysql":
+        return True
+    result = await conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": name})
+    acquired = result.scalar() == 1
+    await conn.commit()
+    return acquired
+
+
+async def release_advisory_lock(conn: AsyncConnection, name: str) -> None:
+    """네임드 락 해제"""
+    if conn.dialect.name != "mysql":
+        return
+    await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+    await conn.commit()
+
+
+async def warm_pool(size: int) -> int:
+    """
+    풀에 연결을 미리 생성 (첫 요청의 연결 수립 지연 제거)
+
+    연결을 동시에 열어 모두 확인한 뒤 풀에 반납합니다.
+
+    Args:
+        size: 생성할 연결 수 (풀 크기를 넘으면 풀 크기까지만)
+
+    Returns:
+        생성된 연결 수
+
+    Raises:
+        Exception: 연결을 하나도 열지 못한 경우 첫 번째 오류
+    """
+    engine = get_async_engine()
+    pool_size = getattr(engine.pool, "size", None)
+    if pool_size is not None:
+        size = min(size, pool_size())
+
+    async def connect() -> AsyncConnection:
+        conn = await engine.connect()
+        try:
+            await conn.execute(text("SELECT 1"))
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    results = await asyncio.gather(
+        *(connect() for _ in range(size)), return_exceptions=True
+    )
+    connections = [result for result in results if isinstance(result, AsyncConnection)]
+    for conn in connections:
+        await conn.close()
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors and not connections:
+        raise errors[0]
+    return len(connections)
+
+
 async def init_db() -> None:
     """
-    데이터베이스 테이블 생성 (개발 환경 전용)
+    데이터베이스 테이블 생성 (개발 환경 전용, DB_CREATE_SCHEMA=true일 때 시작 시 실행)
     프로덕션에서는 Alembic 마이그레이션 사용
     """
     engine = get_async_engine()
@@ -77,9 +395,17 @@ async def init_db() -> None:
 
 
 async def close_db() -> None:
-    """데이터베이스 연결 종료"""
-    global _async_engine, _async_session_factory
+    """데이터베이스 연결 종료 (읽기 엔진, 읽기 복제본 포함)"""
+    global _async_engine, _async_session_factory, _read_engine
+    global _replica_engine, _read_session_factory
     if _async_engine is not None:
         await _async_engine.dispose()
         _async_engine = None
         _async_session_factory = None
+    if _read_engine is not None:
+        await _read_engine.dispose()
+        _read_engine = None
+    if _replica_engine is not None:
+        await _replica_engine.dispose()
+        _replica_engine = None
+        _read_session_factory = None
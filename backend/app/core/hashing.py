@@ -0,0 +1,172 @@
+"""
+비밀번호 해싱 워커 풀 모듈
+Argon2 해싱/검증을 이벤트 루프 밖의 스레드 또는 프로세스 풀에서 실행하고
+동시 실행 수와 대기열 길이를 제한하여 과부하 시 빠르게 거절
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import counter, gauge
+
+T = TypeVar("T")
+
+# 지연 초기화를 위한 전역 변수
+_hash_executor: Optional[Executor] = None
+
+
+def get_hash_executor() -> Executor:
+    """
+    해싱 전용 Executor 반환 (지연 초기화)
+
+    PASSWORD_HASH_EXECUTOR 설정에 따라 스레드 풀 또는 프로세스 풀을 생성합니다.
+    argon2-cffi는 해싱 중 GIL을 해제하므로 일반적으로 스레드 풀로 충분합니다.
+    """
+    global _hash_executor
+    if _hash_executor is None:
+        workers = settings.PASSWORD_HASH_WORKERS
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="password-hash",
+            )
+    return _hash_executor
+
+
+class HashingOverloadedError(Exception):
+    """해싱 대기열이 가득 찼거나 대기 시간을 초과한 경우"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"비밀번호 해싱 과부하: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class HashingScheduler:
+    """
+    비밀번호 해싱 승인 제어 스케줄러
+
+    - 동시 실행 수 상한 (max_concurrency)
+    - 대기열 길이 상한 (max_queue): 초과 시 즉시 거절
+    - 최대 대기 시간 (max_queue_wait): 초과 시 거절
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        max_queue_wait: float,
+        retry_after: int,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._waiting = 0
+        self._running = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """슬롯을 기다리는 요청 수"""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """실행 중인 해싱 작업 수"""
+        return self._running
+
+    async def _acquire(self) -> None:
+        """실행 슬롯 획득 (대기열/대기 시간 제한 적용)"""
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return
+
+        if self._waiting >= self.max_queue:
+            hash_rejections_total.inc(reason="queue_full")
+            raise HashingOverloadedError("queue_full", self.retry_after)
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.max_queue_wait)
+        except TimeoutError:
+            hash_rejections_total.inc(reason="queue_timeout")
+            raise HashingOverloadedError("queue_timeout", self.retry_after) from None
+        finally:
+            self._waiting -= 1
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        승인 제어를 거쳐 해싱 함수를 워커 풀에서 실행
+
+        Raises:
+            HashingOverloadedError: 대기열 초과 또는 대기 시간 초과
+        """
+        await self._acquire()
+        self._running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(get_hash_executor(), func, *args)
+        finally:
+            self._running -= 1
+            self._semaphore.release()
+            hash_operations_total.inc()
+
+
+# 해싱 메트릭
+hash_operations_total = counter(
+    "password_hash_operations_total",
+    "완료된 비밀번호 해싱/검증 작업 수",
+)
+hash_rejections_total = counter(
+    "password_hash_rejections_total",
+    "과부하로 거절된 비밀번호 해싱 요청 수",
+    ("reason",),
+)
+
+# 전역 해싱 스케줄러 인스턴스
+hashing_scheduler = HashingScheduler(
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    max_queue_wait=settings.PASSWORD_HASH_MAX_QUEUE_WAIT_SECONDS,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
+
+gauge(
+    "password_hash_queue_depth",
+    "해싱 슬롯을 기다리는 요청 수",
+).set_function(lambda: hashing_scheduler.queue_depth)
+gauge(
+    "password_hash_in_flight",
+    "실행 중인 비밀번호 해싱 작업 수",
+).set_function(lambda: hashing_scheduler.in_flight)
+
+
+async def run_in_hash_pool(func: Callable[..., T], *args: Any) -> T:
+    """
+    해싱 함수를 승인 제어를 거쳐 워커 풀에서 실행
+
+    Args:
+        func: 실행할 함수 (프로세스 풀 사용 시 pickle 가능한 모듈 함수여야 함)
+        *args: 함수 인자
+
+    Returns:
+        함수 실행 결과
+
+    Raises:
+        HashingOverloadedError: 해싱 과부하
+    """
+    return await hashing_scheduler.run(func, *args)
+
+
+def shutdown_hash_executor() -> None:
+    """해싱 워커 풀 종료"""
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=True, cancel_futures=True)
+        _hash_executor = None
@@ -0,0 +1,127 @@
+"""
+키-값 저장소 클라이언트 모듈
+Redis 프로토콜 명령 일부를 사용하는 클라이언트 인터페이스와 프로세스 내 대체 구현
+"""
+
+import time
+from typing import Optional, Protocol
+
+# 클래스 본문의 set 메서드가 내장 set을 가리므로 집합 타입은 별칭으로 참조
+Members = set[str]
+
+
+class KeyValueClient(Protocol):
+    """
+    토큰 저장소가 사용하는 Redis 명령 부분집합
+
+    redis.asyncio.Redis(decode_responses=True)와 InMemoryKeyValueClient가 구현합니다.
+    """
+
+    async def set(self, name: str, value: str, px: Optional[int] = None) -> bool: ...
+
+    async def get(self, name: str) -> Optional[str]: ...
+
+    async def getdel(self, name: str) -> Optional[str]: ...
+
+    async def delete(self, *names: str) -> int: ...
+
+    async def sadd(self, name: str, *values: str) -> int: ...
+
+    async def srem(self, name: str, *values: str) -> int: ...
+
+    async def smembers(self, name: str) -> Members: ...
+
+    async def pexpire(self, name: str, milliseconds: int) -> bool: ...
+
+    async def aclose(self) -> None: ...
+
+
+class InMemoryKeyValueClient:
+    """
+    프로세스 내 키-값 저장소 (Redis 대체 구현)
+
+    - 개발/벤치마크/검증용: 단일 프로세스에서만 공유되며 재시작 시 사라짐
+    - 만료는 조회 시점에 확인 (Redis의 지연 만료와 동일한 관찰 결과)
+    - 각 명령은 await 지점 없이 실행되므로 이벤트 루프 안에서 원자적
+    """
+
+    def __init__(self):
+        self._values: dict[str, str | Members] = {}
+        self._expires: dict[str, float] = {}
+
+    def _alive(self, name: str) -> bool:
+        expires_at = self._expires.get(name)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._values.pop(name, None)
+            del self._expires[name]
+        return name in self._values
+
+    def _set_of(self, name: str) -> Members:
+        if not self._alive(name):
+            return set()
+        value = self._values[name]
+        if not isinstance(value, set):
+            raise TypeError(f"집합이 아닌 키입니다: {name}")
+        return value
+
+    async def set(self, name: str, value: str, px: Optional[int] = None) -> bool:
+        self._values[name] = value
+        if px is None:
+            self._expires.pop(name, None)
+        else:
+            self._expires[name] = time.monotonic() + px / 1000
+        return True
+
+    async def get(self, name: str) -> Optional[str]:
+        if not self._alive(name):
+            return None
+        value = self._values[name]
+        if isinstance(value, set):
+            raise TypeError(f"문자열이 아닌 키입니다: {name}")
+        return value
+
+    async def getdel(self, name: str) -> Optional[str]:
+        value = await self.get(name)
+        if value is not None:
+            del self._values[name]
+            self._expires.pop(name, None)
+        return value
+
+    async def delete(self, *names: str) -> int:
+        deleted = 0
+        for name in names:
+            if self._alive(name):
+                del self._values[name]
+                self._expires.pop(name, None)
+                deleted += 1
+        return deleted
+
+    async def sadd(self, name: str, *values: str) -> int:
+        members = self._set_of(name)
+        if name not in self._values:
+            self._values[name] = members
+        added = len(set(values) - members)
+        members.update(values)
+        return added
+
+    async def srem(self, name: str, *values: str) -> int:
+        members = self._set_of(name)
+        removed = len(members & set(values))
+        members.difference_update(values)
+        if name in self._values and not members:
+            await self.delete(name)
+        return removed
+
+    async def smembers(self, name: str) -> Members:
+        return set(self._set_of(name))
+
+    async def pexpire(self, name: str, milliseconds: int) -> bool:
+        if not self._alive(name):
+            return False
+        self._expires[name] = time.monotonic() + milliseconds / 1000
+        return True
+
+    async def aclose(self) -> None:
+        self._values.clear()
+        self._expires.clear()
+
@@ -0,0 +1,384 @@
+"""
+메트릭 모듈
+외부 의존성 없는 경량 카운터/게이지/히스토그램과 Prometheus 텍스트 포맷 출력
+"""
+
+import bisect
+import functools
+import inspect
+import math
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, Optional, TypeVar
+
+LabelValues = tuple[str, ...]
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T", bound=type)
+
+# 지연 시간(초) 기본 버킷 (Prometheus 클라이언트 기본값)
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0
+)
+# 내부 작업 시간(초) 버킷 (JWT 서명/검증 수십 µs부터 Argon2 수백 ms까지)
+OPERATION_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+    0.5, 1.0, 2.5, 5.0,
+)
+
+
+def _escape_label_value(value: str) -> str:
+    """라벨 값의 역슬래시, 큰따옴표, 줄바꿈을 Prometheus 텍스트 포맷 규칙대로 이스케이프"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: tuple[str, ...], values: LabelValues) -> str:
+    """라벨을 Prometheus 포맷 문자열로 변환"""
+    if not labelnames:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(labelnames, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """메트릭 공통 기반 클래스"""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+        if not labelnames:
+            # 라벨 없는 메트릭은 증가 전에도 0으로 노출
+            self._values[()] = 0.0
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def value(self, **labels: str) -> float:
+        """현재 값 조회"""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[str, LabelValues, float]]:
+        """(접미사, 라벨 값, 값) 샘플 목록"""
+        return [("", key, value) for key, value in self._values.items()]
+
+    def render(self) -> list[str]:
+        """Prometheus 텍스트 포맷 라인 목록"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for suffix, key, value in self.samples():
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}{suffix}{labels} {value}")
+        return lines
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """카운터 증가"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """증감 가능한 게이지 (콜백으로 수집 시점에 값을 읽을 수도 있음)"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._functions: dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """게이지 값 설정"""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """게이지 증가"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """게이지 감소"""
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """수집 시점에 호출할 값 함수 등록 (라벨 게이지는 라벨 값 조합마다 등록)"""
+        self._functions[self._key(labels)] = function
+
+    def value(self, **labels: str) -> float:
+        function = self._functions.get(self._key(labels))
+        if function is not None:
+            return float(function())
+        return super().value(**labels)
+
+    def samples(self) -> list[tuple[str, LabelValues, float]]:
+        values = dict(self._values)
+        for key, function in self._functions.items():
+            values[key] = float(function())
+        return [("", key, value) for key, value in values.items()]
+
+
+class Histogram(_Metric):
+    """
+    누적 버킷 히스토그램
+
+    관측값은 le 상한 버킷별 개수와 합계, 전체 개수로 노출합니다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 -> (버킷별 개수(+Inf 포함, 비누적), 합계)
+        self._series: dict[LabelValues, tuple[list[int], float]] = {}
+        self._values.clear()
+
+    def observe(self, value: float, **labels: str) -> None:
+        """관측값 기록"""
+        self.observe_key(self._key(labels), value)
+
+    def observe_key(self, key: LabelValues, value: float) -> None:
+        """
+        라벨 값 튜플로 관측값 기록 (요청마다 호출되는 경로에서 라벨 딕셔너리 변환 생략)
+
+        Args:
+            key: labelnames 순서의 라벨 값 튜플
+            value: 관측값
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                counts, total = [0] * (len(self.buckets) + 1), 0.0
+            else:
+                counts, total = series
+            counts[index] += 1
+            self._series[key] = (counts, total + value)
+
+    def snapshot(self, **labels: str) -> tuple[list[int], float]:
+        """(누적 버킷 개수(+Inf 포함), 합계) 조회"""
+        with self._lock:
+            counts, total = self._series.get(self._key(labels)) or (
+                [0] * (len(self.buckets) + 1),
+                0.0,
+            )
+            cumulative, running = [], 0
+            for count in counts:
+                running += count
+                cumulative.append(running)
+        return cumulative, total
+
+    def value(self, **labels: str) -> float:
+        """관측 개수 조회"""
+        return float(self.snapshot(**labels)[0][-1])
+
+    def samples(self) -> list[tuple[str, LabelValues, float]]:
+        samples: list[tuple[str, LabelValues, float]] = []
+        for key in list(self._series):
+            cumulative, total = self.snapshot(**dict(zip(self.labelnames, key)))
+            samples.append(("_sum", key, total))
+            samples.append(("_count", key, float(cumulative[-1])))
+        return samples
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        bounds = [*(format(bound, "g") for bound in self.buckets), "+Inf"]
+        for key in list(self._series):
+            cumulative, total = self.snapshot(**dict(zip(self.labelnames, key)))
+            for bound, count in zip(bounds, cumulative):
+                labels = _format_labels(
+                    (*self.labelnames, "le"), (*key, bound)
+                )
+                lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {cumulative[-1]}")
+        return lines
+
+
+def estimate_quantile(
+    buckets: Sequence[float], cumulative: Sequence[int], q: float
+) -> float:
+    """
+    누적 버킷 개수로 분위수 추정 (버킷 안에서 선형 보간, histogram_quantile과 동일)
+
+    Args:
+        buckets: 버킷 상한 목록 (+Inf 제외)
+        cumulative: 누적 개수 목록 (+Inf 포함)
+        q: 분위 (0~1)
+
+    Returns:
+        추정값 (관측이 없으면 0.0, +Inf 버킷이면 마지막 상한)
+    """
+    total = cumulative[-1] if cumulative else 0
+    if total == 0:
+        return 0.0
+    rank = q * total
+    index = bisect.bisect_left(cumulative, rank)
+    if index >= len(buckets):
+        return buckets[-1] if buckets else math.inf
+    lower = buckets[index - 1] if index > 0 else 0.0
+    below = cumulative[index - 1] if index > 0 else 0
+    in_bucket = cumulative[index] - below
+    if in_bucket == 0:
+        return buckets[index]
+    return lower + (buckets[index] - lower) * (rank - below) / in_bucket
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리"""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """메트릭 등록 (같은 이름이 이미 있으면 기존 메트릭 반환)"""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """이름으로 메트릭 조회"""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """전체 메트릭을 Prometheus 텍스트 포맷으로 출력"""
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 메트릭 레지스트리
+registry = MetricsRegistry()
+
+
+def counter(name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+    """카운터 생성 및 전역 레지스트리 등록"""
+    return registry.register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+
+def gauge(name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+    """게이지 생성 및 전역 레지스트리 등록"""
+    return registry.register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: tuple[str, ...] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    """히스토그램 생성 및 전역 레지스트리 등록"""
+    return registry.register(  # type: ignore[return-value]
+        Histogram(name, documentation, labelnames, buckets)
+    )
+
+
+operation_duration_seconds = histogram(
+    "app_operation_duration_seconds",
+    "이름 붙은 내부 작업(비밀번호 해싱, JWT, 사용자 CRUD) 실행 시간",
+    ("operation",),
+    buckets=OPERATION_BUCKETS,
+)
+
+
+def timed(operation: str) -> Callable[[F], F]:
+    """
+    함수 실행 시간을 app_operation_duration_seconds{operation=...}에 기록하는 데코레이터
+
+    동기/코루틴 함수 모두 지원하며 예외가 발생해도 기록합니다.
+    호출마다 perf_counter 두 번과 히스토그램 갱신 한 번만 추가됩니다.
+    프로세스 풀에서 실행된 함수의 기록은 워커 프로세스에 남으므로 노출되지 않습니다.
+
+    Args:
+        operation: 작업 이름 (라벨 값)
+    """
+    key = (operation,)
+    observe = operation_duration_seconds.observe_key
+    perf_counter = time.perf_counter
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                started = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    observe(key, perf_counter() - started)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(key, perf_counter() - started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def timed_methods(prefix: str) -> Callable[[T], T]:
+    """
+    클래스의 공개 코루틴 메서드를 모두 timed("{prefix}.{메서드 이름}")로 감싸는 클래스 데코레이터
+
+    비동기 제너레이터(스트리밍)와 _로 시작하는 메서드는 감싸지 않습니다.
+
+    Args:
+        prefix: 작업 이름 접두사
+    """
+
+    def decorator(cls: T) -> T:
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.iscoroutinefunction(member):
+                continue
+            setattr(cls, name, timed(f"{prefix}.{name}")(member))
+        return cls
+
+    return decorator
@@ -0,0 +1,127 @@
+"""
+HTTP 요청 메트릭 미들웨어
+순수 ASGI 미들웨어로 라우트 템플릿별 요청 처리 시간 히스토그램과 처리 중 요청 수,
+요청별 SQL 실행 통계(Server-Timing 헤더, 쿼리 수 예산)를 수집
+"""
+
+import logging
+import time
+from typing import Any
+
+from app.core.config import settings
+from app.core.metrics import counter, gauge, histogram
+from app.core.query_stats import start_query_stats, stop_query_stats
+
+logger = logging.getLogger(__name__)
+
+# 라벨 카디널리티 제한: 알 수 없는 메서드는 하나로 묶음
+KNOWN_METHODS = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+)
+# 라우트에 매칭되지 않은 요청(404 등)의 route 라벨 값
+UNMATCHED_ROUTE = "unmatched"
+
+http_request_duration_seconds = histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (라우트 템플릿별, 응답 본문 전송 완료까지)",
+    ("method", "route", "status"),
+)
+http_requests_in_progress = gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+)
+query_budget_exceeded_total = counter(
+    "sql_query_budget_exceeded_total",
+    "SQL_QUERY_BUDGET보다 DB 왕복(SQL 문 + COMMIT/ROLLBACK)이 많았던 요청 수",
+    ("route",),
+)
+
+
+class MetricsMiddleware:
+    """
+    요청 메트릭 ASGI 미들웨어
+
+    - route 라벨은 실제 경로가 아니라 라우트 템플릿(/api/v1/users/{user_id})을 사용
+      (라우터가 scope["route"]에 매칭된 라우트를 기록하므로 응답 후 읽음)
+    - 처리 중 예외가 발생하면 status="500"으로 기록하고 다시 발생
+    - BaseHTTPMiddleware를 쓰지 않아 응답 스트리밍과 태스크 생성 비용이 없음
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec()
+            method = scope["method"]
+            route = scope.get("route")
+            http_request_duration_seconds.observe_key(
+                (
+                    method if method in KNOWN_METHODS else "other",
+                    getattr(route, "path_format", None) or UNMATCHED_ROUTE,
+                    str(status_code),
+                ),
+                elapsed,
+            )
+
+
+class QueryStatsMiddleware:
+    """
+    요청별 SQL 통계 ASGI 미들웨어
+
+    - SERVER_TIMING_ENABLED: 응답 헤더에 Server-Timing(db, app) 추가
+      (응답 시작 시점까지의 통계이므로 응답 후 실행되는 세션 커밋은 헤더에 포함되지 않음)
+    - SQL_QUERY_BUDGET > 0: 응답 완료 후 DB 왕복 수가 예산을 넘으면 경고 로그와 카운터 증가
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+        started = time.perf_counter()
+
+        async def send_wrapper(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start" and settings.SERVER_TIMING_ENABLED:
+                app_ms = (time.perf_counter() - started) * 1000
+                value = f"{stats.server_timing()}, app;dur={app_ms:.2f}"
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", value.encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop_query_stats(token)
+            budget = settings.SQL_QUERY_BUDGET
+            if budget and stats.statements > budget:
+                route = getattr(scope.get("route"), "path_format", None) or UNMATCHED_ROUTE
+                query_budget_exceeded_total.inc(route=route)
+                logger.warning(
+                    f"DB 왕복 수 예산 초과: {scope['method']} {route} "
+                    f"{stats.statements}회 (예산 {budget}회), "
+                    f"DB {stats.db_ms:.1f}ms, 변경 {stats.affected_rows}행"
+                )
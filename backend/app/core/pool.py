@@ -0,0 +1,353 @@
+"""
+DB 연결 풀 계측 모듈
+SQLAlchemy 풀 이벤트로 사용 중 연결 수, 연결 획득 대기 시간, 오버플로, 무효화,
+연결 수명을 수집하고 관측값으로 풀 크기 권장값을 계산
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import counter, estimate_quantile, gauge, histogram
+
+# 연결 획득 대기 시간(초) 버킷 (대부분 즉시 획득되므로 1ms 미만부터 세분화)
+WAIT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    10.0, 30.0,
+)
+# 연결 수명(초) 버킷
+AGE_BUCKETS = (1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0, 28800.0)
+
+# 풀 이름 (engine 라벨): 주 DB 쓰기, 주 DB 읽기(autocommit), 읽기 복제본
+POOL_ENGINES = ("primary", "read", "replica")
+
+# 풀 메트릭 (engine 라벨별, 교체된 엔진의 풀을 포함한 프로세스 전체 합계)
+checkout_wait_seconds = histogram(
+    "db_pool_checkout_wait_seconds",
+    "풀에서 연결을 얻기까지 걸린 시간 (풀이 비어 새 연결을 여는 시간 포함)",
+    ("engine",),
+    buckets=WAIT_BUCKETS,
+)
+checkout_timeouts_total = counter(
+    "db_pool_checkout_timeouts_total",
+    "DB_POOL_TIMEOUT 안에 연결을 얻지 못한 횟수",
+    ("engine",),
+)
+checkouts_total = counter(
+    "db_pool_checkouts_total",
+    "풀에서 연결을 꺼낸 횟수",
+    ("engine",),
+)
+connections_created_total = counter(
+    "db_pool_connections_created_total",
+    "새로 연 DB 연결 수",
+    ("engine",),
+)
+invalidations_total = counter(
+    "db_pool_invalidations_total",
+    "무효화된 연결 수 (hard: 즉시 종료, soft: 반납 시 교체)",
+    ("engine", "kind"),
+)
+connection_age_seconds = histogram(
+    "db_pool_connection_age_seconds",
+    "종료된 연결의 수명",
+    ("engine",),
+    buckets=AGE_BUCKETS,
+)
+checked_out = gauge(
+    "db_pool_checked_out",
+    "사용 중인 연결 수",
+    ("engine",),
+)
+open_connections = gauge(
+    "db_pool_connections",
+    "열려 있는 연결 수 (사용 중 + 풀에서 대기)",
+    ("engine",),
+)
+overflow_in_use = gauge(
+    "db_pool_overflow",
+    "현재 엔진에서 pool_size를 넘어 열린 오버플로 연결 수",
+    ("engine",),
+)
+
+
+class PoolUsage:
+    """사용 중 연결 수와 구간 최대값 (풀 크기 권장값 계산용)"""
+
+    def __init__(self):
+        self.checked_out = 0
+        self.peak_checked_out = 0
+
+    def checkout(self) -> None:
+        self.checked_out += 1
+        self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def checkin(self) -> None:
+        self.checked_out -= 1
+
+    def reset_peak(self) -> int:
+        """구간 최대값을 반환하고 현재 값으로 초기화"""
+        peak, self.peak_checked_out = self.peak_checked_out, self.checked_out
+        return peak
+
+
+# 전역 풀별 사용량 인스턴스 (engine 라벨 -> 사용량)
+pool_usages = {engine: PoolUsage() for engine in POOL_ENGINES}
+for _engine, _usage in pool_usages.items():
+    checked_out.set_function(lambda usage=_usage: usage.checked_out, engine=_engine)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    연결 획득 대기 시간을 기록하는 비동기 QueuePool
+
+    SQLAlchemy 풀 이벤트에는 대기 시작 시점이 없으므로 _do_get(풀 큐 대기와
+    오버플로 연결 생성)만 감싸서 측정하고, 나머지는 풀 이벤트로 수집합니다.
+    engine 라벨은 instrumented_pool_class()로 만든 하위 클래스의 속성이라
+    engine.dispose()로 다시 만든 풀에도 유지됩니다.
+    """
+
+    engine_label = "primary"
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            checkout_timeouts_total.inc(engine=self.engine_label)
+            raise
+        finally:
+            checkout_wait_seconds.observe(
+                time.perf_counter() - started, engine=self.engine_label
+            )
+
+
+_pool_classes: dict[str, type[InstrumentedPool]] = {}
+
+
+def instrumented_pool_class(engine: str) -> type[InstrumentedPool]:
+    """engine 라벨별 InstrumentedPool 하위 클래스 (create_async_engine의 poolclass)"""
+    if engine not in _pool_classes:
+        _pool_classes[engine] = type(
+            f"InstrumentedPool_{engine}", (InstrumentedPool,), {"engine_label": engine}
+        )
+    return _pool_classes[engine]
+
+
+def instrument_pool(pool: Any, engine: str) -> None:
+    """
+    풀 인스턴스에 engine 라벨별 계측 이벤트 등록
+
+    비동기 풀 클래스에는 클래스 단위 리스너를 등록할 수 없어 엔진 생성 시 호출합니다.
+    engine.dispose()로 다시 만든 풀도 같은 리스너를 유지합니다.
+
+    Args:
+        pool: 엔진의 풀
+        engine: engine 라벨 (POOL_ENGINES)
+    """
+    usage = pool_usages[engine]
+
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        connection_record.info["connected_at"] = time.monotonic()
+        connections_created_total.inc(engine=engine)
+        open_connections.inc(engine=engine)
+
+    def on_close(dbapi_connection: Any, connection_record: Any) -> None:
+        open_connections.dec(engine=engine)
+        connected_at = connection_record.info.get("connected_at")
+        if connected_at is not None:
+            connection_age_seconds.observe(
+                time.monotonic() - connected_at, engine=engine
+            )
+
+    def on_checkout(
+        dbapi_connection: Any, connection_record: Any, connection_proxy: Any
+    ) -> None:
+        checkouts_total.inc(engine=engine)
+        usage.checkout()
+
+    def on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        usage.checkin()
+
+    def on_invalidate(
+        dbapi_connection: Any,
+        connection_record: Any,
+        exception: Optional[BaseException],
+    ) -> None:
+        invalidations_total.inc(engine=engine, kind="hard")
+
+    def on_soft_invalidate(
+        dbapi_connection: Any,
+        connection_record: Any,
+        exception: Optional[BaseException],
+    ) -> None:
+        invalidations_total.inc(engine=engine, kind="soft")
+
+    event.listen(pool, "connect", on_connect)
+    event.listen(pool, "close", on_close)
+    event.listen(pool, "checkout", on_checkout)
+    event.listen(pool, "checkin", on_checkin)
+    event.listen(pool, "invalidate", on_invalidate)
+    event.listen(pool, "soft_invalidate", on_soft_invalidate)
+
+
+@dataclass
+class WaitWindow:
+    """구간 동안의 연결 획득 통계"""
+
+    checkouts: int
+    timeouts: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_checked_out: int
+
+
+class WaitWindowTracker:
+    """풀(engine 라벨)별 히스토그램 스냅샷 차이로 구간별 대기 시간 통계 계산"""
+
+    def __init__(self, engine: str):
+        self.engine = engine
+        self._counts, _ = checkout_wait_seconds.snapshot(engine=engine)
+        self._timeouts = checkout_timeouts_total.value(engine=engine)
+
+    def next(self) -> WaitWindow:
+        """이전 호출 이후 구간 통계 반환 후 새 구간 시작"""
+        counts, _ = checkout_wait_seconds.snapshot(engine=self.engine)
+        timeouts = checkout_timeouts_total.value(engine=self.engine)
+        delta = [now - before for now, before in zip(counts, self._counts)]
+        window = WaitWindow(
+            checkouts=delta[-1],
+            timeouts=int(timeouts - self._timeouts),
+            peak_checked_out=pool_usages[self.engine].reset_peak(),
+            **quantiles_ms(delta),
+        )
+        self._counts, self._timeouts = counts, timeouts
+        return window
+
+
+def quantiles_ms(cumulative: list[int]) -> dict[str, float]:
+    """누적 대기 시간 버킷으로 p50/p95/p99(ms) 추정"""
+    return {
+        f"p{int(q * 100)}_ms": estimate_quantile(WAIT_BUCKETS, cumulative, q) * 1000
+        for q in (0.5, 0.95, 0.99)
+    }
+
+
+@dataclass
+class PoolRecommendation:
+    """풀 크기 권장값"""
+
+    action: str  # increase, decrease, keep
+    pool_size: int
+    max_overflow: int
+    reason: str
+
+
+def recommend_pool_size(
+    window: WaitWindow,
+    pool_size: int,
+    max_overflow: int,
+    wait_target_ms: float,
+) -> PoolRecommendation:
+    """
+    관측 구간 통계로 풀 크기 권장값 계산
+
+    - 대기 p95가 목표를 넘거나 타임아웃이 있으면 증가
+      (한도까지 사용했으면 한도를, pool_size를 넘었으면 오버플로 연결 생성 대기이므로
+      pool_size를 최대 사용량까지 올려 연결을 유지)
+    - 대기 없이 최대 사용량이 pool_size의 절반 미만이면 감소
+    - 권장값은 최대 사용량에 25% 여유를 더한 값
+
+    Args:
+        window: 관측 구간 통계
+        pool_size: 현재 풀 크기 (DB_POOL_SIZE 또는 DB_READ_POOL_SIZE)
+        max_overflow: 현재 오버플로 한도 (DB_MAX_OVERFLOW 또는 DB_READ_MAX_OVERFLOW)
+        wait_target_ms: 허용 대기 시간 p95(ms)
+    """
+    peak = window.peak_checked_out
+    headroom = max(1, math.ceil(peak * 1.25))
+    if window.timeouts or window.p95_ms > wait_target_ms:
+        if peak >= pool_size + max_overflow:
+            grow = max(1, pool_size // 2)
+            return PoolRecommendation(
+                action="increase",
+                pool_size=pool_size + grow,
+                max_overflow=max_overflow + grow,
+                reason=(
+                    f"연결 한도({pool_size + max_overflow}) 소진, 대기 p95 "
+                    f"{window.p95_ms:.1f}ms, 타임아웃 {window.timeouts}회 "
+                    "(DB max_connections 확인 필요)"
+                ),
+            )
+        if peak > pool_size:
+            return PoolRecommendation(
+                action="increase",
+                pool_size=min(headroom, pool_size + max_overflow),
+                max_overflow=max_overflow,
+                reason=(
+                    f"오버플로 연결 생성 대기 p95 {window.p95_ms:.1f}ms, "
+                    f"최대 사용 {peak}개"
+                ),
+            )
+        return PoolRecommendation(
+            action="keep",
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            reason=(
+                f"대기 p95 {window.p95_ms:.1f}ms이지만 최대 사용 {peak}개로 pool_size "
+                "이내 (연결 생성, pre-ping 또는 DB 지연 확인)"
+            ),
+        )
+    if window.checkouts and peak < pool_size / 2:
+        return PoolRecommendation(
+            action="decrease",
+            pool_size=headroom,
+            max_overflow=max_overflow,
+            reason=f"최대 사용 {peak}개로 pool_size {pool_size}의 절반 미만",
+        )
+    return PoolRecommendation(
+        action="keep",
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        reason=f"대기 p95 {window.p95_ms:.1f}ms, 최대 사용 {peak}개",
+    )
+
+
+def pool_status(pool: Any, engine: str) -> dict[str, Any]:
+    """
+    풀 상태 요약 (내부 엔드포인트용)
+
+    Args:
+        pool: 현재 엔진의 풀
+        engine: engine 라벨 (POOL_ENGINES)
+    """
+    counts, total = checkout_wait_seconds.snapshot(engine=engine)
+    status: dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "checked_out": pool_usages[engine].checked_out,
+        "connections": int(open_connections.value(engine=engine)),
+        "checkouts": int(checkouts_total.value(engine=engine)),
+        "checkout_timeouts": int(checkout_timeouts_total.value(engine=engine)),
+        "connections_created": int(connections_created_total.value(engine=engine)),
+        "invalidations": {
+            kind: int(invalidations_total.value(engine=engine, kind=kind))
+            for kind in ("hard", "soft")
+        },
+        "wait": {
+            "mean_ms": total / counts[-1] * 1000 if counts[-1] else 0.0,
+            **quantiles_ms(counts),
+        },
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            pool_size=pool.size(),
+            checked_in=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+        )
+    return status
+
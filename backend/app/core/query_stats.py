@@ -0,0 +1,188 @@
+"""
+요청별 SQL 실행 통계 모듈
+엔진 이벤트로 요청(또는 측정 구간)마다 실행한 SQL 문 수, DB 시간, 영향받은 행 수를 집계
+
+- 요청 처리: app.core.middleware.QueryStatsMiddleware가 요청마다 통계를 시작하고
+  Server-Timing 헤더로 노출
+- 테스트/벤치마크: track_queries(), assert_max_queries()로 구간별 쿼리 수 확인
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class QueryStats:
+    """
+    측정 구간의 SQL 실행 통계
+
+    statements는 DB 왕복 수로, SQL 문과 COMMIT/ROLLBACK을 모두 셉니다
+    (COMMIT/ROLLBACK은 DBAPI 호출이라 db_seconds에는 포함되지 않음,
+    autocommit 읽기 연결에서 생략되는 ROLLBACK은 제외).
+    affected_rows는 INSERT/UPDATE/DELETE가 바꾼 행 수만 셉니다 (SELECT의 반환 행은
+    결과를 읽을 때 가져오므로 cursor.rowcount로 알 수 없어 포함하지 않음).
+    """
+
+    statements: int = 0
+    db_seconds: float = 0.0
+    affected_rows: int = 0
+    # capture=True일 때만 SQL 문을 기록 (요청 처리 중에는 기록하지 않음)
+    capture: bool = False
+    captured: list[str] = field(default_factory=list)
+
+    @property
+    def db_ms(self) -> float:
+        return self.db_seconds * 1000
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 항목 (db;dur=<ms>;desc="<n> queries, <n> affected rows")"""
+        return (
+            f'db;dur={self.db_ms:.2f};desc="{self.statements} queries, '
+            f'{self.affected_rows} affected rows"'
+        )
+
+
+# 활성 측정 구간 (중첩 가능: 테스트의 track_queries 안에서 요청 미들웨어 구간이 열려도 모두 집계)
+_active_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "query_stats", default=()
+)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """가장 안쪽 측정 구간의 통계 (측정 중이 아니면 None)"""
+    active = _active_stats.get()
+    return active[-1] if active else None
+
+
+def start_query_stats(
+    capture: bool = False,
+) -> tuple[QueryStats, Token[tuple[QueryStats, ...]]]:
+    """
+    새 측정 구간 시작
+
+    Args:
+        capture: 실행한 SQL 문 기록 여부
+
+    Returns:
+        (통계, 구간 종료 시 stop_query_stats에 넘길 토큰)
+    """
+    stats = QueryStats(capture=capture)
+    return stats, _active_stats.set((*_active_stats.get(), stats))
+
+
+def stop_query_stats(token: Token[tuple[QueryStats, ...]]) -> None:
+    """측정 구간 종료"""
+    _active_stats.reset(token)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if _active_stats.get():
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    active = _active_stats.get()
+    if not active:
+        return
+    started = conn.info.get("query_started_at")
+    elapsed = time.perf_counter() - started.pop() if started else 0.0
+    # 결과 집합이 없는 문(DML)만 rowcount가 영향받은 행 수 (SELECT는 0 또는 -1)
+    rows = max(cursor.rowcount or 0, 0) if cursor.description is None else 0
+    for stats in active:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+        stats.affected_rows += rows
+        if stats.capture:
+            stats.captured.append(statement)
+
+
+def _record_transaction_end(statement: str) -> None:
+    for stats in _active_stats.get():
+        stats.statements += 1
+        if stats.capture:
+            stats.captured.append(statement)
+
+
+def _on_commit(conn: Any) -> None:
+    _record_transaction_end("COMMIT")
+
+
+def _on_rollback(conn: Any) -> None:
+    # 무효화된 연결과 autocommit 연결(skip_autocommit_rollback, 읽기 세션)은
+    # ROLLBACK을 DB에 보내지 않으므로 왕복으로 세지 않음
+    if conn.invalidated:
+        return
+    dialect = conn.dialect
+    if dialect.skip_autocommit_rollback and dialect.detect_autocommit_setting(
+        conn.connection.dbapi_connection
+    ):
+        return
+    _record_transaction_end("ROLLBACK")
+
+
+def _handle_error(exception_context: Any) -> None:
+    connection = exception_context.connection
+    if connection is not None and _active_stats.get():
+        started = connection.info.get("query_started_at")
+        if started:
+            started.pop()
+
+
+def instrument_queries(engine: AsyncEngine) -> None:
+    """엔진에 SQL 실행 통계 이벤트 등록 (측정 구간 밖에서는 ContextVar 조회만 추가)"""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    event.listen(sync_engine, "commit", _on_commit)
+    event.listen(sync_engine, "rollback", _on_rollback)
+
+
+@contextmanager
+def track_queries(capture: bool = True) -> Iterator[QueryStats]:
+    """
+    구간 안에서 실행한 SQL 통계 수집
+
+    사용법:
+        with track_queries() as stats:
+            await user_crud.get_user_by_email(session, email)
+        assert stats.statements == 1
+
+    Args:
+        capture: 실행한 SQL 문 기록 여부
+    """
+    stats, token = start_query_stats(capture)
+    try:
+        yield stats
+    finally:
+        stop_query_stats(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """
+    구간 안에서 실행한 SQL 문이 limit개 이하인지 확인 (왕복 수 회귀 방지용)
+
+    Raises:
+        AssertionError: limit을 넘은 경우 (실행한 SQL 문 목록 포함)
+    """
+    with track_queries(capture=True) as stats:
+        yield stats
+    if stats.statements > limit:
+        executed = "\n".join(
+            f"  {index}. {statement}" for index, statement in enumerate(stats.captured, 1)
+        )
+        raise AssertionError(
+            f"SQL 문 {stats.statements}개 실행 (최대 {limit}개)\n{executed}"
+        )
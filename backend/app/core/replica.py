@@ -0,0 +1,79 @@
+"""
+읽기 복제본 라우팅 상태 모듈
+복제본 정상 여부와 복제 지연, 최근 변경한 사용자의 주 DB 고정(read-your-writes)을 관리
+"""
+
+import logging
+from typing import Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import counter, gauge
+
+logger = logging.getLogger(__name__)
+
+read_routes_total = counter(
+    "db_read_routes_total",
+    "읽기 세션 SQL 실행의 대상 DB (replica, primary)",
+    ("target",),
+)
+replica_failovers_total = counter(
+    "db_replica_failovers_total",
+    "복제본이 비정상으로 바뀌어 읽기를 주 DB로 돌린 횟수",
+)
+replica_lag_seconds = gauge(
+    "db_replica_lag_seconds",
+    "마지막 상태 확인의 복제 지연(초, 확인하지 않으면 0)",
+)
+
+
+class ReplicaState:
+    """
+    복제본 상태
+
+    상태 확인 작업이 정상으로 확인하기 전(시작 직후, 복제본 미설정)에는 비정상으로 간주하여
+    모든 읽기를 주 DB에서 처리합니다.
+    """
+
+    def __init__(self):
+        self.healthy = False
+        self.reason: Optional[str] = "확인 전"
+
+    def mark_healthy(self) -> None:
+        if not self.healthy:
+            logger.info("읽기 복제본 사용 시작")
+        self.healthy = True
+        self.reason = None
+
+    def mark_unhealthy(self, reason: str) -> None:
+        """비정상 표시 (정상에서 바뀐 경우에만 로그와 카운터 기록)"""
+        if self.healthy:
+            replica_failovers_total.inc()
+            logger.warning(f"읽기 복제본 비정상, 주 DB로 전환: {reason}")
+        self.healthy = False
+        self.reason = reason
+
+
+# 전역 복제본 상태 인스턴스
+replica_state = ReplicaState()
+gauge(
+    "db_replica_healthy",
+    "읽기 복제본 사용 여부 (1: 복제본, 0: 주 DB로 대체)",
+).set_function(lambda: 1.0 if replica_state.healthy else 0.0)
+
+# 최근 변경한 사용자 (user_id -> True), 프로세스 로컬 값
+recent_writers: TTLCache[int, bool] = TTLCache(
+    "replica_recent_writer",
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.REPLICA_READ_YOUR_WRITES_SECONDS,
+)
+
+
+def pin_primary(user_id: int) -> None:
+    """사용자 정보 변경 후 REPLICA_READ_YOUR_WRITES_SECONDS 동안 해당 사용자 읽기를 주 DB로 고정"""
+    recent_writers.set(user_id, True)
+
+
+def is_primary_pinned(user_id: int) -> bool:
+    """최근 변경으로 주 DB에서 읽어야 하는 사용자인지 확인"""
+    return recent_writers.get(user_id) is not None
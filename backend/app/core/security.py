@@ -3,30 +3,107 @@
 JWT 토큰 생성/검증 (PyJWT) 및 비밀번호 해싱 (pwdlib + Argon2)
 """
 
+import base64
+import hashlib
+import hmac
+import secrets
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 import jwt
 from pwdlib import PasswordHash
+from pwdlib.exceptions import HasherNotAvailable
 from pwdlib.hashers.argon2 import Argon2Hasher
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.hashing import run_in_hash_pool
+from app.core.keys import is_asymmetric, key_ring
+from app.core.metrics import timed
+
+
+def _password_hashers() -> tuple[Any, ...]:
+    """
+    비밀번호 해셔 목록 (첫 번째 해셔로 새 해시 생성)
+
+    bcrypt는 가져온 레거시 해시 검증용이며 선택적 의존성입니다 (uv sync --extra bcrypt).
+    검증에 성공하면 verify_and_update_password가 Argon2 해시로 교체합니다.
+    """
+    hashers: list[Any] = [Argon2Hasher()]
+    try:
+        from pwdlib.hashers.bcrypt import BcryptHasher
+    except HasherNotAvailable:
+        pass
+    else:
+        hashers.append(BcryptHasher())
+    return tuple(hashers)
+
 
 # Argon2 해싱 설정
-password_hash = PasswordHash((Argon2Hasher(),))
+password_hash = PasswordHash(_password_hashers())
+
+# 검증된 JWT 페이로드 캐시 (토큰 SHA-256 다이제스트 -> 페이로드, 토큰의 exp에 만료)
+verified_token_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    "verified_token",
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
 
 
+@timed("security.get_password_hash")
 def get_password_hash(password: str) -> str:
     """비밀번호를 Argon2로 해싱"""
     return password_hash.hash(password)
 
 
+@timed("security.verify_password")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
     return password_hash.verify(plain_password, hashed_password)
 
 
+@timed("security.verify_and_update_password")
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 및 재해싱
+
+    Returns:
+        (검증 결과, 새 Argon2 해시) - 해시가 bcrypt이거나 Argon2 파라미터가 바뀐 경우에만
+        새 해시를 반환하고, 그 외에는 None
+    """
+    return password_hash.verify_and_update(plain_password, hashed_password)
+
+
+def is_supported_password_hash(hashed_password: str) -> bool:
+    """설치된 해셔(Argon2, bcrypt)로 검증할 수 있는 해시 문자열인지 확인"""
+    return any(hasher.identify(hashed_password) for hasher in password_hash.hashers)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호를 Argon2로 해싱 (워커 풀에서 실행하여 이벤트 루프 비차단)"""
+    return await run_in_hash_pool(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (워커 풀에서 실행하여 이벤트 루프 비차단)"""
+    return await run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """비밀번호 검증 및 재해싱 (워커 풀에서 실행하여 이벤트 루프 비차단)"""
+    return await run_in_hash_pool(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
+@timed("security.create_access_token")
 def create_access_token(
     subject: str | int,
     expires_delta: Optional[timedelta] = None,
@@ -61,13 +138,10 @@ def create_access_token(
     if extra_claims:
         to_encode.update(extra_claims)
 
-    return jwt.encode(
-        to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
-    )
+    return _encode(to_encode)
 
 
+@timed("security.create_refresh_token")
 def create_refresh_token(
     subject: str | int,
     expires_delta: Optional[timedelta] = None,
@@ -97,13 +171,113 @@ def create_refresh_token(
         "type": "refresh",
     }
 
+    return _encode(to_encode)
+
+
+def _encode(payload: dict[str, Any]) -> str:
+    """
+    JWT 서명
+
+    비대칭 알고리즘(EdDSA/RS256)이면 키 링의 활성 키로 서명하고 kid 헤더를 포함합니다.
+    """
+    if is_asymmetric(settings.JWT_ALGORITHM):
+        signing_key = key_ring.signing_key()
+        return jwt.encode(
+            payload,
+            signing_key.private_key,
+            algorithm=signing_key.algorithm,
+            headers={"kid": signing_key.kid},
+        )
+
     return jwt.encode(
-        to_encode,
+        payload,
         settings.JWT_SECRET_KEY,
         algorithm=settings.JWT_ALGORITHM,
     )
 
 
+# ========== Opaque Refresh Token ==========
+#
+# 형식: "{selector}.{verifier}"
+# - selector: 만료 시각(Unix 초, 16진수 8자리) + 난수 16바이트(base64url)
+#   저장소의 조회 키 (만료 시각은 파티션 프루닝과 TTL 계산에 사용)
+# - verifier: 난수 32바이트(base64url), 저장소에는 SHA-256 해시만 저장하고 상수 시간 비교
+
+OPAQUE_SELECTOR_BYTES = 16
+OPAQUE_VERIFIER_BYTES = 32
+
+
+@dataclass(frozen=True)
+class OpaqueToken:
+    """파싱된 Opaque Refresh Token"""
+
+    selector: str
+    verifier: str
+    expires_at: datetime
+
+
+def _urlsafe_token(nbytes: int) -> str:
+    return base64.urlsafe_b64encode(secrets.token_bytes(nbytes)).rstrip(b"=").decode()
+
+
+@timed("security.create_opaque_refresh_token")
+def create_opaque_refresh_token(expires_delta: Optional[timedelta] = None) -> str:
+    """
+    Opaque Refresh Token 생성 (JWT 인코딩 없음)
+
+    Args:
+        expires_delta: 만료 시간 (기본값: REFRESH_TOKEN_EXPIRE_DAYS)
+
+    Returns:
+        "{selector}.{verifier}" 문자열
+    """
+    if expires_delta is None:
+        expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int((datetime.now(timezone.utc) + expires_delta).timestamp())
+    selector = f"{expire:08x}{_urlsafe_token(OPAQUE_SELECTOR_BYTES)}"
+    return f"{selector}.{_urlsafe_token(OPAQUE_VERIFIER_BYTES)}"
+
+
+def is_opaque_token(token: str) -> bool:
+    """Opaque Refresh Token 형식 여부 (JWT는 점이 2개)"""
+    return token.count(".") == 1
+
+
+def parse_opaque_token(token: str) -> Optional[OpaqueToken]:
+    """
+    Opaque Refresh Token 파싱 (형식만 확인, 검증은 저장소에서 수행)
+
+    Returns:
+        OpaqueToken (형식이 맞지 않으면 None)
+    """
+    if not is_opaque_token(token):
+        return None
+    selector, verifier = token.split(".")
+    if len(selector) <= 8 or not verifier:
+        return None
+    try:
+        expire = int(selector[:8], 16)
+    except ValueError:
+        return None
+    expires_at = datetime.fromtimestamp(expire, timezone.utc).replace(tzinfo=None)
+    return OpaqueToken(selector=selector, verifier=verifier, expires_at=expires_at)
+
+
+def verify_token_secret(secret: str, expected_hash: Optional[bytes]) -> bool:
+    """토큰 비밀값(verifier)의 SHA-256 해시를 저장된 해시와 상수 시간 비교"""
+    if expected_hash is None:
+        return False
+    return hmac.compare_digest(hash_token(secret), expected_hash)
+
+
+def issue_refresh_token(subject: str | int) -> str:
+    """설정(REFRESH_TOKEN_FORMAT)에 따른 새 Refresh Token 발급"""
+    if settings.REFRESH_TOKEN_FORMAT == "opaque":
+        return create_opaque_refresh_token()
+    return create_refresh_token(subject)
+
+
+@timed("security.decode_token")
 def decode_token(token: str) -> dict[str, Any]:
     """
     JWT 토큰 디코딩 및 검증
@@ -118,6 +292,17 @@ def decode_token(token: str) -> dict[str, Any]:
         jwt.ExpiredSignatureError: 토큰 만료
         jwt.InvalidTokenError: 유효하지 않은 토큰
     """
+    if is_asymmetric(settings.JWT_ALGORITHM):
+        kid = jwt.get_unverified_header(token).get("kid")
+        verification_key = key_ring.verification_key(kid)
+        if verification_key is None:
+            raise jwt.InvalidTokenError("알 수 없는 서명 키입니다")
+        return jwt.decode(
+            token,
+            verification_key.public_key,
+            algorithms=[verification_key.algorithm],
+        )
+
     return jwt.decode(
         token,
         settings.JWT_SECRET_KEY,
@@ -125,8 +310,75 @@ def decode_token(token: str) -> dict[str, Any]:
     )
 
 
-def hash_token(token: str) -> str:
-    """Refresh Token을 해시하여 DB에 저장 (보안 강화)"""
-    import hashlib
+def decode_token_cached(token: str) -> dict[str, Any]:
+    """
+    JWT 토큰 디코딩 및 검증 (검증 결과 캐시 사용)
+
+    같은 토큰이 토큰 수명 동안 반복 사용되므로, 한 번 검증된 페이로드를
+    토큰 다이제스트로 캐시하여 base64/JSON 파싱과 서명 검증을 생략합니다.
+    캐시 항목은 토큰의 exp 시각에 만료되므로 만료된 토큰은 다시 검증되어 거절됩니다.
+
+    Args:
+        token: JWT 토큰 문자열
 
-    return hashlib.sha256(token.encode()).hexdigest()
+    Returns:
+        디코딩된 페이로드 (호출자는 수정하지 않아야 함)
+
+    Raises:
+        jwt.ExpiredSignatureError: 토큰 만료
+        jwt.InvalidTokenError: 유효하지 않은 토큰
+    """
+    if not settings.TOKEN_CACHE_ENABLED:
+        return decode_token(token)
+
+    key = hashlib.sha256(token.encode()).digest()
+    payload = verified_token_cache.get(key)
+    if payload is not None:
+        verified_token_cache.record_hit()
+        return payload
+
+    verified_token_cache.record_miss()
+    payload = decode_token(token)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = exp - time.time()
+        if ttl > 0:
+            verified_token_cache.set(key, payload, ttl=ttl)
+    return payload
+
+
+def clear_token_cache() -> None:
+    """검증된 JWT 캐시 비우기 (서명 키 변경 시)"""
+    verified_token_cache.clear()
+
+
+def hash_token(token: str) -> bytes:
+    """Refresh Token을 해시하여 DB에 저장 (SHA-256 원시 32바이트, BINARY(32) 컬럼)"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_token_expiry(token: str) -> Optional[datetime]:
+    """
+    토큰의 exp 클레임을 초 단위 naive UTC datetime으로 반환 (서명 미검증)
+    Opaque Refresh Token은 selector에 담긴 만료 시각을 반환합니다.
+
+    refresh_tokens.expires_at에 그대로 저장되어 파티션 키로 사용되므로,
+    조회 시 같은 값으로 비교하면 MySQL이 단일 파티션만 탐색합니다.
+    토큰 자체의 검증은 해시 일치 여부로 이루어지므로 서명 검증은 생략합니다.
+
+    Args:
+        token: JWT 토큰 문자열
+
+    Returns:
+        만료 시각 (exp 클레임이 없거나 디코딩할 수 없으면 None)
+    """
+    if is_opaque_token(token):
+        opaque = parse_opaque_token(token)
+        return opaque.expires_at if opaque else None
+    try:
+        exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+    except jwt.InvalidTokenError:
+        return None
+    if not isinstance(exp, (int, float)):
+        return None
+    return datetime.fromtimestamp(int(exp), timezone.utc).replace(tzinfo=None)
@@ -1,46 +1,202 @@
 """
 HashiCorp Vault 클라이언트 모듈
-시크릿 조회 및 설정 로드
+비동기 HTTP 클라이언트(httpx, 연결 재사용)로 시크릿을 동시에 조회하고
+lease/TTL 기준으로 캐시하며 만료 전에 백그라운드에서 갱신
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any, Optional
 
-import hvac
-from hvac.exceptions import VaultError
+import httpx
 
 from app.core.config import settings
+from app.core.keys import is_asymmetric, load_key_ring_from_secret
+from app.core.metrics import counter
+from app.core.security import clear_token_cache
 
 logger = logging.getLogger(__name__)
 
+# 시크릿 갱신 시 호출되는 콜백 (새 시크릿 데이터)
+RefreshCallback = Callable[[dict[str, Any]], Awaitable[None] | None]
+
+# 갱신 실패 후 재시도 간격 상한(초)
+REFRESH_RETRY_MAX_SECONDS = 30.0
+
+# Vault 메트릭
+requests_total = counter(
+    "vault_requests_total",
+    "Vault HTTP 요청 수",
+    ("result",),
+)
+refreshes_total = counter(
+    "vault_secret_refreshes_total",
+    "백그라운드 시크릿 갱신 수",
+    ("result",),
+)
+
+
+class VaultError(Exception):
+    """Vault 요청 실패 (status_code가 None이면 연결 오류)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def is_forbidden(self) -> bool:
+        """토큰이 유효하지 않거나 권한이 없는 경우"""
+        return self.status_code == 403
+
+
+@dataclass
+class VaultSecret:
+    """Vault 응답 (lease 메타데이터 포함)"""
+
+    data: dict[str, Any]
+    lease_id: str = ""
+    lease_duration: float = 0.0
+    renewable: bool = False
+
+
+@dataclass
+class _CacheEntry:
+    """캐시된 시크릿 (시각은 time.monotonic 기준)"""
+
+    secret: VaultSecret
+    fetched_at: float
+    ttl: float
+    refresh_ratio: float
+
+    @property
+    def expires_at(self) -> float:
+        return self.fetched_at + self.ttl
+
+    @property
+    def refresh_at(self) -> float:
+        return self.fetched_at + self.ttl * self.refresh_ratio
+
 
 class VaultClient:
-    """HashiCorp Vault 클라이언트"""
+    """
+    비동기 HashiCorp Vault 클라이언트
 
-    def __init__(self):
-        self._client: Optional[hvac.Client] = None
+    - 하나의 httpx.AsyncClient로 연결을 재사용 (keep-alive)
+    - KV 시크릿을 lease_duration(없으면 VAULT_SECRET_CACHE_TTL_SECONDS) 동안 캐시
+    - 같은 경로의 동시 조회는 요청 하나로 합침
+    - 캐시 수명의 refresh_ratio 지점에서 백그라운드 갱신, 만료 전까지는 기존 값 제공
+    - transport를 주입하면 가짜 Vault(httpx.ASGITransport, MockTransport)로 검증 가능
+    """
+
+    def __init__(
+        self,
+        addr: Optional[str] = None,
+        token: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self._addr = addr
+        self._token = token
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache: dict[str, _CacheEntry] = {}
+        self._inflight: dict[str, asyncio.Task[VaultSecret]] = {}
+        self._listeners: dict[str, list[RefreshCallback]] = {}
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+        self._stopping = asyncio.Event()
 
     @property
-    def client(self) -> hvac.Client:
-        """Vault 클라이언트 인스턴스 (지연 초기화)"""
+    def client(self) -> httpx.AsyncClient:
+        """HTTP 클라이언트 인스턴스 (지연 초기화)"""
         if self._client is None:
-            self._client = hvac.Client(
-                url=settings.VAULT_ADDR,
-                token=settings.VAULT_TOKEN,
+            self._client = httpx.AsyncClient(
+                base_url=self._addr or settings.VAULT_ADDR,
+                headers={"X-Vault-Token": self._token or settings.VAULT_TOKEN},
+                timeout=settings.VAULT_TIMEOUT_SECONDS,
+                transport=self._transport,
             )
         return self._client
 
-    def is_authenticated(self) -> bool:
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """
+        Vault HTTP API 호출
+
+        Args:
+            method: HTTP 메서드
+            path: /v1 이후 경로 (예: "secret/data/jwt")
+            json: 요청 본문
+
+        Returns:
+            응답 JSON (본문이 없으면 빈 딕셔너리)
+
+        Raises:
+            VaultError: 연결 실패 또는 2xx가 아닌 응답
+        """
+        try:
+            response = await self.client.request(method, f"/v1/{path}", json=json)
+        except httpx.HTTPError as e:
+            requests_total.inc(result="error")
+            raise VaultError(f"Vault 연결 실패 [{path}]: {e}") from e
+        if response.is_error:
+            requests_total.inc(result=str(response.status_code))
+            raise VaultError(
+                f"Vault 요청 실패 [{path}]: HTTP {response.status_code}",
+                status_code=response.status_code,
+            )
+        requests_total.inc(result="ok")
+        return response.json() if response.content else {}
+
+    async def read(self, path: str) -> VaultSecret:
+        """
+        시크릿 조회 (캐시 없음)
+
+        Args:
+            path: /v1 이후 경로 (예: "database/creds/app")
+
+        Returns:
+            VaultSecret (data는 응답의 data 필드)
+        """
+        body = await self.request("GET", path)
+        return VaultSecret(
+            data=body.get("data") or {},
+            lease_id=body.get("lease_id") or "",
+            lease_duration=float(body.get("lease_duration") or 0),
+            renewable=bool(body.get("renewable")),
+        )
+
+    async def read_kv(self, path: str, mount_point: str = "secret") -> VaultSecret:
+        """KV v2 시크릿 조회 (캐시 없음, data는 시크릿 키-값)"""
+        secret = await self.read(f"{mount_point}/data/{path}")
+        secret.data = secret.data.get("data") or {}
+        return secret
+
+    async def revoke_lease(self, lease_id: str) -> None:
+        """lease 즉시 폐기 (동적 자격 증명 삭제)"""
+        await self.request("PUT", "sys/leases/revoke", json={"lease_id": lease_id})
+
+    async def is_authenticated(self) -> bool:
         """Vault 인증 상태 확인"""
         try:
-            return self.client.is_authenticated()
-        except Exception as e:
+            await self.request("GET", "auth/token/lookup-self")
+            return True
+        except VaultError as e:
             logger.error(f"Vault 인증 확인 실패: {e}")
             return False
 
-    def get_secret(self, path: str, mount_point: str = "secret") -> dict[str, Any]:
+    # ========== 캐시 ==========
+
+    async def get_secret(self, path: str, mount_point: str = "secret") -> dict[str, Any]:
         """
-        KV v2 시크릿 조회
+        KV v2 시크릿 조회 (캐시 우선)
+
+        캐시가 갱신 시점을 지났으면 기존 값을 바로 반환하고 백그라운드에서 갱신합니다.
 
         Args:
             path: 시크릿 경로 (예: "jwt", "database")
@@ -50,19 +206,18 @@ class VaultClient:
             시크릿 데이터 딕셔너리
 
         Raises:
-            VaultError: Vault 조회 실패
+            VaultError: Vault 조회 실패 (캐시가 없거나 만료된 경우)
         """
-        try:
-            response = self.client.secrets.kv.v2.read_secret_version(
-                path=path,
-                mount_point=mount_point,
-            )
-            return response["data"]["data"]
-        except VaultError as e:
-            logger.error(f"Vault 시크릿 조회 실패 [{path}]: {e}")
-            raise
+        key = f"{mount_point}/{path}"
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry.expires_at:
+            if now >= entry.refresh_at and key not in self._inflight:
+                self._fetch(path, mount_point).add_done_callback(_ignore_result)
+            return entry.secret.data
+        return (await self._fetch(path, mount_point)).data
 
-    def get_secret_value(
+    async def get_secret_value(
         self,
         path: str,
         key: str,
@@ -82,54 +237,231 @@ class VaultClient:
             시크릿 값 또는 기본값
         """
         try:
-            secret = self.get_secret(path, mount_point)
+            secret = await self.get_secret(path, mount_point)
             return secret.get(key, default)
         except VaultError:
             return default
 
+    def _fetch(self, path: str, mount_point: str) -> asyncio.Task[VaultSecret]:
+        """같은 경로의 진행 중인 조회가 있으면 그 작업을 반환 (single-flight)"""
+        key = f"{mount_point}/{path}"
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, path, mount_point))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _load(self, key: str, path: str, mount_point: str) -> VaultSecret:
+        secret = await self.read_kv(path, mount_point)
+        previous = self._cache.get(key)
+        self._cache[key] = _CacheEntry(
+            secret=secret,
+            fetched_at=time.monotonic(),
+            ttl=secret.lease_duration or settings.VAULT_SECRET_CACHE_TTL_SECONDS,
+            refresh_ratio=settings.VAULT_REFRESH_RATIO,
+        )
+        if previous is not None and previous.secret.data != secret.data:
+            await self._notify(key, secret.data)
+        return secret
+
+    def on_refresh(
+        self,
+        path: str,
+        callback: RefreshCallback,
+        mount_point: str = "secret",
+    ) -> None:
+        """시크릿 값이 갱신으로 바뀌었을 때 호출할 콜백 등록 (중복 등록 무시)"""
+        listeners = self._listeners.setdefault(f"{mount_point}/{path}", [])
+        if callback not in listeners:
+            listeners.append(callback)
+
+    async def _notify(self, key: str, data: dict[str, Any]) -> None:
+        for callback in self._listeners.get(key, []):
+            try:
+                result = callback(data)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Vault 시크릿 갱신 콜백 실패 [{key}]: {e}")
+
+    # ========== 백그라운드 갱신 ==========
+
+    def start_refresh(self) -> None:
+        """캐시된 시크릿의 백그라운드 갱신 시작"""
+        if self._refresh_task is None:
+            self._stopping.clear()
+            self._refresh_task = asyncio.create_task(
+                self._run_refresh(), name="vault-refresh"
+            )
+
+    async def stop_refresh(self) -> None:
+        """백그라운드 갱신 중지"""
+        if self._refresh_task is None:
+            return
+        self._stopping.set()
+        try:
+            await self._refresh_task
+        finally:
+            self._refresh_task = None
+
+    async def _run_refresh(self) -> None:
+        retry_at: dict[str, float] = {}
+        while not self._stopping.is_set():
+            now = time.monotonic()
+            due = [
+                key
+                for key, entry in self._cache.items()
+                if max(entry.refresh_at, retry_at.get(key, 0.0)) <= now
+            ]
+            results = await asyncio.gather(
+                *(self._fetch(*_split_key(key)) for key in due),
+                return_exceptions=True,
+            )
+            for key, result in zip(due, results):
+                if isinstance(result, Exception):
+                    refreshes_total.inc(result="error")
+                    entry = self._cache[key]
+                    # 만료 전까지 기존 값을 유지하고 남은 수명에 비례한 간격으로 재시도
+                    delay = min(
+                        REFRESH_RETRY_MAX_SECONDS,
+                        max(1.0, (entry.expires_at - now) / 4),
+                    )
+                    retry_at[key] = now + delay
+                    logger.warning(f"Vault 시크릿 갱신 실패 [{key}]: {result}")
+                else:
+                    refreshes_total.inc(result="ok")
+                    retry_at.pop(key, None)
+
+            next_at = min(
+                (
+                    max(entry.refresh_at, retry_at.get(key, 0.0))
+                    for key, entry in self._cache.items()
+                ),
+                default=time.monotonic() + settings.VAULT_SECRET_CACHE_TTL_SECONDS,
+            )
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), max(0.0, next_at - time.monotonic())
+                )
+            except TimeoutError:
+                pass
+
+    async def aclose(self) -> None:
+        """백그라운드 갱신 중지 및 HTTP 연결 종료"""
+        await self.stop_refresh()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def _split_key(key: str) -> tuple[str, str]:
+    """캐시 키("{mount_point}/{path}")를 (path, mount_point)로 분리"""
+    mount_point, path = key.split("/", 1)
+    return path, mount_point
+
+
+def _ignore_result(task: asyncio.Task[Any]) -> None:
+    """백그라운드 갱신 실패는 기존 캐시를 유지하므로 로그만 남김"""
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Vault 시크릿 백그라운드 갱신 실패: {task.exception()}")
+
 
 # 전역 Vault 클라이언트 인스턴스
 vault_client = VaultClient()
 
 
-def load_secrets_to_settings() -> None:
+def apply_jwt_secrets(jwt_secrets: dict[str, Any]) -> None:
+    """JWT 시크릿을 설정에 적용 (서명 키나 알고리즘이 바뀌면 검증 캐시 초기화)"""
+    signing = (settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+    if jwt_secrets.get("secret_key"):
+        settings.JWT_SECRET_KEY = jwt_secrets["secret_key"]
+    if jwt_secrets.get("algorithm"):
+        settings.JWT_ALGORITHM = jwt_secrets["algorithm"]
+    if (settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM) != signing:
+        # 이전 키로 서명된 토큰이 캐시된 검증 결과로 계속 통과하지 않도록 함
+        clear_token_cache()
+    if jwt_secrets.get("access_token_expire_minutes"):
+        settings.ACCESS_TOKEN_EXPIRE_MINUTES = int(
+            jwt_secrets["access_token_expire_minutes"]
+        )
+    if jwt_secrets.get("refresh_token_expire_days"):
+        settings.REFRESH_TOKEN_EXPIRE_DAYS = int(jwt_secrets["refresh_token_expire_days"])
+
+
+def apply_jwt_key_ring(key_secrets: dict[str, Any]) -> None:
+    """비대칭 서명 키 링 적용 (검증 캐시 초기화)"""
+    try:
+        load_key_ring_from_secret(key_secrets, settings.JWT_ALGORITHM)
+        clear_token_cache()
+    except (KeyError, ValueError) as e:
+        logger.error(f"JWT 서명 키 링 로드 실패: {e}")
+
+
+def apply_database_secrets(db_secrets: dict[str, Any]) -> None:
+    """데이터베이스 시크릿을 설정에 적용 (이후 생성되는 엔진부터 사용)"""
+    if db_secrets.get("password"):
+        settings.MYSQL_PASSWORD = db_secrets["password"]
+
+
+async def load_secrets_to_settings() -> None:
     """
     Vault에서 시크릿을 로드하여 설정에 적용
 
-    애플리케이션 시작 시 호출됨
+    애플리케이션 시작 시 호출됨. jwt, database(와 서명 알고리즘이 이미 비대칭이면
+    키 링) 시크릿을 동시에 조회하므로 Vault 왕복 한 번에 끝납니다.
+    별도의 인증 확인 요청 없이, 모든 조회가 403이면 인증 실패로 판단합니다.
     """
-    try:
-        if not vault_client.is_authenticated():
+    paths = ["jwt", "database"]
+    if is_asymmetric(settings.JWT_ALGORITHM):
+        paths.append(settings.JWT_KEYS_VAULT_PATH)
+    results = dict(
+        zip(
+            paths,
+            await asyncio.gather(
+                *(vault_client.get_secret(path) for path in paths),
+                return_exceptions=True,
+            ),
+        )
+    )
+    errors = [result for result in results.values() if isinstance(result, Exception)]
+    if len(errors) == len(paths):
+        if all(isinstance(e, VaultError) and e.is_forbidden for e in errors):
             logger.warning("Vault 인증 실패 - 환경 변수 설정 사용")
-            return
+        else:
+            logger.error(f"Vault 시크릿 로드 실패: {errors[0]}")
+            logger.warning("환경 변수 설정으로 폴백")
+        return
 
-        # JWT 시크릿 로드
-        jwt_secrets = vault_client.get_secret("jwt")
-        if jwt_secrets:
-            if jwt_secrets.get("secret_key"):
-                settings.JWT_SECRET_KEY = jwt_secrets["secret_key"]
-            if jwt_secrets.get("algorithm"):
-                settings.JWT_ALGORITHM = jwt_secrets["algorithm"]
-            if jwt_secrets.get("access_token_expire_minutes"):
-                settings.ACCESS_TOKEN_EXPIRE_MINUTES = int(
-                    jwt_secrets["access_token_expire_minutes"]
-                )
-            if jwt_secrets.get("refresh_token_expire_days"):
-                settings.REFRESH_TOKEN_EXPIRE_DAYS = int(
-                    jwt_secrets["refresh_token_expire_days"]
-                )
-            logger.info("Vault에서 JWT 시크릿 로드 완료")
+    # JWT 시크릿 로드
+    jwt_secrets = results["jwt"]
+    if isinstance(jwt_secrets, Exception):
+        logger.error(f"Vault JWT 시크릿 로드 실패: {jwt_secrets}")
+    elif jwt_secrets:
+        apply_jwt_secrets(jwt_secrets)
+        vault_client.on_refresh("jwt", apply_jwt_secrets)
+        logger.info("Vault에서 JWT 시크릿 로드 완료")
 
-        # 데이터베이스 시크릿 로드 (선택적)
-        try:
-            db_secrets = vault_client.get_secret("database")
-            if db_secrets:
-                if db_secrets.get("password"):
-                    settings.MYSQL_PASSWORD = db_secrets["password"]
-                logger.info("Vault에서 데이터베이스 시크릿 로드 완료")
-        except VaultError:
-            logger.debug("데이터베이스 시크릿 없음 - 환경 변수 사용")
+    # 비대칭 서명 키 링 로드 (EdDSA/RS256, Vault의 algorithm으로 처음 비대칭이 된 경우 추가 조회)
+    if is_asymmetric(settings.JWT_ALGORITHM):
+        key_path = settings.JWT_KEYS_VAULT_PATH
+        key_secrets = results.get(key_path)
+        if key_secrets is None:
+            try:
+                key_secrets = await vault_client.get_secret(key_path)
+            except VaultError as e:
+                key_secrets = e
+        if isinstance(key_secrets, Exception):
+            logger.error(f"JWT 서명 키 링 로드 실패: {key_secrets}")
+        else:
+            apply_jwt_key_ring(key_secrets)
+            vault_client.on_refresh(key_path, apply_jwt_key_ring)
 
-    except Exception as e:
-        logger.error(f"Vault 시크릿 로드 실패: {e}")
-        logger.warning("환경 변수 설정으로 폴백")
+    # 데이터베이스 시크릿 로드 (선택적)
+    db_secrets = results["database"]
+    if isinstance(db_secrets, Exception):
+        logger.debug("데이터베이스 시크릿 없음 - 환경 변수 사용")
+    elif db_secrets:
+        apply_database_secrets(db_secrets)
+        vault_client.on_refresh("database", apply_database_secrets)
+        logger.info("Vault에서 데이터베이스 시크릿 로드 완료")
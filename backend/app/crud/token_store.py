@@ -0,0 +1,287 @@
+"""
+Refresh Token 저장소
+SQL(refresh_tokens 테이블) 구현과 키-값(Redis 프로토콜) 구현
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.kv import InMemoryKeyValueClient, KeyValueClient
+from app.core.security import (
+    get_token_expiry,
+    hash_token,
+    parse_opaque_token,
+    verify_token_secret,
+)
+from app.crud.user import user_crud
+
+logger = logging.getLogger(__name__)
+
+
+class TokenStore(ABC):
+    """
+    Refresh Token 저장소 인터페이스
+
+    모든 메서드는 요청의 DB 세션을 받습니다. SQL 구현은 같은 트랜잭션에서 실행되고,
+    키-값 구현은 세션을 사용하지 않으며 명령 즉시 반영됩니다.
+    """
+
+    @abstractmethod
+    async def save(self, session: AsyncSession, user_id: int, token: str) -> None:
+        """새 Refresh Token 저장"""
+
+    @abstractmethod
+    async def is_valid(self, session: AsyncSession, token: str) -> bool:
+        """미사용, 미만료 토큰 여부"""
+
+    @abstractmethod
+    async def rotate(
+        self,
+        session: AsyncSession,
+        token: str,
+        new_token: str,
+        user_id: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        기존 토큰을 원자적으로 소비하고 새 토큰 저장
+
+        동시에 같은 토큰으로 호출하면 하나만 성공합니다.
+
+        Args:
+            user_id: 토큰 주체 사용자 ID (JWT 토큰은 필수, Opaque 토큰은 저장된 소유자 사용)
+
+        Returns:
+            토큰 소유자 ID (로테이션 실패 시 None)
+        """
+
+    @abstractmethod
+    async def revoke(self, session: AsyncSession, token: str) -> bool:
+        """토큰 하나 무효화"""
+
+    @abstractmethod
+    async def revoke_all(self, session: AsyncSession, user_id: int) -> int:
+        """사용자의 모든 토큰 무효화 (무효화된 토큰 수 반환)"""
+
+    async def close(self) -> None:
+        """연결 정리"""
+
+
+class SQLTokenStore(TokenStore):
+    """refresh_tokens 테이블 기반 저장소 (UserCRUD의 Refresh Token 메서드 사용)"""
+
+    async def save(self, session: AsyncSession, user_id: int, token: str) -> None:
+        await user_crud.save_refresh_token(session, user_id, token)
+
+    async def is_valid(self, session: AsyncSession, token: str) -> bool:
+        return await user_crud.verify_refresh_token(session, token)
+
+    async def rotate(
+        self,
+        session: AsyncSession,
+        token: str,
+        new_token: str,
+        user_id: Optional[int] = None,
+    ) -> Optional[int]:
+        return await user_crud.rotate_refresh_token(
+            session, token, new_token, user_id=user_id
+        )
+
+    async def revoke(self, session: AsyncSession, token: str) -> bool:
+        return await user_crud.revoke_refresh_token(session, token)
+
+    async def revoke_all(self, session: AsyncSession, user_id: int) -> int:
+        return await user_crud.revoke_all_user_tokens(session, user_id)
+
+
+class KeyValueTokenStore(TokenStore):
+    """
+    키-값 저장소 기반 Refresh Token 저장소
+
+    키 구조:
+        {prefix}{token_hash(hex)} -> 값   (토큰 exp까지 PX TTL, 만료 시 자동 삭제)
+        {prefix}user:{user_id} -> {token_hash, ...}   (일괄 무효화용 집합)
+
+    값은 JWT 토큰이면 "{user_id}", Opaque 토큰이면 "{user_id}:{verifier_hash(hex)}"이며
+    Opaque 토큰의 token_hash는 selector 해시입니다.
+
+    - 로테이션: GETDEL로 기존 토큰을 원자적으로 소비 (compare-and-set),
+      값이 사용자 ID와 일치할 때만 새 토큰 저장
+    - Opaque 토큰은 GET으로 verifier를 먼저 비교하고, GETDEL 결과가 같은 값일 때만 성공
+    - 무효화된 토큰은 키를 삭제하므로 별도 정리 작업이 필요 없음
+    """
+
+    def __init__(self, client: KeyValueClient, prefix: str = "rt:"):
+        self.client = client
+        self.prefix = prefix
+
+    @staticmethod
+    def _token_hash(token: str) -> str:
+        opaque = parse_opaque_token(token)
+        return hash_token(opaque.selector if opaque else token).hex()
+
+    @staticmethod
+    def _entry(token: str, user_id: int) -> str:
+        opaque = parse_opaque_token(token)
+        if opaque is None:
+            return str(user_id)
+        return f"{user_id}:{hash_token(opaque.verifier).hex()}"
+
+    @staticmethod
+    def _owner(token: str, entry: Optional[str]) -> Optional[str]:
+        """저장된 값에서 소유자 ID 추출 (Opaque 토큰은 verifier가 일치할 때만)"""
+        if entry is None:
+            return None
+        owner, _, verifier_hash = entry.partition(":")
+        opaque = parse_opaque_token(token)
+        if opaque is None:
+            return owner
+        if not verifier_hash or not verify_token_secret(
+            opaque.verifier, bytes.fromhex(verifier_hash)
+        ):
+            return None
+        return owner
+
+    def _token_key(self, token_hash: str) -> str:
+        return f"{self.prefix}{token_hash}"
+
+    def _user_key(self, user_id: int | str) -> str:
+        return f"{self.prefix}user:{user_id}"
+
+    @staticmethod
+    def _ttl_ms(token: str) -> Optional[int]:
+        """토큰 exp까지 남은 시간(ms), 만료되었거나 exp가 없으면 None"""
+        expires_at = get_token_expiry(token)
+        if expires_at is None:
+            return None
+        ttl_ms = int((expires_at - datetime.utcnow()).total_seconds() * 1000)
+        return ttl_ms if ttl_ms > 0 else None
+
+    async def save(self, session: AsyncSession, user_id: int, token: str) -> None:
+        ttl_ms = self._ttl_ms(token)
+        if ttl_ms is None:
+            raise ValueError("만료되었거나 exp 클레임이 없는 토큰은 저장할 수 없습니다")
+        token_hash = self._token_hash(token)
+        user_key = self._user_key(user_id)
+        await self.client.set(
+            self._token_key(token_hash), self._entry(token, user_id), px=ttl_ms
+        )
+        await self.client.sadd(user_key, token_hash)
+        # 집합은 가장 최근 토큰의 수명만큼 유지 (만료된 멤버는 revoke_all에서 정리)
+        await self.client.pexpire(
+            user_key, settings.REFRESH_TOKEN_EXPIRE_DAYS * 86_400_000
+        )
+
+    async def is_valid(self, session: AsyncSession, token: str) -> bool:
+        token_key = self._token_key(self._token_hash(token))
+        return self._owner(token, await self.client.get(token_key)) is not None
+
+    async def _consume(self, token: str) -> Optional[str]:
+        """
+        기존 토큰 키를 원자적으로 삭제하고 소유자 ID 반환
+
+        Opaque 토큰은 verifier가 틀린 요청이 토큰을 삭제하지 못하도록 GET으로 먼저
+        비교하고, GETDEL로 읽은 값이 비교한 값과 같을 때만 소비로 인정합니다.
+        """
+        token_hash = self._token_hash(token)
+        token_key = self._token_key(token_hash)
+        if parse_opaque_token(token) is None:
+            owner = await self.client.getdel(token_key)
+        else:
+            entry = await self.client.get(token_key)
+            owner = self._owner(token, entry)
+            if owner is None or await self.client.getdel(token_key) != entry:
+                return None
+        if owner is not None:
+            await self.client.srem(self._user_key(owner), token_hash)
+        return owner
+
+    async def rotate(
+        self,
+        session: AsyncSession,
+        token: str,
+        new_token: str,
+        user_id: Optional[int] = None,
+    ) -> Optional[int]:
+        owner = await self._consume(token)
+        if owner is None or (user_id is not None and owner != str(user_id)):
+            return None
+        await self.save(session, int(owner), new_token)
+        return int(owner)
+
+    async def revoke(self, session: AsyncSession, token: str) -> bool:
+        return await self._consume(token) is not None
+
+    async def revoke_all(self, session: AsyncSession, user_id: int) -> int:
+        # SQL 저장소(revoke_all_user_tokens)와 같이 사용자 인증 캐시도 무효화
+        user_crud._invalidate_user(session, user_id)
+        user_key = self._user_key(user_id)
+        token_hashes = await self.client.smembers(user_key)
+        if not token_hashes:
+            return 0
+        revoked = await self.client.delete(
+            *(self._token_key(token_hash) for token_hash in token_hashes)
+        )
+        # 조회 이후 추가된 토큰은 남도록 읽은 멤버만 제거
+        await self.client.srem(user_key, *token_hashes)
+        return revoked
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def _create_redis_client() -> KeyValueClient:
+    """Redis 클라이언트 생성 (선택적 의존성: redis 패키지)"""
+    try:
+        from redis.asyncio import Redis
+    except ImportError as e:
+        raise RuntimeError(
+            "TOKEN_STORE_BACKEND=redis에는 redis 패키지가 필요합니다 "
+            "(uv sync --extra redis)"
+        ) from e
+    return Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+def create_token_store(backend: str) -> TokenStore:
+    """
+    저장소 생성
+
+    Args:
+        backend: sql, redis 또는 memory (프로세스 내 대체 구현, 단일 인스턴스 전용)
+    """
+    if backend == "sql":
+        return SQLTokenStore()
+    if backend == "redis":
+        return KeyValueTokenStore(
+            _create_redis_client(), prefix=settings.TOKEN_STORE_KEY_PREFIX
+        )
+    if backend == "memory":
+        return KeyValueTokenStore(
+            InMemoryKeyValueClient(), prefix=settings.TOKEN_STORE_KEY_PREFIX
+        )
+    raise ValueError(f"알 수 없는 토큰 저장소입니다: {backend}")
+
+
+# 지연 초기화를 위한 전역 변수
+_token_store: Optional[TokenStore] = None
+
+
+def get_token_store() -> TokenStore:
+    """설정된 Refresh Token 저장소 반환 (지연 초기화)"""
+    global _token_store
+    if _token_store is None:
+        _token_store = create_token_store(settings.TOKEN_STORE_BACKEND)
+        logger.info(f"Refresh Token 저장소: {settings.TOKEN_STORE_BACKEND}")
+    return _token_store
+
+
+async def close_token_store() -> None:
+    """Refresh Token 저장소 연결 종료"""
+    global _token_store
+    if _token_store is not None:
+        await _token_store.close()
+        _token_store = None
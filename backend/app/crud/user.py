@@ -3,24 +3,133 @@
 생성, 조회, 인증, Refresh Token 관리
 """
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, timedelta, timezone
-from typing import Optional
-
+from typing import Any, Optional
+
+from sqlalchemy import (
+    RowMapping,
+    Select,
+    and_,
+    delete,
+    event,
+    func,
+    insert,
+    or_,
+    update,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 from sqlmodel import select
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.metrics import timed_methods
+from app.core.replica import pin_primary
 from app.core.security import (
-    get_password_hash,
+    get_password_hash_async,
+    get_token_expiry,
     hash_token,
-    verify_password,
+    parse_opaque_token,
+    verify_and_update_password_async,
+    verify_token_secret,
 )
 from app.models.user import RefreshToken, User
-from app.schemas.user import UserCreate, UserUpdate
+from app.schemas.user import AdminUserRead, UserCreate, UserListFilter, UserUpdate
+
+# 인증/인가에 필요한 사용자 필드 (hashed_password 제외)
+AUTH_USER_FIELDS = (
+    "id",
+    "email",
+    "username",
+    "full_name",
+    "is_active",
+    "is_superuser",
+    "token_version",
+    "created_at",
+    "updated_at",
+)
+
+# 인증 사용자 캐시 (user_id -> 필드 스냅샷)
+user_cache: TTLCache[int, dict[str, Any]] = TTLCache(
+    "user",
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+# 무상태 Access Token 무효화 하한 (user_id -> 유효한 최소 token_version)
+# 프로세스 로컬 값이며 Access Token 수명 동안만 유지하면 충분함
+token_version_floor: TTLCache[int, int] = TTLCache(
+    "token_version_floor",
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+# 변경 시 token_version을 올려 기존 Access Token을 무효화하는 프로필 필드
+# (full_name 등 나머지 필드는 인증과 무관하므로 기존 토큰을 유지)
+TOKEN_VERSION_FIELDS = frozenset({"email", "username", "password"})
+
+# 커밋 후 캐시를 무효화할 사용자 ID 집합의 session.info 키
+PENDING_INVALIDATIONS = "pending_user_invalidations"
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """
+    커밋 후 변경한 사용자의 인증 캐시 무효화
+
+    쓰기 세션은 응답을 보낸 뒤 커밋하므로, flush 시점의 무효화만으로는 커밋 전에 들어온
+    인증 조회가 커밋 전 행을 다시 캐시할 수 있습니다. 커밋 후 한 번 더 무효화합니다.
+    """
+    for user_id in session.info.pop(PENDING_INVALIDATIONS, ()):
+        user_cache.invalidate(user_id)
+        pin_primary(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    """롤백된 변경의 커밋 후 무효화 예약 취소"""
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+
+# 관리자 목록/내보내기 조회 컬럼 (hashed_password 제외, 엔티티 대신 컬럼만 조회)
+ADMIN_USER_FIELDS = tuple(AdminUserRead.model_fields)
+
+# 토큰 exp와 refresh_tokens.expires_at 비교 시 허용 오차 (파티션 프루닝용 범위 조건)
+REFRESH_TOKEN_EXPIRY_TOLERANCE = timedelta(seconds=2)
+
+
+# 고유 인덱스 이름 -> 중복 시 응답 메시지
+# (MySQL은 인덱스 이름, SQLite는 "users.<컬럼>"으로 위반 제약을 보고)
+DUPLICATE_USER_DETAILS = {
+    "email": "이미 등록된 이메일입니다",
+    "username": "이미 사용 중인 사용자명입니다",
+}
+
+
+class DuplicateUserError(Exception):
+    """이메일 또는 사용자명 고유 제약 위반"""
+
+    def __init__(self, field: str):
+        super().__init__(f"중복된 사용자 {field}")
+        self.field = field
+        self.detail = DUPLICATE_USER_DETAILS[field]
+
 
+def _duplicate_user_field(error: IntegrityError) -> Optional[str]:
+    """IntegrityError가 ix_users_email / ix_users_username 위반이면 해당 필드명 반환"""
+    message = str(error.orig)
+    for field in DUPLICATE_USER_DETAILS:
+        if f"ix_users_{field}" in message or f"users.{field}" in message:
+            return field
+    return None
 
+
+@timed_methods("user_crud")
 class UserCRUD:
-    """사용자 CRUD 클래스"""
+    """사용자 CRUD 클래스 (공개 코루틴 메서드는 app_operation_duration_seconds에 기록)"""
 
     async def create_user(
         self,
@@ -36,8 +145,13 @@ class UserCRUD:
 
         Returns:
             생성된 User 객체
+
+        Raises:
+            DuplicateUserError: 이메일 또는 사용자명이 이미 존재하는 경우
         """
-        hashed_password = get_password_hash(user_create.password)
+        hashed_password = await get_password_hash_async(user_create.password)
+        # 모든 컬럼 값(기본값, 타임스탬프)을 애플리케이션에서 채우므로
+        # INSERT 후 id만 받으면 되고 다시 조회(refresh)할 필요가 없음
         user = User(
             email=user_create.email,
             username=user_create.username,
@@ -45,10 +159,50 @@ class UserCRUD:
             full_name=user_create.full_name,
         )
         session.add(user)
-        await session.flush()
-        await session.refresh(user)
+        await self._flush_user_write(session)
         return user
 
+    async def bulk_insert_users(
+        self,
+        session: AsyncSession,
+        rows: list[dict[str, Any]],
+    ) -> int:
+        """
+        사용자 여러 명을 다중 행 INSERT 한 번으로 생성 (일괄 가져오기용)
+
+        이메일/사용자명이 이미 존재하는 행은 건너뜁니다 (MySQL ON DUPLICATE KEY UPDATE
+        id = id, SQLite INSERT OR IGNORE). 같은 입력을 다시 실행해도 중복 생성되지 않습니다.
+        INSERT IGNORE와 달리 잘리거나 잘못된 값은 경고가 아닌 오류로 배치 전체를 실패시킵니다.
+
+        MySQL 연결은 CLIENT_FOUND_ROWS로 열려 건너뛴 행도 rowcount에 포함되므로,
+        같은 트랜잭션(같은 스냅샷)에서 INSERT 전후로 배치 이메일의 행 수를 세어
+        새로 생성된 수를 계산합니다.
+
+        Args:
+            session: 데이터베이스 세션
+            rows: users 컬럼 값 딕셔너리 목록 (모든 행의 키가 같아야 함, 해싱 완료된 값)
+
+        Returns:
+            새로 생성된 사용자 수
+        """
+        if not rows:
+            return 0
+        existing = (
+            select(func.count())
+            .select_from(User)
+            .where(User.email.in_([row["email"] for row in rows]))
+        )
+        before = (await session.execute(existing)).scalar_one()
+        if session.get_bind().dialect.name == "mysql":
+            statement = mysql_insert(User).values(rows)
+            statement = statement.on_duplicate_key_update(id=statement.table.c.id)
+        else:
+            statement = (
+                insert(User).values(rows).prefix_with("OR IGNORE", dialect="sqlite")
+            )
+        await session.execute(statement)
+        return (await session.execute(existing)).scalar_one() - before
+
     async def get_user_by_id(
         self,
         session: AsyncSession,
@@ -58,6 +212,45 @@ class UserCRUD:
         result = await session.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    async def get_user_for_auth(
+        self,
+        session: AsyncSession,
+        user_id: int,
+    ) -> Optional[User]:
+        """
+        인증용 사용자 조회 (캐시 우선)
+
+        캐시된 필드 스냅샷으로 분리(detached) 상태의 User를 만들어 반환합니다.
+        세션에 add하면 변경된 컬럼만 UPDATE되므로 쓰기 경로에서도 그대로 사용할 수 있습니다.
+
+        Args:
+            session: 데이터베이스 세션
+            user_id: 사용자 ID
+
+        Returns:
+            User 객체 또는 None
+        """
+        if not settings.USER_CACHE_ENABLED:
+            return await self.get_user_by_id(session, user_id)
+
+        async def load() -> Optional[dict[str, Any]]:
+            # 엔티티가 아닌 컬럼만 조회하여 세션 identity map에 등록하지 않음
+            result = await session.execute(
+                select(*(getattr(User, field) for field in AUTH_USER_FIELDS)).where(
+                    User.id == user_id
+                )
+            )
+            row = result.mappings().one_or_none()
+            return dict(row) if row else None
+
+        snapshot = await user_cache.get_or_load(user_id, load)
+        if snapshot is None:
+            return None
+
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return user
+
     async def get_user_by_email(
         self,
         session: AsyncSession,
@@ -96,10 +289,17 @@ class UserCRUD:
         user = await self.get_user_by_email(session, email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, updated_hash = await verify_and_update_password_async(
+            password, user.hashed_password
+        )
+        if not verified:
             return None
         if not user.is_active:
             return None
+        if updated_hash is not None:
+            # 가져온 bcrypt 해시 등을 현재 Argon2 설정으로 교체 (요청 커밋 시 함께 반영)
+            user.hashed_password = updated_hash
+            session.add(user)
         return user
 
     async def update_user(
@@ -111,6 +311,11 @@ class UserCRUD:
         """
         사용자 정보 업데이트
 
+        중복 확인 조회 없이 바로 UPDATE하고 고유 제약 위반을 DuplicateUserError로 변환합니다.
+        TOKEN_VERSION_FIELDS(이메일, 사용자명, 비밀번호)를 바꿀 때만 token_version을 올려
+        기존 Access Token을 무효화합니다. token_version은 원자적 증가식으로 갱신되어
+        flush 후 만료 상태가 되며 (응답 스키마에 포함되지 않으므로) 다시 조회하지 않습니다.
+
         Args:
             session: 데이터베이스 세션
             user: 기존 User 객체
@@ -118,21 +323,48 @@ class UserCRUD:
 
         Returns:
             업데이트된 User 객체
+
+        Raises:
+            DuplicateUserError: 이메일 또는 사용자명이 이미 존재하는 경우
         """
         update_data = user_update.model_dump(exclude_unset=True)
+        revokes_tokens = bool(TOKEN_VERSION_FIELDS & update_data.keys())
 
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await get_password_hash_async(
+                update_data.pop("password")
+            )
 
         for field, value in update_data.items():
             setattr(user, field, value)
 
         user.updated_at = datetime.utcnow()
+        floor: Optional[int] = None
+        if revokes_tokens:
+            floor = self._bump_token_version(user)
         session.add(user)
-        await session.flush()
-        await session.refresh(user)
+        await self._flush_user_write(session)
+        if floor is not None:
+            self._raise_token_version_floor(user.id, floor)
+        self._invalidate_user(session, user.id)
         return user
 
+    async def _flush_user_write(self, session: AsyncSession) -> None:
+        """
+        사용자 INSERT/UPDATE flush (고유 제약 위반을 DuplicateUserError로 변환)
+
+        사전 중복 조회 대신 DB 고유 인덱스로 판정하므로 왕복이 줄고 동시 요청 간
+        경합도 생기지 않습니다. 위반 시 트랜잭션을 롤백합니다.
+        """
+        try:
+            await session.flush()
+        except IntegrityError as e:
+            await session.rollback()
+            field = _duplicate_user_field(e)
+            if field is None:
+                raise
+            raise DuplicateUserError(field) from e
+
     async def delete_user(
         self,
         session: AsyncSession,
@@ -147,16 +379,242 @@ class UserCRUD:
             user: 삭제할 User 객체
             soft_delete: True면 비활성화, False면 완전 삭제
         """
+        floor: Optional[int] = None
         if soft_delete:
             user.is_active = False
             user.updated_at = datetime.utcnow()
+            floor = self._bump_token_version(user)
             session.add(user)
         else:
+            # refresh_tokens는 파티션 테이블이라 외래 키(ON DELETE CASCADE)가 없으므로 직접 삭제
+            await session.execute(
+                delete(RefreshToken)
+                .where(RefreshToken.user_id == user.id)
+                .execution_options(synchronize_session=False)
+            )
             await session.delete(user)
         await session.flush()
+        if floor is not None:
+            self._raise_token_version_floor(user.id, floor)
+        self._invalidate_user(session, user.id)
+
+    async def revoke_access_tokens(
+        self,
+        session: AsyncSession,
+        user: User,
+    ) -> None:
+        """
+        사용자의 기존 Access Token 일괄 무효화 (token_version 증가)
+
+        Args:
+            session: 데이터베이스 세션
+            user: 대상 User 객체
+        """
+        floor = self._bump_token_version(user)
+        session.add(user)
+        await session.flush()
+        self._raise_token_version_floor(user.id, floor)
+        self._invalidate_user(session, user.id)
+
+    def _invalidate_user(self, session: AsyncSession, user_id: int) -> None:
+        """
+        사용자 변경 후 인증 캐시 무효화 (지금 한 번, 세션 커밋 후 한 번)
+
+        커밋 전에 들어온 인증 조회는 커밋 전 행을 읽어 다시 캐시할 수 있으므로
+        커밋 후(_invalidate_committed_users)에 다시 무효화합니다.
+        복제본에는 변경이 늦게 반영되므로 REPLICA_READ_YOUR_WRITES_SECONDS 동안
+        이 사용자의 인증 조회를 주 DB로 고정하여 이전 값이 다시 캐시되지 않도록 합니다.
+        """
+        user_cache.invalidate(user_id)
+        pin_primary(user_id)
+        session.info.setdefault(PENDING_INVALIDATIONS, set()).add(user_id)
+
+    def is_token_version_revoked(self, user_id: int, token_version: int) -> bool:
+        """토큰의 token_version이 이 프로세스에서 무효화되었는지 확인"""
+        floor = token_version_floor.get(user_id)
+        return floor is not None and token_version < floor
+
+    def _bump_token_version(self, user: User) -> int:
+        """
+        token_version 증가
+
+        DB에서는 원자적 증가식으로 갱신하여 버전이 되돌아가지 않도록 하고,
+        알고 있는 버전 + 1을 반환합니다. 쓰기가 실패하면 기존 토큰이 유효하게 남도록
+        로컬 무효화 하한은 flush 성공 후 _raise_token_version_floor로 기록합니다.
+        """
+        floor = (user.token_version or 0) + 1
+        user.token_version = User.token_version + 1
+        return floor
+
+    def _raise_token_version_floor(self, user_id: int, floor: int) -> None:
+        """로컬 무효화 하한을 floor 이상으로 올림"""
+        current_floor = token_version_floor.get(user_id)
+        token_version_floor.set(user_id, max(floor, current_floor or 0))
+
+    # ========== 관리자 조회 ==========
+
+    def _admin_user_select(
+        self,
+        filters: UserListFilter,
+        descending: bool = False,
+    ) -> Select:
+        """필터를 적용하고 (created_at, id) 순으로 정렬한 관리자 조회 쿼리"""
+        conditions = []
+        if filters.is_active is not None:
+            conditions.append(User.is_active == filters.is_active)
+        if filters.email_prefix:
+            # LIKE 'prefix%' 이므로 ix_users_email 범위 탐색 가능
+            conditions.append(User.email.startswith(filters.email_prefix, autoescape=True))
+        if filters.created_from is not None:
+            conditions.append(User.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            conditions.append(User.created_at < filters.created_to)
+
+        order_by = (
+            (User.created_at.desc(), User.id.desc())
+            if descending
+            else (User.created_at, User.id)
+        )
+        return (
+            select(*(getattr(User, field) for field in ADMIN_USER_FIELDS))
+            .where(*conditions)
+            .order_by(*order_by)
+        )
+
+    async def list_users(
+        self,
+        session: AsyncSession,
+        filters: UserListFilter,
+        limit: int,
+        after: Optional[tuple[datetime, int]] = None,
+        descending: bool = False,
+    ) -> Sequence[RowMapping]:
+        """
+        사용자 목록 조회 (키셋 페이지네이션)
+
+        OFFSET 대신 마지막 행의 (created_at, id) 다음부터 읽으므로 페이지 깊이와 무관하게
+        (is_active, created_at, id) 또는 (created_at, id) 인덱스 범위 탐색으로 limit 행만 읽습니다.
+
+        Args:
+            session: 데이터베이스 세션
+            filters: 조회 필터
+            limit: 최대 행 수
+            after: 이전 페이지 마지막 행의 (created_at, id)
+            descending: True면 최신 가입 순
+
+        Returns:
+            ADMIN_USER_FIELDS 컬럼 행 목록
+        """
+        stmt = self._admin_user_select(filters, descending)
+        if after is not None:
+            created_at, user_id = after
+            if descending:
+                seek = or_(
+                    User.created_at < created_at,
+                    and_(User.created_at == created_at, User.id < user_id),
+                )
+            else:
+                seek = or_(
+                    User.created_at > created_at,
+                    and_(User.created_at == created_at, User.id > user_id),
+                )
+            stmt = stmt.where(seek)
+        result = await session.execute(stmt.limit(limit))
+        return result.mappings().all()
+
+    async def stream_users(
+        self,
+        session: AsyncSession,
+        filters: UserListFilter,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        사용자 전체를 서버 측 커서로 배치 단위 스트리밍 (내보내기용)
+
+        결과를 클라이언트 메모리에 모두 받지 않고 batch_size 행씩 가져오며,
+        엔티티가 아닌 컬럼만 조회하므로 세션 identity map도 커지지 않습니다.
+        스트리밍이 끝날 때까지 연결을 점유합니다.
+
+        Args:
+            session: 데이터베이스 세션 (스트리밍 전용)
+            filters: 조회 필터
+            batch_size: 한 번에 가져올 행 수
+
+        Yields:
+            ADMIN_USER_FIELDS 컬럼 행 배치
+        """
+        result = await session.stream(
+            self._admin_user_select(filters).execution_options(yield_per=batch_size)
+        )
+        async for rows in result.mappings().partitions():
+            yield rows
 
     # ========== Refresh Token 관리 ==========
 
+    def _refresh_token_lookup(self, token: str) -> Optional[tuple[Any, ...]]:
+        """
+        Refresh Token 행 조회 조건 (토큰 해시 + expires_at 범위)
+
+        expires_at은 파티션 키이므로 토큰의 exp로 범위를 지정하면 MySQL이
+        해당 일 파티션만 탐색합니다. exp 클레임을 그대로 저장하기 전에 발급된 토큰은
+        저장 값이 exp와 1초 내외로 다를 수 있어 허용 오차를 둡니다.
+        Opaque 토큰은 selector 해시로 조회합니다 (verifier는 조회 후 별도 비교).
+
+        Returns:
+            WHERE 조건 튜플 (exp 클레임이 없으면 None)
+        """
+        expires_at = get_token_expiry(token)
+        if expires_at is None:
+            return None
+        opaque = parse_opaque_token(token)
+        return (
+            RefreshToken.token_hash
+            == hash_token(opaque.selector if opaque else token),
+            RefreshToken.expires_at.between(
+                expires_at - REFRESH_TOKEN_EXPIRY_TOLERANCE,
+                expires_at + REFRESH_TOKEN_EXPIRY_TOLERANCE,
+            ),
+        )
+
+    async def _find_opaque_refresh_token(
+        self,
+        session: AsyncSession,
+        token: str,
+        valid_only: bool = True,
+    ) -> Optional[Any]:
+        """
+        Opaque Refresh Token 행 조회 및 verifier 상수 시간 비교
+
+        Args:
+            session: 데이터베이스 세션
+            token: "{selector}.{verifier}" 문자열
+            valid_only: True면 미사용, 미만료 토큰만 조회
+
+        Returns:
+            (id, user_id, expires_at) 행 (없거나 verifier가 다르면 None)
+        """
+        opaque = parse_opaque_token(token)
+        if opaque is None:
+            return None
+        conditions = list(self._refresh_token_lookup(token))
+        if valid_only:
+            conditions += [
+                RefreshToken.is_revoked == False,  # noqa: E712
+                RefreshToken.expires_at > datetime.now(timezone.utc),
+            ]
+        result = await session.execute(
+            select(
+                RefreshToken.id,
+                RefreshToken.user_id,
+                RefreshToken.expires_at,
+                RefreshToken.verifier_hash,
+            ).where(*conditions)
+        )
+        row = result.first()
+        if row is None or not verify_token_secret(opaque.verifier, row.verifier_hash):
+            return None
+        return row
+
     async def save_refresh_token(
         self,
         session: AsyncSession,
@@ -169,19 +627,21 @@ class UserCRUD:
         Args:
             session: 데이터베이스 세션
             user_id: 사용자 ID
-            token: Refresh Token 문자열
+            token: Refresh Token 문자열 (JWT 또는 Opaque)
 
         Returns:
             저장된 RefreshToken 객체
         """
-        token_hash = hash_token(token)
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
+        # 파티션 키: 조회 시 토큰에서 같은 값을 다시 계산할 수 있도록 exp 클레임을 그대로 사용
+        expires_at = get_token_expiry(token)
+        if expires_at is None:
+            raise ValueError("exp 클레임이 없는 토큰은 저장할 수 없습니다")
 
+        opaque = parse_opaque_token(token)
         refresh_token = RefreshToken(
             user_id=user_id,
-            token_hash=token_hash,
+            token_hash=hash_token(opaque.selector if opaque else token),
+            verifier_hash=hash_token(opaque.verifier) if opaque else None,
             expires_at=expires_at,
         )
         session.add(refresh_token)
@@ -192,26 +652,35 @@ class UserCRUD:
         self,
         session: AsyncSession,
         token: str,
-    ) -> Optional[RefreshToken]:
+    ) -> bool:
         """
         Refresh Token 검증
 
+        토큰의 exp로 expires_at 범위를 좁혀 해당 일 파티션 하나만 조회하고,
+        (token_hash, expires_at, is_revoked) 커버링 인덱스와 기본 키(id)만 읽어
+        테이블 행에 접근하지 않습니다. Opaque 토큰은 verifier_hash까지 읽어 비교합니다.
+
         Args:
             session: 데이터베이스 세션
             token: Refresh Token 문자열
 
         Returns:
-            유효한 RefreshToken 객체 또는 None
+            유효한(미사용, 미만료) 토큰 여부
         """
-        token_hash = hash_token(token)
+        if parse_opaque_token(token) is not None:
+            return await self._find_opaque_refresh_token(session, token) is not None
+
+        lookup = self._refresh_token_lookup(token)
+        if lookup is None:
+            return False
         result = await session.execute(
-            select(RefreshToken).where(
-                RefreshToken.token_hash == token_hash,
+            select(RefreshToken.id).where(
+                *lookup,
                 RefreshToken.is_revoked == False,  # noqa: E712
                 RefreshToken.expires_at > datetime.now(timezone.utc),
             )
         )
-        return result.scalar_one_or_none()
+        return result.first() is not None
 
     async def revoke_refresh_token(
         self,
@@ -228,19 +697,95 @@ class UserCRUD:
         Returns:
             무효화 성공 여부
         """
-        token_hash = hash_token(token)
-        result = await session.execute(
-            select(RefreshToken).where(RefreshToken.token_hash == token_hash)
-        )
+        if parse_opaque_token(token) is not None:
+            row = await self._find_opaque_refresh_token(
+                session, token, valid_only=False
+            )
+            if row is None:
+                return False
+            await session.execute(
+                update(RefreshToken)
+                .where(
+                    RefreshToken.id == row.id,
+                    RefreshToken.expires_at == row.expires_at,
+                )
+                .values(is_revoked=True, revoked_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            return True
+
+        lookup = self._refresh_token_lookup(token)
+        if lookup is None:
+            return False
+        result = await session.execute(select(RefreshToken).where(*lookup))
         refresh_token = result.scalar_one_or_none()
 
         if refresh_token:
             refresh_token.is_revoked = True
+            refresh_token.revoked_at = datetime.utcnow()
             session.add(refresh_token)
             await session.flush()
             return True
         return False
 
+    async def rotate_refresh_token(
+        self,
+        session: AsyncSession,
+        token: str,
+        new_token: str,
+        user_id: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Refresh Token 로테이션
+
+        유효한(미사용, 미만료) 기존 토큰을 조건부 UPDATE 한 번으로 무효화하고
+        영향받은 행 수로 성공 여부를 판단합니다. 동시에 같은 토큰으로 갱신하면
+        하나의 요청만 성공합니다. 성공 시 새 토큰을 저장합니다.
+        expires_at 범위 조건으로 해당 일 파티션 하나만 잠그고 갱신합니다.
+
+        Opaque 토큰은 selector로 행을 찾아 verifier를 비교한 뒤 같은 조건부 UPDATE로
+        소비하며, 토큰에 사용자 정보가 없으므로 행의 user_id를 소유자로 사용합니다.
+
+        Args:
+            session: 데이터베이스 세션
+            token: 기존 Refresh Token 문자열
+            new_token: 새 Refresh Token 문자열
+            user_id: 토큰 주체 사용자 ID (JWT 토큰은 필수, sub 클레임)
+
+        Returns:
+            토큰 소유자 ID (로테이션 실패 시 None)
+        """
+        if parse_opaque_token(token) is not None:
+            row = await self._find_opaque_refresh_token(session, token)
+            if row is None or (user_id is not None and row.user_id != user_id):
+                return None
+            conditions: tuple[Any, ...] = (
+                RefreshToken.id == row.id,
+                RefreshToken.expires_at == row.expires_at,
+            )
+            user_id = row.user_id
+        else:
+            lookup = self._refresh_token_lookup(token)
+            if lookup is None or user_id is None:
+                return None
+            conditions = (*lookup, RefreshToken.user_id == user_id)
+
+        result = await session.execute(
+            update(RefreshToken)
+            .where(
+                *conditions,
+                RefreshToken.is_revoked == False,  # noqa: E712
+                RefreshToken.expires_at > datetime.now(timezone.utc),
+            )
+            .values(is_revoked=True, revoked_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return None
+
+        await self.save_refresh_token(session, user_id, new_token)
+        return user_id
+
     async def revoke_all_user_tokens(
         self,
         session: AsyncSession,
@@ -249,6 +794,9 @@ class UserCRUD:
         """
         사용자의 모든 Refresh Token 무효화 (로그아웃 시)
 
+        (user_id, is_revoked) 인덱스를 사용하는 단일 UPDATE로 처리하여
+        토큰 수와 무관하게 한 번의 왕복으로 끝납니다.
+
         Args:
             session: 데이터베이스 세션
             user_id: 사용자 ID
@@ -257,19 +805,16 @@ class UserCRUD:
             무효화된 토큰 수
         """
         result = await session.execute(
-            select(RefreshToken).where(
+            update(RefreshToken)
+            .where(
                 RefreshToken.user_id == user_id,
                 RefreshToken.is_revoked == False,  # noqa: E712
             )
+            .values(is_revoked=True, revoked_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
         )
-        tokens = result.scalars().all()
-
-        for token in tokens:
-            token.is_revoked = True
-            session.add(token)
-
-        await session.flush()
-        return len(tokens)
+        self._invalidate_user(session, user_id)
+        return result.rowcount
 
 
 # 싱글톤 인스턴스
@@ -1,101 +1,303 @@
 """
 FastAPI 메인 애플리케이션
+create_app()으로 애플리케이션을 생성합니다 (모듈 import만으로는 생성하지 않음).
+
+API 라우터(모델, CRUD, 해싱, 서명 키)는 create_app()에서, 백그라운드 작업과
+Vault 클라이언트(httpx)는 lifespan에서 import하여 콜드 스타트와 테스트의 import 시간을
+줄입니다.
 """
 
+import asyncio
+import ipaddress
 import logging
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Optional
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from app.api.v1.api import api_router
 from app.core.config import settings
-from app.core.database import close_db, init_db
-from app.core.vault import load_secrets_to_settings
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.DEBUG if settings.DEBUG else logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+from app.core.database import close_db, init_db, warm_pool
+from app.core.metrics import registry
+from app.core.middleware import MetricsMiddleware, QueryStatsMiddleware
+
+if TYPE_CHECKING:
+    from app.core.hashing import HashingOverloadedError
+
 logger = logging.getLogger(__name__)
 
 
+async def load_vault_secrets() -> bool:
+    """
+    Vault에서 시크릿 로드 (VAULT_ENABLED=false면 생략)
+
+    Returns:
+        Vault 클라이언트 사용 여부 (종료 시 연결 정리 필요)
+    """
+    if not settings.VAULT_ENABLED:
+        return False
+    from app.core.vault import load_secrets_to_settings
+
+    try:
+        await load_secrets_to_settings()
+        logger.info("Vault 시크릿 로드 완료")
+    except Exception as e:
+        logger.warning(f"Vault 시크릿 로드 실패 (환경 변수 사용): {e}")
+    return True
+
+
+async def warm_connection_pool() -> None:
+    """DB_POOL_WARM_SIZE개의 연결을 미리 생성 (실패해도 시작은 계속)"""
+    try:
+        opened = await warm_pool(settings.DB_POOL_WARM_SIZE)
+        logger.info(f"데이터베이스 연결 {opened}개 준비 완료")
+    except Exception as e:
+        logger.warning(f"데이터베이스 연결 준비 실패: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     애플리케이션 생명주기 관리
 
     시작 시:
-    - Vault에서 시크릿 로드
-    - 데이터베이스 테이블 생성 (개발 환경)
+    - Vault 시크릿 로드와 DB 연결 풀 준비를 동시에 실행
+      (Vault에서 DB 자격 증명이 바뀌면 새 자격 증명으로 다시 준비)
+    - Vault 시크릿 백그라운드 갱신 시작
+    - Vault 동적 DB 자격 증명으로 엔진 생성 및 교체 작업 시작 (설정 시)
+    - 데이터베이스 테이블 생성 (DB_CREATE_SCHEMA=true일 때만)
+    - 읽기 복제본 상태 확인 작업 시작 (MYSQL_REPLICA_HOST 설정 시)
+    - Refresh Token 정리 작업 시작
+    - DB 풀 크기 권장 작업 시작 (DB_POOL_ADAPTIVE=true일 때)
 
     종료 시:
+    - Refresh Token 정리 작업 중지
+    - DB 풀 크기 권장 작업 중지
+    - 읽기 복제본 상태 확인 작업 중지
+    - DB 자격 증명 교체 작업 중지
+    - Vault 시크릿 갱신 중지 및 연결 종료
+    - Refresh Token 저장소 연결 종료
     - 데이터베이스 연결 종료
+    - 비밀번호 해싱 워커 풀 종료
     """
+    from app.core.hashing import shutdown_hash_executor
+    from app.core.keys import generate_signing_key, is_asymmetric, key_ring
+    from app.crud.token_store import close_token_store
+    from app.tasks.pool_advisor import pool_advisor
+    from app.tasks.refresh_token_gc import refresh_token_gc
+    from app.tasks.replica_health import replica_health_monitor
+
     # 시작
     logger.info("애플리케이션 시작 중...")
 
-    # Vault에서 시크릿 로드
-    try:
-        load_secrets_to_settings()
-        logger.info("Vault 시크릿 로드 완료")
-    except Exception as e:
-        logger.warning(f"Vault 시크릿 로드 실패 (환경 변수 사용): {e}")
+    # 동적 자격 증명은 Vault 발급 후에만 연결할 수 있으므로 풀 준비는 교체 작업에 맡김
+    warm = settings.DB_POOL_WARM_SIZE > 0 and not settings.VAULT_DATABASE_CREDS_PATH
+    credentials = (settings.MYSQL_USER, settings.MYSQL_PASSWORD)
+    if warm:
+        vault_used, _ = await asyncio.gather(
+            load_vault_secrets(), warm_connection_pool()
+        )
+        if (settings.MYSQL_USER, settings.MYSQL_PASSWORD) != credentials:
+            await close_db()
+            await warm_connection_pool()
+    else:
+        vault_used = await load_vault_secrets()
 
     # JWT Secret Key 확인
     if not settings.JWT_SECRET_KEY:
         logger.warning("JWT_SECRET_KEY가 설정되지 않았습니다. 기본값을 사용합니다.")
         settings.JWT_SECRET_KEY = "dev-secret-key-change-in-production"
 
-    # 개발 환경에서 테이블 자동 생성
-    if settings.DEBUG:
+    # 비대칭 서명 키 링 확인
+    if is_asymmetric(settings.JWT_ALGORITHM) and not key_ring.is_loaded:
+        logger.warning(
+            "JWT 서명 키 링이 로드되지 않았습니다. 임시 키를 생성합니다. "
+            "(재시작 시 기존 토큰 무효화, 다중 인스턴스 환경에서 사용 금지)"
+        )
+        signing_key = generate_signing_key(settings.JWT_ALGORITHM)
+        key_ring.load([signing_key], signing_key.kid)
+
+    # 동적 DB 자격 증명 (실패 시 MYSQL_USER/MYSQL_PASSWORD로 시작하고 백그라운드에서 재시도)
+    db_credential_rotator = None
+    if vault_used and settings.VAULT_DATABASE_CREDS_PATH:
+        from app.tasks.db_credentials import db_credential_rotator
+
+        try:
+            await db_credential_rotator.rotate()
+        except Exception as e:
+            logger.error(f"동적 DB 자격 증명 발급 실패 (정적 자격 증명 사용): {e}")
+        db_credential_rotator.start()
+
+    # 요청한 경우에만 테이블 자동 생성 (개발 환경, 그 외에는 Alembic 마이그레이션)
+    if settings.DB_CREATE_SCHEMA:
         try:
             await init_db()
             logger.info("데이터베이스 테이블 초기화 완료")
         except Exception as e:
             logger.error(f"데이터베이스 초기화 실패: {e}")
 
+    # 읽기 복제본 상태 확인 (정상으로 확인되기 전까지 읽기는 주 DB에서 처리)
+    if settings.MYSQL_REPLICA_HOST:
+        await replica_health_monitor.check()
+        replica_health_monitor.start()
+
+    # 캐시된 Vault 시크릿 백그라운드 갱신 시작
+    if vault_used and settings.VAULT_REFRESH_ENABLED:
+        from app.core.vault import vault_client
+
+        vault_client.start_refresh()
+
+    # 만료/무효화된 Refresh Token 정리 작업 시작 (키-값 저장소는 TTL로 자동 만료)
+    if settings.REFRESH_TOKEN_GC_ENABLED and settings.TOKEN_STORE_BACKEND == "sql":
+        refresh_token_gc.start()
+
+    # 관측한 연결 대기 시간으로 풀 크기 권장값 로그
+    if settings.DB_POOL_ADAPTIVE:
+        pool_advisor.start()
+
     logger.info("애플리케이션 시작 완료")
 
     yield
 
     # 종료
     logger.info("애플리케이션 종료 중...")
+    await refresh_token_gc.stop()
+    await pool_advisor.stop()
+    await replica_health_monitor.stop()
+    if db_credential_rotator is not None:
+        await db_credential_rotator.stop()
+    if vault_used:
+        from app.core.vault import vault_client
+
+        await vault_client.aclose()
+    await close_token_store()
     await close_db()
+    shutdown_hash_executor()
     logger.info("애플리케이션 종료 완료")
 
 
-# FastAPI 앱 생성
-app = FastAPI(
-    title=settings.APP_NAME,
-    description="JWT 인증 시스템이 포함된 FastAPI 백엔드",
-    version="0.1.0",
-    lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
+async def hashing_overloaded_handler(
+    request: Request, exc: "HashingOverloadedError"
+) -> JSONResponse:
+    """비밀번호 해싱 과부하 시 503 + Retry-After로 즉시 응답"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# API 라우터 등록
-app.include_router(api_router)
+# 헬스체크, JWKS 엔드포인트
+router = APIRouter()
 
+# 메트릭 엔드포인트 (METRICS_ENDPOINT_ENABLED=true일 때만 등록)
+metrics_router = APIRouter()
 
-@app.get("/", tags=["헬스체크"])
+
+@router.get("/", tags=["헬스체크"])
 async def root():
     """루트 엔드포인트"""
     return {"message": "FastAPI 서버가 정상 작동 중입니다."}
 
 
-@app.get("/health", tags=["헬스체크"])
+@router.get("/health", tags=["헬스체크"])
 async def health_check():
     """헬스 체크 엔드포인트"""
     return {"status": "healthy"}
+
+
+@router.get("/.well-known/jwks.json", tags=["인증"], summary="JWT 공개 키 집합")
+async def jwks() -> JSONResponse:
+    """
+    JWT 검증용 공개 키 집합 (JWKS)
+
+    다른 서비스가 이 키로 토큰을 로컬 검증할 수 있습니다.
+    HS256 모드에서는 빈 키 집합을 반환합니다.
+    """
+    from app.core.keys import key_ring
+
+    return JSONResponse(
+        key_ring.jwks(),
+        headers={
+            "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}"
+        },
+    )
+
+
+def is_metrics_client_allowed(host: Optional[str]) -> bool:
+    """클라이언트 주소가 METRICS_ALLOWED_NETWORKS에 속하는지 확인"""
+    if host is None:
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(
+        address in ipaddress.ip_network(network, strict=False)
+        for network in settings.METRICS_ALLOWED_NETWORKS
+    )
+
+
+@metrics_router.get("/metrics", tags=["헬스체크"], include_in_schema=False)
+async def metrics(request: Request) -> PlainTextResponse:
+    """Prometheus 메트릭 엔드포인트 (허용 네트워크에서만 조회)"""
+    if not is_metrics_client_allowed(request.client.host if request.client else None):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+    return PlainTextResponse(
+        registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def create_app() -> FastAPI:
+    """
+    FastAPI 애플리케이션 생성
+
+    사용법:
+        uv run uvicorn main:app
+        uv run uvicorn app.main:create_app --factory
+    """
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.DEBUG if settings.DEBUG else logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    app = FastAPI(
+        title=settings.APP_NAME,
+        description="JWT 인증 시스템이 포함된 FastAPI 백엔드",
+        version="0.1.0",
+        lifespan=lifespan,
+        docs_url="/docs",
+        redoc_url="/redoc",
+    )
+
+    # CORS 설정
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.BACKEND_CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # 요청별 SQL 통계 (Server-Timing 헤더, 쿼리 수 예산 경고)
+    if settings.SERVER_TIMING_ENABLED or settings.SQL_QUERY_BUDGET:
+        app.add_middleware(QueryStatsMiddleware)
+
+    # 요청 메트릭 (가장 바깥 미들웨어로 등록하여 CORS 처리 시간까지 포함)
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    # 라우터 등록 (API 라우터는 모델, CRUD, 해싱 모듈을 함께 불러오므로 여기서 import)
+    from app.api.v1.api import api_router
+    from app.core.hashing import HashingOverloadedError
+
+    app.include_router(router)
+    app.include_router(api_router)
+    if settings.METRICS_ENDPOINT_ENABLED:
+        app.include_router(metrics_router)
+
+    app.add_exception_handler(HashingOverloadedError, hashing_overloaded_handler)
+    return app
@@ -6,6 +6,7 @@ SQLModel 기반 테이블 정의
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import BINARY, Index
 from sqlmodel import Field, SQLModel
 
 
@@ -13,6 +14,12 @@ class User(SQLModel, table=True):
     """사용자 테이블"""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # 관리자 목록 키셋 페이지네이션 (created_at, id) 정렬/탐색용
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # is_active 필터 + 같은 정렬 순서
+        Index("ix_users_is_active_created_at_id", "is_active", "created_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, index=True, max_length=255)
@@ -21,18 +28,45 @@ class User(SQLModel, table=True):
     full_name: Optional[str] = Field(default=None, max_length=100)
     is_active: bool = Field(default=True)
     is_superuser: bool = Field(default=False)
+    token_version: int = Field(default=0)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
 class RefreshToken(SQLModel, table=True):
-    """Refresh Token 테이블 (토큰 로테이션 및 무효화 지원)"""
+    """
+    Refresh Token 테이블 (토큰 로테이션 및 무효화 지원)
+
+    MySQL에서는 expires_at 기준 일 단위 RANGE 파티션 테이블입니다 (마이그레이션 005).
+    파티션 제약상 모든 유니크 키에 expires_at이 포함되고(DB 기본 키는 (id, expires_at)),
+    외래 키가 없으므로 사용자 삭제 시 토큰을 직접 삭제해야 합니다.
+    """
 
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # 토큰 조회용 커버링 인덱스: 검증은 인덱스만으로 처리 (id는 기본 키로 포함)
+        # expires_at 포함으로 파티션 유니크 키 제약 충족
+        Index(
+            "ix_refresh_tokens_token_hash",
+            "token_hash",
+            "expires_at",
+            "is_revoked",
+            unique=True,
+        ),
+        # 사용자별 미무효화 토큰 일괄 무효화용
+        Index("ix_refresh_tokens_user_id_is_revoked", "user_id", "is_revoked"),
+        # 정리 작업의 무효화 토큰 보존 기간 조회용
+        Index("ix_refresh_tokens_revoked_at", "revoked_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
-    token_hash: str = Field(unique=True, index=True, max_length=64)
-    expires_at: datetime
+    user_id: int
+    # SHA-256 원시 바이트 (JWT: 토큰 전체, Opaque: selector)
+    token_hash: bytes = Field(sa_type=BINARY(32))
+    # Opaque 토큰 verifier의 SHA-256 (JWT 토큰은 NULL)
+    verifier_hash: Optional[bytes] = Field(default=None, sa_type=BINARY(32))
+    expires_at: datetime = Field(index=True)
     is_revoked: bool = Field(default=False)
+    # 무효화(로그아웃, 로테이션) 시각 (미무효화 토큰은 NULL, 010 이전 행은 발급 시각)
+    revoked_at: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -1,11 +1,25 @@
 # Pydantic 스키마 패키지
 from app.schemas.auth import LoginRequest, RefreshTokenRequest, Token
-from app.schemas.user import UserCreate, UserRead, UserUpdate
+from app.schemas.user import (
+    AdminUserRead,
+    UserCreate,
+    UserImport,
+    UserListFilter,
+    UserListParams,
+    UserPage,
+    UserRead,
+    UserUpdate,
+)
 
 __all__ = [
     "UserCreate",
+    "UserImport",
     "UserRead",
     "UserUpdate",
+    "AdminUserRead",
+    "UserListFilter",
+    "UserListParams",
+    "UserPage",
     "LoginRequest",
     "Token",
     "RefreshTokenRequest",
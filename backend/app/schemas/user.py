@@ -3,10 +3,10 @@
 요청/응답 데이터 검증 및 직렬화
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
 
 class UserCreate(BaseModel):
@@ -18,6 +18,26 @@ class UserCreate(BaseModel):
     full_name: Optional[str] = Field(default=None, max_length=100)
 
 
+class UserImport(BaseModel):
+    """사용자 일괄 가져오기 레코드 스키마 (password 또는 password_hash 중 하나 필수)"""
+
+    # users 컬럼 길이와 같은 제한 (초과 값은 거절 파일로 기록)
+    email: EmailStr = Field(max_length=255)
+    username: str = Field(min_length=3, max_length=100)
+    full_name: Optional[str] = Field(default=None, max_length=100)
+    password: Optional[str] = Field(default=None, min_length=8, max_length=100)
+    # 레거시 시스템의 Argon2 또는 bcrypt 해시 (그대로 저장)
+    password_hash: Optional[str] = Field(default=None, max_length=255)
+    is_active: bool = True
+    created_at: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def check_password(self) -> "UserImport":
+        if (self.password is None) == (self.password_hash is None):
+            raise ValueError("password와 password_hash 중 하나만 지정해야 합니다")
+        return self
+
+
 class UserRead(BaseModel):
     """사용자 응답 스키마"""
 
@@ -32,6 +52,17 @@ class UserRead(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class UserUpdateResponse(UserRead):
+    """
+    프로필 업데이트 응답 스키마
+
+    무상태 모드(ACCESS_TOKEN_STATELESS)에서는 기존 Access Token의 사용자 스냅샷이
+    달라지므로 새 Access Token을 함께 반환합니다 (그 외에는 None).
+    """
+
+    access_token: Optional[str] = None
+
+
 class UserUpdate(BaseModel):
     """프로필 업데이트 요청 스키마"""
 
@@ -39,3 +70,44 @@ class UserUpdate(BaseModel):
     username: Optional[str] = Field(default=None, min_length=3, max_length=100)
     full_name: Optional[str] = Field(default=None, max_length=100)
     password: Optional[str] = Field(default=None, min_length=8, max_length=100)
+
+
+class AdminUserRead(UserRead):
+    """관리자용 사용자 응답 스키마"""
+
+    is_superuser: bool
+
+
+class UserListFilter(BaseModel):
+    """관리자 사용자 목록/내보내기 필터 (쿼리 파라미터)"""
+
+    is_active: Optional[bool] = None
+    email_prefix: Optional[str] = Field(default=None, min_length=1, max_length=255)
+    # 가입일 범위 [created_from, created_to)
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    @field_validator("created_from", "created_to")
+    @classmethod
+    def to_naive_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """DB에는 naive UTC로 저장되므로 시간대가 있으면 UTC로 변환"""
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+
+class UserListParams(UserListFilter):
+    """관리자 사용자 목록 쿼리 파라미터 (필터 + 키셋 페이지네이션)"""
+
+    limit: int = Field(default=50, ge=1, le=500)
+    # 이전 응답의 next_cursor
+    cursor: Optional[str] = None
+    # desc: 최신 가입 순
+    order: Literal["asc", "desc"] = "desc"
+
+
+class UserPage(BaseModel):
+    """키셋 페이지네이션 응답 (next_cursor가 없으면 마지막 페이지)"""
+
+    items: list[AdminUserRead]
+    next_cursor: Optional[str] = None
@@ -0,0 +1 @@
+# 백그라운드 작업 패키지
@@ -0,0 +1,234 @@
+"""
+동적 데이터베이스 자격 증명 교체 작업
+Vault Database 시크릿 엔진이 발급한 단기 자격 증명으로 엔진을 만들고
+lease 만료 전에 새 엔진으로 무중단 교체
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.database import (
+    create_engine,
+    drain_engine,
+    replace_engine,
+    replace_read_engine,
+    replace_replica_engine,
+)
+from app.core.metrics import counter, gauge
+from app.core.vault import REFRESH_RETRY_MAX_SECONDS, VaultError, vault_client
+
+logger = logging.getLogger(__name__)
+
+# 자격 증명 교체 메트릭
+handovers_total = counter(
+    "db_pool_handovers_total",
+    "새 자격 증명 엔진으로의 풀 교체 수",
+    ("result",),
+)
+drains_total = counter(
+    "db_pool_drains_total",
+    "교체된 풀 정리 수 (timeout: 반납되지 않은 연결이 남은 채 종료)",
+    ("result",),
+)
+pools_draining = gauge(
+    "db_pools_draining",
+    "연결 반납을 기다리는 교체된 풀 수",
+)
+last_drain_seconds = gauge(
+    "db_pool_last_drain_seconds",
+    "마지막 풀 정리에 걸린 시간(초)",
+)
+lease_expiry = gauge(
+    "db_credentials_lease_expiry_timestamp_seconds",
+    "현재 DB 자격 증명 lease 만료 시각 (Unix time)",
+)
+
+
+@dataclass
+class _Lease:
+    """현재 엔진의 자격 증명 lease (시각은 time.monotonic 기준)"""
+
+    lease_id: str
+    issued_at: float
+    duration: float
+
+    @property
+    def expires_at(self) -> float:
+        return self.issued_at + self.duration
+
+    @property
+    def rotate_at(self) -> float:
+        return self.issued_at + self.duration * settings.VAULT_REFRESH_RATIO
+
+
+class DatabaseCredentialRotator:
+    """
+    동적 DB 자격 증명 교체 작업
+
+    - Vault에서 새 자격 증명을 받아 엔진을 만들고 연결을 확인한 뒤 전역 엔진 교체
+    - 이후 세션은 새 엔진을 사용하고, 기존 엔진은 진행 중인 요청의 연결이 모두
+      반납되면(최대 DB_POOL_DRAIN_TIMEOUT_SECONDS) 종료 후 lease 폐기
+    - lease 수명의 VAULT_REFRESH_RATIO 지점에서 교체, 실패하면 기존 엔진을 유지하며 재시도
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopping = asyncio.Event()
+        self._lease: Optional[_Lease] = None
+        self._drains: set[asyncio.Task[None]] = set()
+
+    def start(self) -> None:
+        """백그라운드 실행 시작"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="db-credential-rotator")
+
+    async def stop(self) -> None:
+        """백그라운드 실행 중지 (정리 중인 풀은 즉시 종료)"""
+        if self._task is not None:
+            self._stopping.set()
+            try:
+                await self._task
+            finally:
+                self._task = None
+        for drain in list(self._drains):
+            drain.cancel()
+        await asyncio.gather(*self._drains, return_exceptions=True)
+
+    async def _run(self) -> None:
+        retry_at = 0.0
+        while not self._stopping.is_set():
+            now = time.monotonic()
+            next_at = max(self._lease.rotate_at if self._lease else now, retry_at)
+            if now >= next_at:
+                try:
+                    await self.rotate()
+                    retry_at = 0.0
+                except Exception as e:
+                    # lease가 남아 있으면 남은 수명에 비례해 재시도 (기존 엔진 계속 사용)
+                    remaining = self._lease.expires_at - now if self._lease else 0.0
+                    delay = max(1.0, remaining / 4) if remaining > 0 else float("inf")
+                    retry_at = now + min(REFRESH_RETRY_MAX_SECONDS, delay)
+                    logger.error(f"DB 자격 증명 교체 실패: {e}")
+                continue
+            try:
+                await asyncio.wait_for(self._stopping.wait(), next_at - now)
+            except TimeoutError:
+                pass
+
+    async def rotate(self) -> None:
+        """
+        새 자격 증명으로 엔진 교체 1회 실행
+
+        Raises:
+            VaultError: 자격 증명 발급 실패
+            Exception: 새 자격 증명으로 연결 실패 (기존 엔진 유지)
+        """
+        path = settings.VAULT_DATABASE_CREDS_PATH
+        if not path:
+            raise RuntimeError("VAULT_DATABASE_CREDS_PATH가 설정되지 않았습니다")
+        secret = await vault_client.read(path)
+        issued_at = time.monotonic()
+        username, password = secret.data["username"], secret.data["password"]
+
+        url = make_url(settings.async_database_url).set(
+            username=username, password=password
+        )
+        engine: Optional[AsyncEngine] = None
+        try:
+            engine = create_engine(url)
+            # 요청을 넘기기 전에 새 자격 증명으로 연결되는지 확인 (풀에 연결 하나 준비)
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception:
+            handovers_total.inc(result="error")
+            if engine is not None:
+                await engine.dispose()
+            if secret.lease_id:
+                await self._revoke(secret.lease_id)
+            raise
+
+        previous_engines = [
+            replace_engine(engine),
+            replace_read_engine(create_engine(url, read_only=True)),
+        ]
+        # 읽기 복제본도 같은 자격 증명으로 교체 (복제된 계정 사용, 연결이 안 되면
+        # 복제본 상태 확인 작업이 읽기를 주 DB로 돌림)
+        replica_url = settings.async_replica_database_url
+        if replica_url is not None:
+            replica_engine = create_engine(
+                make_url(replica_url).set(username=username, password=password),
+                read_only=True,
+                pool_name="replica",
+            )
+            previous_engines.append(replace_replica_engine(replica_engine))
+        previous_lease = self._lease
+        # 엔진을 새로 만드는 코드(close_db 후 재생성, Alembic)도 같은 자격 증명 사용
+        settings.MYSQL_USER = username
+        settings.MYSQL_PASSWORD = password
+        self._lease = _Lease(
+            lease_id=secret.lease_id,
+            issued_at=issued_at,
+            duration=secret.lease_duration or settings.VAULT_SECRET_CACHE_TTL_SECONDS,
+        )
+        handovers_total.inc(result="ok")
+        lease_expiry.set(time.time() + self._lease.duration)
+        logger.info(
+            f"DB 자격 증명 교체 완료 (사용자: {username}, "
+            f"lease: {self._lease.duration:.0f}초)"
+        )
+
+        previous = [engine for engine in previous_engines if engine is not None]
+        if previous:
+            drain = asyncio.create_task(
+                self._drain(previous, previous_lease), name="db-pool-drain"
+            )
+            self._drains.add(drain)
+            drain.add_done_callback(self._drains.discard)
+
+    async def _drain(self, engines: list[AsyncEngine], lease: Optional[_Lease]) -> None:
+        """교체된 엔진(주 DB, 주 DB 읽기, 읽기 복제본) 정리 후 기존 lease 폐기"""
+        pools_draining.inc(len(engines))
+        started = time.perf_counter()
+        try:
+            results = await asyncio.gather(
+                *(
+                    drain_engine(engine, settings.DB_POOL_DRAIN_TIMEOUT_SECONDS)
+                    for engine in engines
+                )
+            )
+        except asyncio.CancelledError:
+            for engine in engines:
+                await engine.dispose()
+            raise
+        finally:
+            pools_draining.dec(len(engines))
+        drained = all(results)
+        elapsed = time.perf_counter() - started
+        last_drain_seconds.set(elapsed)
+        drains_total.inc(result="drained" if drained else "timeout")
+        if not drained:
+            logger.warning(
+                f"교체된 DB 풀의 연결이 {elapsed:.1f}초 안에 반납되지 않아 종료합니다"
+            )
+        if lease is not None and lease.lease_id:
+            await self._revoke(lease.lease_id)
+
+    @staticmethod
+    async def _revoke(lease_id: str) -> None:
+        """lease 폐기 (실패해도 만료 시 Vault가 정리)"""
+        try:
+            await vault_client.revoke_lease(lease_id)
+        except VaultError as e:
+            logger.warning(f"DB 자격 증명 lease 폐기 실패: {e}")
+
+
+# 전역 자격 증명 교체 작업 인스턴스
+db_credential_rotator = DatabaseCredentialRotator()
@@ -0,0 +1,93 @@
+"""
+DB 연결 풀 크기 권장 작업
+DB_POOL_ADAPTIVE=true일 때 주기적으로 풀(주 DB 쓰기, 주 DB 읽기, 읽기 복제본)별 연결 대기
+시간과 최대 사용량을 관측하여 풀 크기 권장값을 로그로 남김 (실행 중인 풀 크기는 바꾸지 않음)
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.core.config import settings
+from app.core.pool import PoolRecommendation, WaitWindowTracker, recommend_pool_size
+
+logger = logging.getLogger(__name__)
+
+
+class PoolSizeAdvisor:
+    """
+    풀 크기 권장 작업
+
+    - DB_POOL_ADAPTIVE_INTERVAL_SECONDS 구간마다 풀별 대기 p95, 타임아웃, 최대 사용 연결 수 계산
+    - 대기 p95가 DB_POOL_WAIT_TARGET_MS를 넘으면 증가, 사용량이 적으면 감소 권장
+      (primary는 DB_POOL_SIZE/DB_MAX_OVERFLOW, read와 replica는 DB_READ_* 설정 기준)
+    - 풀별 마지막 권장값은 관리자 풀 상태 엔드포인트에서 조회
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopping = asyncio.Event()
+        self.last_recommendations: dict[str, PoolRecommendation] = {}
+
+    def start(self) -> None:
+        """백그라운드 실행 시작"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="db-pool-advisor")
+
+    async def stop(self) -> None:
+        """백그라운드 실행 중지"""
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    async def _run(self) -> None:
+        engines = ["primary", "read"]
+        if settings.async_replica_database_url is not None:
+            engines.append("replica")
+        trackers = [WaitWindowTracker(engine) for engine in engines]
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(),
+                    settings.DB_POOL_ADAPTIVE_INTERVAL_SECONDS,
+                )
+            except TimeoutError:
+                for tracker in trackers:
+                    self.evaluate(tracker)
+
+    def evaluate(self, tracker: WaitWindowTracker) -> PoolRecommendation:
+        """구간 통계로 해당 풀의 권장값 계산 및 로그"""
+        window = tracker.next()
+        if tracker.engine == "primary":
+            size_setting, overflow_setting = "DB_POOL_SIZE", "DB_MAX_OVERFLOW"
+        else:
+            size_setting, overflow_setting = "DB_READ_POOL_SIZE", "DB_READ_MAX_OVERFLOW"
+        recommendation = recommend_pool_size(
+            window,
+            pool_size=getattr(settings, size_setting),
+            max_overflow=getattr(settings, overflow_setting),
+            wait_target_ms=settings.DB_POOL_WAIT_TARGET_MS,
+        )
+        self.last_recommendations[tracker.engine] = recommendation
+        message = (
+            f"DB 풀 크기 권장 ({tracker.engine}): {recommendation.action} "
+            f"({size_setting}={recommendation.pool_size}, "
+            f"{overflow_setting}={recommendation.max_overflow}) "
+            f"- {recommendation.reason}"
+        )
+        if recommendation.action == "increase":
+            logger.warning(message)
+        elif recommendation.action == "decrease":
+            logger.info(message)
+        else:
+            logger.debug(message)
+        return recommendation
+
+
+# 전역 풀 크기 권장 작업 인스턴스
+pool_advisor = PoolSizeAdvisor()
@@ -0,0 +1,154 @@
+"""
+Refresh Token 정리 작업
+만료되었거나 무효화된 refresh_tokens 행을 작은 배치로 나누어 주기적으로 삭제
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.database import (
+    get_async_engine,
+    release_advisory_lock,
+    try_advisory_lock,
+)
+from app.core.metrics import counter, gauge
+from app.models.user import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+# 여러 앱 인스턴스 중 하나만 실행하기 위한 MySQL 네임드 락 이름
+GC_LOCK_NAME = "refresh_token_gc"
+
+# 정리 작업 메트릭
+rows_purged_total = counter(
+    "refresh_token_gc_rows_purged_total",
+    "정리 작업으로 삭제된 Refresh Token 행 수",
+    ("reason",),
+)
+runs_total = counter(
+    "refresh_token_gc_runs_total",
+    "Refresh Token 정리 작업 실행 수",
+    ("result",),
+)
+last_success = gauge(
+    "refresh_token_gc_last_success_timestamp_seconds",
+    "마지막 정리 작업 성공 시각 (Unix time)",
+)
+
+
+class RefreshTokenGarbageCollector:
+    """
+    Refresh Token 정리 작업
+
+    - 보존 기간이 지난 만료 토큰과 무효화된 토큰을 배치 단위로 삭제
+      (만료 토큰은 expires_at, 무효화 토큰은 revoked_at부터 보존 기간을 셈)
+      (REFRESH_TOKEN_PARTITIONED면 만료 토큰은 파티션 유지보수 명령에 맡김)
+    - 배치마다 커밋하고 잠시 대기하여 잠금 시간과 복제 부하를 제한
+    - MySQL GET_LOCK으로 여러 인스턴스 중 하나만 실행
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        """백그라운드 실행 시작"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="refresh-token-gc")
+
+    async def stop(self) -> None:
+        """백그라운드 실행 중지 (진행 중인 배치는 완료 후 종료)"""
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                runs_total.inc(result="error")
+                logger.error(f"Refresh Token 정리 작업 실패: {e}")
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(),
+                    settings.REFRESH_TOKEN_GC_INTERVAL_SECONDS,
+                )
+            except TimeoutError:
+                pass
+
+    async def run_once(self) -> int:
+        """
+        정리 작업 1회 실행
+
+        Returns:
+            삭제된 행 수 (다른 인스턴스가 실행 중이면 0)
+        """
+        cutoff = datetime.utcnow() - timedelta(
+            hours=settings.REFRESH_TOKEN_GC_RETENTION_HOURS
+        )
+        async with get_async_engine().connect() as conn:
+            if not await try_advisory_lock(conn, GC_LOCK_NAME):
+                runs_total.inc(result="skipped")
+                return 0
+            try:
+                # 파티션 테이블에서는 만료 토큰을 파티션 DROP으로 정리 (행 단위 DELETE 생략)
+                expired = 0
+                if not settings.REFRESH_TOKEN_PARTITIONED:
+                    expired = await self._purge(
+                        conn, RefreshToken.expires_at < cutoff, "expired"
+                    )
+                # revoked_at은 무효화할 때만 채워지므로 revoked_at 인덱스 범위만 탐색
+                revoked = await self._purge(
+                    conn, RefreshToken.revoked_at < cutoff, "revoked"
+                )
+            finally:
+                await release_advisory_lock(conn, GC_LOCK_NAME)
+
+        runs_total.inc(result="ok")
+        last_success.set(time.time())
+        if expired or revoked:
+            logger.info(
+                f"Refresh Token 정리 완료 (만료: {expired}, 무효화: {revoked})"
+            )
+        return expired + revoked
+
+    async def _purge(self, conn: AsyncConnection, condition: Any, reason: str) -> int:
+        """조건에 맞는 행을 PK 배치 단위로 삭제"""
+        batch_size = settings.REFRESH_TOKEN_GC_BATCH_SIZE
+        purged = 0
+        while not self._stopping.is_set():
+            result = await conn.execute(
+                select(RefreshToken.id).where(condition).limit(batch_size)
+            )
+            ids = result.scalars().all()
+            if not ids:
+                break
+
+            # PK로 삭제하여 범위 잠금 없이 해당 행만 잠금
+            await conn.execute(delete(RefreshToken).where(RefreshToken.id.in_(ids)))
+            await conn.commit()
+            purged += len(ids)
+            rows_purged_total.inc(len(ids), reason=reason)
+
+            if len(ids) < batch_size:
+                break
+            await asyncio.sleep(settings.REFRESH_TOKEN_GC_BATCH_PAUSE_SECONDS)
+        return purged
+
+
+# 전역 정리 작업 인스턴스
+refresh_token_gc = RefreshTokenGarbageCollector()
@@ -0,0 +1,114 @@
+"""
+읽기 복제본 상태 확인 작업
+주기적으로 복제본 연결과 복제 지연을 확인하여 비정상이면 읽기를 주 DB로 돌리고,
+회복되면 다시 복제본을 사용
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.database import get_replica_engine
+from app.core.replica import replica_lag_seconds, replica_state
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaHealthMonitor:
+    """
+    복제본 상태 확인 작업
+
+    - REPLICA_HEALTH_CHECK_INTERVAL_SECONDS마다 SELECT 1 (같은 시간 안에 응답해야 정상)
+    - REPLICA_MAX_LAG_SECONDS > 0이면 SHOW REPLICA STATUS의 복제 지연도 확인
+      (복제가 멈췄거나 지연이 크면 비정상)
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        """백그라운드 실행 시작"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="replica-health-monitor")
+
+    async def stop(self) -> None:
+        """백그라운드 실행 중지"""
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(),
+                    settings.REPLICA_HEALTH_CHECK_INTERVAL_SECONDS,
+                )
+            except TimeoutError:
+                await self.check()
+
+    async def check(self) -> bool:
+        """
+        복제본 상태 확인 1회 실행 후 replica_state 갱신
+
+        Returns:
+            복제본 사용 가능 여부
+        """
+        engine = get_replica_engine()
+        if engine is None:
+            replica_state.mark_unhealthy("복제본 미설정")
+            return False
+
+        try:
+            async with asyncio.timeout(settings.REPLICA_HEALTH_CHECK_INTERVAL_SECONDS):
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                    lag = await self._replication_lag(conn)
+        except Exception as e:
+            replica_state.mark_unhealthy(f"연결 실패: {e!r}")
+            return False
+
+        max_lag = settings.REPLICA_MAX_LAG_SECONDS
+        if max_lag > 0:
+            if lag is None:
+                replica_state.mark_unhealthy("복제 상태를 확인할 수 없음 (복제 중지)")
+                return False
+            replica_lag_seconds.set(lag)
+            if lag > max_lag:
+                replica_state.mark_unhealthy(f"복제 지연 {lag:.0f}초 > {max_lag:.0f}초")
+                return False
+
+        replica_state.mark_healthy()
+        return True
+
+    @staticmethod
+    async def _replication_lag(conn: AsyncConnection) -> Optional[float]:
+        """
+        복제 지연(초) 조회 (REPLICA_MAX_LAG_SECONDS=0이거나 MySQL이 아니면 0.0)
+
+        Returns:
+            지연 시간, 복제 상태가 없거나 복제가 멈췄으면 None
+        """
+        if settings.REPLICA_MAX_LAG_SECONDS <= 0 or conn.dialect.name != "mysql":
+            return 0.0
+        result = await conn.execute(text("SHOW REPLICA STATUS"))
+        row = result.mappings().first()
+        await conn.rollback()
+        if row is None:
+            return None
+        lag = row.get("Seconds_Behind_Source")
+        return float(lag) if lag is not None else None
+
+
+# 전역 복제본 상태 확인 작업 인스턴스
+replica_health_monitor = ReplicaHealthMonitor()
@@ -0,0 +1 @@
+# 성능 벤치마크 패키지 (python -m benchmarks.<모듈명> 으로 실행)
@@ -0,0 +1,578 @@
+"""
+인증 API 부하 테스트
+
+가상 사용자(동시성 수만큼)가 요청 구성(MIXES)의 가중치에 따라
+/auth/register, /auth/login, /auth/refresh, /users/me, /auth/logout을 반복 호출하며
+동시성 단계별 처리량(요청/초)과 작업별 지연 시간(p50/p95/p99)을 측정합니다.
+
+- 가상 사용자는 자기 계정과 토큰을 유지합니다. 토큰이 없으면(로그아웃, 가입 직후)
+  다음 요청은 가중치와 관계없이 로그인이며, 실제로 실행한 작업 기준으로 집계합니다.
+- --mode inprocess: 같은 프로세스에서 lifespan을 포함해 앱 실행 (httpx.ASGITransport)
+- --mode uvicorn: 하위 프로세스로 uvicorn 서버를 띄워 HTTP로 요청 (.env의 DB 사용)
+- --output: 결과를 JSON으로 저장, --baseline: 저장한 결과와 비교하여
+  처리량 감소나 p95/p99 증가가 임계값을 넘으면 종료 코드 1로 실패 (CI 회귀 확인용)
+
+부하 테스트 사용자(load-<실행 ID>-*)와 Refresh Token은 종료 시 삭제합니다.
+
+실행:
+    uv run python -m benchmarks.bench_auth_load --concurrency 1,8,32 --duration 10
+    uv run python -m benchmarks.bench_auth_load --database-url sqlite+aiosqlite:///bench.db --create-schema
+    uv run python -m benchmarks.bench_auth_load --mode uvicorn --workers 2 --output load.json
+    uv run python -m benchmarks.bench_auth_load --baseline load.json --max-throughput-drop 10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+from sqlalchemy import delete, select
+from sqlmodel import SQLModel
+
+from app.core import database
+from app.core.config import settings
+from app.models.user import RefreshToken, User
+from benchmarks.common import print_summary, summarize
+
+# 결과 JSON 형식 버전 (형식이 바뀌면 이전 기준 결과와 비교하지 않음)
+RESULT_VERSION = 1
+
+PASSWORD = "load-test-password"
+API = "/api/v1"
+
+# 요청 구성별 작업 가중치
+MIXES: dict[str, dict[str, int]] = {
+    # 로그인한 사용자의 조회 위주 트래픽
+    "browse": {"me": 85, "refresh": 10, "login": 3, "logout": 1, "register": 1},
+    # 세션 생성/종료가 잦은 트래픽 (토큰 발급, 무효화 경로)
+    "session-churn": {
+        "me": 40,
+        "refresh": 25,
+        "login": 15,
+        "logout": 15,
+        "register": 5,
+    },
+    # 가입 폭주 (Argon2 해싱 경로)
+    "signup-burst": {"register": 50, "login": 30, "me": 20},
+}
+
+# 작업별 정상 응답 코드 (그 외 응답과 전송 오류는 오류로 집계)
+EXPECTED_STATUS = {
+    "register": 201,
+    "login": 200,
+    "me": 200,
+    "refresh": 200,
+    "logout": 204,
+}
+
+
+@dataclass
+class VirtualUser:
+    """가상 사용자 (계정과 현재 토큰)"""
+
+    email: str
+    access_token: Optional[str] = None
+    refresh_token: Optional[str] = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    def sign_out(self) -> None:
+        self.access_token = self.refresh_token = None
+
+
+@dataclass
+class LevelRecorder:
+    """측정 구간의 작업별 지연 시간(초)과 응답 코드"""
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    statuses: dict[str, Counter[str]] = field(default_factory=dict)
+    errors: int = 0
+
+    def record(self, operation: str, elapsed: float, status: int) -> None:
+        self.latencies.setdefault(operation, []).append(elapsed)
+        self.statuses.setdefault(operation, Counter())[str(status)] += 1
+        if status != EXPECTED_STATUS[operation]:
+            self.errors += 1
+
+    @property
+    def requests(self) -> int:
+        return sum(len(samples) for samples in self.latencies.values())
+
+
+def new_email(run_id: str) -> str:
+    return f"load-{run_id}-{uuid.uuid4().hex[:12]}@example.com"
+
+
+async def execute(
+    client: httpx.AsyncClient,
+    user: VirtualUser,
+    operation: str,
+    run_id: str,
+) -> tuple[str, int]:
+    """
+    가상 사용자의 작업 1회 실행
+
+    Returns:
+        (실제로 실행한 작업, 응답 코드)
+    """
+    if operation in ("me", "refresh", "logout") and user.access_token is None:
+        operation = "login"
+
+    if operation == "register":
+        email = new_email(run_id)
+        response = await client.post(
+            f"{API}/auth/register",
+            json={
+                "email": email,
+                "username": email.split("@")[0],
+                "password": PASSWORD,
+            },
+        )
+        if response.status_code == 201:
+            # 새 계정으로 전환 (다음 요청에서 로그인)
+            user.email = email
+            user.sign_out()
+    elif operation == "login":
+        response = await client.post(
+            f"{API}/auth/login", json={"email": user.email, "password": PASSWORD}
+        )
+        if response.status_code == 200:
+            tokens = response.json()
+            user.access_token = tokens["access_token"]
+            user.refresh_token = tokens["refresh_token"]
+    elif operation == "me":
+        response = await client.get(f"{API}/users/me", headers=user.headers)
+    elif operation == "refresh":
+        response = await client.post(
+            f"{API}/auth/refresh", json={"refresh_token": user.refresh_token}
+        )
+        if response.status_code == 200:
+            tokens = response.json()
+            user.access_token = tokens["access_token"]
+            user.refresh_token = tokens["refresh_token"]
+    else:
+        response = await client.post(f"{API}/auth/logout", headers=user.headers)
+        if response.status_code == 204:
+            user.sign_out()
+
+    if response.status_code == 401:
+        user.sign_out()
+    return operation, response.status_code
+
+
+async def prepare_users(
+    client: httpx.AsyncClient, count: int, run_id: str
+) -> list[VirtualUser]:
+    """
+    측정 전에 가상 사용자 계정 생성 (측정에 포함하지 않음)
+
+    해싱 승인 제어(503)에 걸리지 않도록 동시 가입 수를 제한하고, 거절되면 다시 시도합니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.PASSWORD_HASH_MAX_CONCURRENCY))
+
+    async def register() -> VirtualUser:
+        user = VirtualUser(email=new_email(run_id))
+        async with semaphore:
+            while True:
+                _, status = await execute(client, user, "register", run_id)
+                if status == 201:
+                    return user
+                if status != 503:
+                    raise RuntimeError(f"부하 테스트 사용자 생성 실패: {status}")
+                await asyncio.sleep(0.1)
+
+    return await asyncio.gather(*(register() for _ in range(count)))
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    mix: str,
+    concurrency: int,
+    args: argparse.Namespace,
+    run_id: str,
+) -> dict[str, Any]:
+    """
+    동시성 단계 1회 실행 (준비 시간 동안의 요청은 집계하지 않음)
+
+    Returns:
+        결과 JSON의 results 항목
+    """
+    users = await prepare_users(client, concurrency, run_id)
+    operations = list(MIXES[mix])
+    weights = list(MIXES[mix].values())
+    recorder = LevelRecorder()
+
+    measure_from = time.perf_counter() + args.warmup
+    stop_at = measure_from + args.duration
+
+    async def worker(index: int, user: VirtualUser) -> None:
+        rng = random.Random(args.seed * 100003 + index)
+        while time.perf_counter() < stop_at:
+            operation = rng.choices(operations, weights)[0]
+            started = time.perf_counter()
+            try:
+                operation, status = await execute(client, user, operation, run_id)
+            except httpx.HTTPError:
+                status = 0
+            if started >= measure_from:
+                recorder.record(operation, time.perf_counter() - started, status)
+
+    await asyncio.gather(*(worker(index, user) for index, user in enumerate(users)))
+    elapsed = time.perf_counter() - measure_from
+
+    all_samples = [s for samples in recorder.latencies.values() for s in samples]
+    return {
+        "mix": mix,
+        "concurrency": concurrency,
+        "elapsed_seconds": elapsed,
+        "requests": recorder.requests,
+        "errors": recorder.errors,
+        "error_rate": recorder.errors / recorder.requests if recorder.requests else 0.0,
+        "throughput_rps": recorder.requests / elapsed if elapsed > 0 else 0.0,
+        "latency": {
+            "all": summarize(all_samples),
+            **{
+                operation: summarize(samples)
+                for operation, samples in sorted(recorder.latencies.items())
+            },
+        },
+        "status": {
+            operation: dict(statuses)
+            for operation, statuses in sorted(recorder.statuses.items())
+        },
+    }
+
+
+def print_level(result: dict[str, Any]) -> None:
+    """동시성 단계 결과 출력"""
+    print(
+        f"\n[{result['mix']} x {result['concurrency']}] "
+        f"{result['requests']}건 / {result['elapsed_seconds']:.1f}초  "
+        f"{result['throughput_rps']:.1f} req/s  오류 {result['errors']}건 "
+        f"({result['error_rate'] * 100:.2f}%)"
+    )
+    for operation, stats in result["latency"].items():
+        print_summary(f"  {operation}", stats)
+    for operation, statuses in result["status"].items():
+        expected = str(EXPECTED_STATUS[operation])
+        codes = {code: n for code, n in statuses.items() if code != expected}
+        if codes:
+            print(f"  {operation} 오류 응답: {codes}")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def inprocess_client(
+    args: argparse.Namespace,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """같은 프로세스에서 앱 lifespan을 시작하고 ASGI 클라이언트 반환"""
+    from app.main import create_app
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=args.timeout
+        ) as client:
+            yield client
+
+
+@asynccontextmanager
+async def uvicorn_client(
+    args: argparse.Namespace,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """uvicorn 서버를 하위 프로세스로 띄우고 /health 응답 후 HTTP 클라이언트 반환"""
+    port = free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:create_app", "--factory",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(args.workers), "--log-level", "warning",
+        ],
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    connections = max(args.concurrency)
+    limits = httpx.Limits(
+        max_connections=connections, max_keepalive_connections=connections
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=base_url, timeout=args.timeout, limits=limits
+        ) as client:
+            deadline = time.monotonic() + args.startup_timeout
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError(f"uvicorn 종료 (코드 {server.returncode})")
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if time.monotonic() > deadline:
+                    raise RuntimeError(
+                        f"uvicorn이 {args.startup_timeout:.0f}초 안에 시작되지 않음"
+                    )
+                await asyncio.sleep(0.2)
+            yield client
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+
+async def cleanup(run_id: str) -> None:
+    """부하 테스트 사용자와 Refresh Token 삭제 (실패해도 측정 결과의 오류를 가리지 않음)"""
+    is_load_user = User.email.like(f"load-{run_id}-%")
+    try:
+        async with database.get_session_factory()() as session:
+            await session.execute(
+                delete(RefreshToken).where(
+                    RefreshToken.user_id.in_(select(User.id).where(is_load_user))
+                )
+            )
+            result = await session.execute(delete(User).where(is_load_user))
+            await session.commit()
+    except Exception as e:
+        print(f"\n부하 테스트 사용자 삭제 실패 (load-{run_id}-*): {e}", file=sys.stderr)
+        return
+    print(f"\n부하 테스트 사용자 {result.rowcount}명 삭제")
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    results: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    args: argparse.Namespace,
+) -> list[str]:
+    """
+    기준 결과와 비교하여 표를 출력하고 회귀 목록 반환
+
+    같은 (mix, concurrency) 항목끼리 비교합니다.
+    - 처리량이 --max-throughput-drop % 넘게 감소
+    - 전체 p95/p99, 작업별 p95가 --max-latency-increase % 넘게 증가
+      (증가폭이 --min-latency-delta-ms 미만이거나 작업 표본이 --min-samples개 미만이면
+      측정 잡음으로 보고 무시)
+    """
+    if baseline.get("version") != RESULT_VERSION:
+        return [f"기준 결과 형식 버전이 다름 ({baseline.get('version')} != {RESULT_VERSION})"]
+    previous = {(r["mix"], r["concurrency"]): r for r in baseline["results"]}
+    regressions = []
+
+    def latency_regressed(label: str, before: float, after: float) -> bool:
+        increase = after - before
+        if increase < args.min_latency_delta_ms or before <= 0:
+            return False
+        if increase / before * 100 <= args.max_latency_increase:
+            return False
+        regressions.append(f"{label}: {before:.2f}ms -> {after:.2f}ms")
+        return True
+
+    meta = baseline["meta"]
+    print(f"\n기준 결과 비교 ({meta.get('git_commit')}, {meta.get('created_at')})")
+    for result in results:
+        key = (result["mix"], result["concurrency"])
+        before = previous.get(key)
+        name = f"{key[0]} x {key[1]}"
+        if before is None:
+            print(f"{name:<24} 기준 결과 없음")
+            continue
+
+        rps_before, rps_after = before["throughput_rps"], result["throughput_rps"]
+        rps_change = (rps_after - rps_before) / rps_before * 100 if rps_before else 0.0
+        rps_bad = rps_change < -args.max_throughput_drop
+        if rps_bad:
+            regressions.append(f"{name} 처리량: {rps_before:.1f} -> {rps_after:.1f} req/s")
+
+        latency_bad = False
+        for pct in ("p95_ms", "p99_ms"):
+            latency_bad |= latency_regressed(
+                f"{name} 전체 {pct[:3]}",
+                before["latency"]["all"][pct],
+                result["latency"]["all"][pct],
+            )
+        for operation, stats in result["latency"].items():
+            baseline_stats = before["latency"].get(operation)
+            if (
+                operation != "all"
+                and baseline_stats is not None
+                and min(stats["count"], baseline_stats["count"]) >= args.min_samples
+            ):
+                latency_bad |= latency_regressed(
+                    f"{name} {operation} p95",
+                    baseline_stats["p95_ms"],
+                    stats["p95_ms"],
+                )
+
+        all_before, all_after = before["latency"]["all"], result["latency"]["all"]
+        print(
+            f"{name:<24} {rps_before:8.1f} -> {rps_after:8.1f} req/s "
+            f"({rps_change:+6.1f}%)  "
+            f"p95 {all_before['p95_ms']:7.2f} -> {all_after['p95_ms']:7.2f}ms  "
+            f"p99 {all_before['p99_ms']:7.2f} -> {all_after['p99_ms']:7.2f}ms  "
+            f"{'회귀' if rps_bad or latency_bad else 'OK'}"
+        )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.mode == "inprocess":
+        settings.DB_CREATE_SCHEMA = False
+        if args.database_url:
+            database.replace_engine(database.create_engine(args.database_url))
+            database.replace_read_engine(
+                database.create_engine(args.database_url, read_only=True)
+            )
+        if args.create_schema:
+            async with database.get_async_engine().begin() as conn:
+                await conn.run_sync(SQLModel.metadata.create_all)
+
+    run_id = uuid.uuid4().hex[:8]
+    results = []
+    client_context = inprocess_client if args.mode == "inprocess" else uvicorn_client
+    try:
+        async with client_context(args) as client:
+            try:
+                for mix in args.mix:
+                    for concurrency in args.concurrency:
+                        result = await run_level(client, mix, concurrency, args, run_id)
+                        print_level(result)
+                        results.append(result)
+            finally:
+                # inprocess는 lifespan 종료 시 엔진을 정리하므로 그 전에 삭제
+                if args.mode == "inprocess":
+                    await cleanup(run_id)
+    finally:
+        if args.mode == "uvicorn":
+            await cleanup(run_id)
+            await database.close_db()
+
+    database_url = args.database_url or settings.async_database_url
+    report = {
+        "version": RESULT_VERSION,
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "mode": args.mode,
+            "workers": args.workers if args.mode == "uvicorn" else None,
+            "database": database_url.split(":", 1)[0],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "duration_seconds": args.duration,
+            "warmup_seconds": args.warmup,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+        )
+        print(f"결과 저장: {args.output}")
+
+    failures = [
+        f"{r['mix']} x {r['concurrency']} 오류율 {r['error_rate'] * 100:.2f}%"
+        for r in results
+        if r["error_rate"] * 100 > args.max_error_rate
+    ]
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        failures += compare(results, baseline, args)
+    if failures:
+        print("\n실패:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    return 0
+
+
+def int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 프로세스 수")
+    parser.add_argument(
+        "--mix",
+        type=lambda value: value.split(","),
+        default=["browse", "session-churn"],
+        help=f"요청 구성 (쉼표 구분: {', '.join(MIXES)})",
+    )
+    parser.add_argument(
+        "--concurrency", type=int_list, default=[1, 8, 32], help="동시성 단계 (쉼표 구분)"
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="단계별 준비 시간(초)")
+    parser.add_argument("--seed", type=int, default=1, help="작업 선택 난수 시드")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 제한 시간(초)")
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument("--database-url", help="inprocess 전용, 기본값: 설정의 MySQL URL")
+    parser.add_argument(
+        "--create-schema", action="store_true", help="테이블이 없으면 생성 (SQLite 등)"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON (--output으로 저장한 파일)")
+    parser.add_argument(
+        "--max-throughput-drop", type=float, default=10.0, help="허용 처리량 감소율(%%)"
+    )
+    parser.add_argument(
+        "--max-latency-increase", type=float, default=20.0, help="허용 p95/p99 증가율(%%)"
+    )
+    parser.add_argument(
+        "--min-latency-delta-ms",
+        type=float,
+        default=1.0,
+        help="이보다 작은 지연 시간 증가는 무시(ms)",
+    )
+    parser.add_argument(
+        "--min-samples", type=int, default=50, help="작업별 p95 비교에 필요한 최소 표본 수"
+    )
+    parser.add_argument(
+        "--max-error-rate", type=float, default=1.0, help="허용 오류율(%%, 기준 결과와 무관)"
+    )
+    args = parser.parse_args()
+    unknown = [mix for mix in args.mix if mix not in MIXES]
+    if unknown:
+        parser.error(f"알 수 없는 요청 구성: {', '.join(unknown)}")
+    if args.mode == "uvicorn" and (args.database_url or args.create_schema):
+        parser.error("--mode uvicorn은 .env의 DB 설정을 사용합니다 (--database-url 미지원)")
+    sys.exit(asyncio.run(main(args)))
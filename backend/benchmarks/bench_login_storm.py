@@ -0,0 +1,105 @@
+"""
+로그인 폭주 중 무관한 엔드포인트 지연 시간 벤치마크
+
+Argon2 검증을 이벤트 루프에서 직접 실행(sync)할 때와 워커 풀에서 실행(pool)할 때,
+동시에 들어오는 가벼운 요청(/ping, /users/me 대용)의 p99 지연 시간을 비교합니다.
+
+실행:
+    uv run python -m benchmarks.bench_login_storm --logins 200 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.hashing import shutdown_hash_executor
+from app.core.security import (
+    get_password_hash,
+    verify_password,
+    verify_password_async,
+)
+from benchmarks.common import print_summary, summarize
+
+PASSWORD = "benchmark-password"
+
+
+def build_app(hashed: str) -> FastAPI:
+    """벤치마크용 최소 앱 (DB 없이 해싱 경로만 재현)"""
+    app = FastAPI()
+
+    @app.post("/login-sync")
+    async def login_sync() -> dict[str, bool]:
+        return {"ok": verify_password(PASSWORD, hashed)}
+
+    @app.post("/login-pool")
+    async def login_pool() -> dict[str, bool]:
+        return {"ok": await verify_password_async(PASSWORD, hashed)}
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+async def run_mode(
+    client: httpx.AsyncClient,
+    login_path: str,
+    logins: int,
+    concurrency: int,
+    ping_interval: float,
+) -> list[float]:
+    """로그인 폭주를 발생시키며 /ping 지연 시간 수집"""
+    semaphore = asyncio.Semaphore(concurrency)
+    ping_latencies: list[float] = []
+    storm_done = asyncio.Event()
+
+    async def login() -> None:
+        async with semaphore:
+            await client.post(login_path)
+
+    async def pinger() -> None:
+        # 예정된 시작 시각 기준으로 측정하여 루프가 막힌 시간도 지연에 포함
+        scheduled = time.perf_counter()
+        while not storm_done.is_set():
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            await client.get("/ping")
+            ping_latencies.append(time.perf_counter() - scheduled)
+            scheduled = max(scheduled + ping_interval, time.perf_counter())
+
+    ping_task = asyncio.create_task(pinger())
+    await asyncio.gather(*(login() for _ in range(logins)))
+    storm_done.set()
+    await ping_task
+    return ping_latencies
+
+
+async def main(args: argparse.Namespace) -> None:
+    hashed = get_password_hash(PASSWORD)
+    app = build_app(hashed)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, path in (("sync (event loop)", "/login-sync"), ("pool", "/login-pool")):
+            started = time.perf_counter()
+            latencies = await run_mode(
+                client, path, args.logins, args.concurrency, args.ping_interval
+            )
+            elapsed = time.perf_counter() - started
+            print_summary(f"/ping during {label}", summarize(latencies))
+            print(f"{'':<24} logins/s={args.logins / elapsed:8.1f}")
+
+    shutdown_hash_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=200, help="로그인 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 로그인 수")
+    parser.add_argument(
+        "--ping-interval", type=float, default=0.005, help="/ping 요청 간격(초)"
+    )
+    asyncio.run(main(parser.parse_args()))
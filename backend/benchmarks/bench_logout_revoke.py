@@ -0,0 +1,127 @@
+"""
+로그아웃(전체 Refresh Token 무효화) 벤치마크
+
+미무효화 토큰이 많은 사용자에 대해 기존 방식(ORM 객체 로드 후 하나씩 변경)과
+단일 UPDATE 방식(UserCRUD.revoke_all_user_tokens)의 소요 시간을 비교합니다.
+
+실행 (로컬 DB, 벤치마크 데이터는 종료 시 삭제):
+    uv run python -m benchmarks.bench_logout_revoke --tokens 10000
+    uv run python -m benchmarks.bench_logout_revoke --database-url sqlite+aiosqlite:///bench.db --create-schema
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel, select
+
+from app.core.config import settings
+from app.crud.user import user_crud
+from app.models.user import RefreshToken, User
+
+
+async def legacy_revoke_all(session: AsyncSession, user_id: int) -> int:
+    """기존 방식: 토큰 행을 ORM 객체로 모두 로드한 뒤 하나씩 변경"""
+    result = await session.execute(
+        select(RefreshToken).where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.is_revoked == False,  # noqa: E712
+        )
+    )
+    tokens = result.scalars().all()
+    for token in tokens:
+        token.is_revoked = True
+        session.add(token)
+    await session.flush()
+    return len(tokens)
+
+
+async def seed(session: AsyncSession, tokens: int) -> int:
+    """벤치마크용 사용자와 Refresh Token 생성"""
+    suffix = uuid.uuid4().hex[:12]
+    user = User(
+        email=f"bench-{suffix}@example.com",
+        username=f"bench-{suffix}",
+        hashed_password="not-a-real-hash",
+    )
+    session.add(user)
+    await session.flush()
+
+    expires_at = datetime.utcnow() + timedelta(days=7)
+    rows = [
+        {
+            "user_id": user.id,
+            "token_hash": os.urandom(32),
+            "expires_at": expires_at,
+            "is_revoked": False,
+            "created_at": datetime.utcnow(),
+        }
+        for _ in range(tokens)
+    ]
+    for start in range(0, len(rows), 1000):
+        await session.execute(insert(RefreshToken), rows[start : start + 1000])
+    await session.commit()
+    return user.id
+
+
+async def reset(session: AsyncSession, user_id: int) -> None:
+    """토큰 무효화 상태 초기화"""
+    await session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id)
+        .values(is_revoked=False, revoked_at=None)
+    )
+    await session.commit()
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    if args.create_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user_id = await seed(session, args.tokens)
+
+    strategies = (
+        ("legacy (ORM load)", legacy_revoke_all),
+        ("bulk UPDATE", user_crud.revoke_all_user_tokens),
+    )
+    try:
+        for label, revoke in strategies:
+            timings = []
+            for _ in range(args.repeat):
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    await reset(session, user_id)
+                    started = time.perf_counter()
+                    revoked = await revoke(session, user_id)
+                    await session.commit()
+                    timings.append(time.perf_counter() - started)
+            best = min(timings) * 1000
+            print(f"{label:<20} revoked={revoked:>6}  best={best:9.2f}ms  ({args.repeat} runs)")
+    finally:
+        async with AsyncSession(engine) as session:
+            await session.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=10000, help="미무효화 토큰 수")
+    parser.add_argument("--repeat", type=int, default=5, help="전략별 반복 횟수")
+    parser.add_argument(
+        "--database-url",
+        default=settings.async_database_url,
+        help="비동기 DB URL (기본값: 설정의 MySQL)",
+    )
+    parser.add_argument(
+        "--create-schema", action="store_true", help="테이블이 없으면 생성"
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,142 @@
+"""
+메트릭 수집 오버헤드 벤치마크
+
+요청 경로에 추가되는 메트릭 비용을 측정합니다.
+
+- middleware: 빈 ASGI 앱 호출 대비 MetricsMiddleware를 거친 호출의 추가 시간
+- timed: 빈 함수 대비 timed 데코레이터를 붙인 동기/코루틴 함수의 추가 시간
+- /health: 메트릭 미들웨어 사용(on) / 미사용(off) 앱의 요청 지연 (httpx ASGI 전송)
+
+요청당 미들웨어 추가 시간이 예산을 넘으면 종료 코드 1로 실패합니다.
+
+실행:
+    uv run python -m benchmarks.bench_metrics_overhead
+    uv run python -m benchmarks.bench_metrics_overhead --iterations 200000 --budget-us 20
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import timed
+from app.core.middleware import MetricsMiddleware
+from benchmarks.common import print_summary, summarize
+
+
+class _Route:
+    path_format = "/api/v1/users/{user_id}"
+
+
+async def _receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: dict[str, Any]) -> None:
+    return None
+
+
+async def _endpoint(scope: dict[str, Any], receive: Any, send: Any) -> None:
+    """라우터처럼 scope에 라우트를 기록하고 빈 응답을 보내는 ASGI 앱"""
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def per_call_us(app: Any, iterations: int) -> float:
+    """ASGI 앱 호출 1회당 평균 시간(마이크로초)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        scope = {"type": "http", "method": "GET", "path": "/api/v1/users/1"}
+        await app(scope, _receive, _send)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def sync_per_call_us(func: Any, iterations: int) -> float:
+    """동기 함수 호출 1회당 평균 시간(마이크로초)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def async_per_call_us(func: Any, iterations: int) -> float:
+    """코루틴 함수 호출 1회당 평균 시간(마이크로초)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def _noop() -> None:
+    return None
+
+
+async def _async_noop() -> None:
+    return None
+
+
+async def health_latencies(enabled: bool, requests: int) -> list[float]:
+    """메트릭 미들웨어 사용 여부별 /health 요청 지연(초) 목록"""
+    from app.main import create_app
+
+    settings.METRICS_ENABLED = enabled
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get("/health")
+        for _ in range(requests):
+            started = time.perf_counter()
+            await client.get("/health")
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def main(args: argparse.Namespace) -> int:
+    bare = await per_call_us(_endpoint, args.iterations)
+    wrapped = await per_call_us(MetricsMiddleware(_endpoint), args.iterations)
+    middleware_us = wrapped - bare
+    print(f"{'middleware':<24} 빈 앱 {bare:6.2f}us  미들웨어 {wrapped:6.2f}us  "
+          f"추가 {middleware_us:6.2f}us/요청")
+
+    timed_noop = timed("bench.noop")(_noop)
+    timed_async_noop = timed("bench.async_noop")(_async_noop)
+    bare = sync_per_call_us(_noop, args.iterations)
+    wrapped = sync_per_call_us(timed_noop, args.iterations)
+    print(f"{'timed (sync)':<24} 빈 함수 {bare:6.2f}us  timed {wrapped:6.2f}us  "
+          f"추가 {wrapped - bare:6.2f}us/호출")
+    bare = await async_per_call_us(_async_noop, args.iterations)
+    wrapped = await async_per_call_us(timed_async_noop, args.iterations)
+    print(f"{'timed (async)':<24} 빈 함수 {bare:6.2f}us  timed {wrapped:6.2f}us  "
+          f"추가 {wrapped - bare:6.2f}us/호출")
+
+    for enabled in (False, True):
+        latencies = await health_latencies(enabled, args.requests)
+        print_summary(f"/health metrics={'on' if enabled else 'off'}", summarize(latencies))
+
+    if middleware_us > args.budget_us:
+        print(f"예산 초과: 미들웨어 {middleware_us:.2f}us > {args.budget_us:.0f}us")
+        return 1
+    print(f"예산 이내: 미들웨어 {middleware_us:.2f}us <= {args.budget_us:.0f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--iterations", type=int, default=100000, help="마이크로 벤치마크 반복 수"
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="/health 요청 수")
+    parser.add_argument(
+        "--budget-us",
+        type=float,
+        default=25.0,
+        help="요청당 미들웨어 추가 시간 예산(마이크로초)",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
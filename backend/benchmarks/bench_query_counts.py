@@ -0,0 +1,138 @@
+"""
+인증 엔드포인트 DB 왕복 수 확인
+
+회원가입, 로그인, 내 정보 조회, 토큰 갱신, 로그아웃을 앱에 직접 요청하여
+엔드포인트별 DB 왕복 수(SQL 문 + COMMIT/ROLLBACK), DB 시간, 행 수를 출력하고
+QUERY_BUDGETS를 넘으면 실행한 SQL 문과 함께 종료 코드 1로 실패합니다 (CI 회귀 확인용).
+왕복 수를 줄였으면 QUERY_BUDGETS도 함께 낮춰 개선을 고정합니다.
+
+실행 (로컬 DB, 벤치마크 사용자는 종료 시 삭제):
+    uv run python -m benchmarks.bench_query_counts
+    uv run python -m benchmarks.bench_query_counts --database-url sqlite+aiosqlite:///bench.db --create-schema
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+from typing import Any
+
+import httpx
+from sqlalchemy import delete
+from sqlmodel import SQLModel
+
+from app.core import database
+from app.core.config import settings
+from app.core.query_stats import QueryStats, track_queries
+from app.crud.user import user_crud
+from app.models.user import RefreshToken
+
+# 엔드포인트별 최대 DB 왕복 수 (현재 구현 기준)
+QUERY_BUDGETS = {
+    "register": 3,
+    "login": 3,
+    "me (uncached)": 1,
+    "me (cached)": 0,
+    "refresh": 3,
+    "logout": 3,
+}
+
+
+def report(name: str, stats: QueryStats) -> bool:
+    """한 줄 출력 후 예산 이내 여부 반환 (초과 시 SQL 문 목록 출력)"""
+    budget = QUERY_BUDGETS[name]
+    ok = stats.statements <= budget
+    print(
+        f"{name:<16} {stats.statements:>3} / {budget:<3} 왕복  "
+        f"DB {stats.db_ms:7.2f}ms  변경 {stats.affected_rows:>4}행  {'OK' if ok else '초과'}"
+    )
+    if not ok:
+        for index, statement in enumerate(stats.captured, 1):
+            print(f"    {index}. {' '.join(statement.split())}")
+    return ok
+
+
+async def run_flow(client: httpx.AsyncClient, suffix: str) -> bool:
+    """인증 흐름 실행 후 모든 엔드포인트가 예산 이내인지 반환"""
+    email = f"bench-{suffix}@example.com"
+    password = "benchmark-password"
+    results = []
+
+    async def step(name: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        with track_queries() as stats:
+            response = await client.request(method, url, **kwargs)
+        response.raise_for_status()
+        results.append(report(name, stats))
+        return response
+
+    await step(
+        "register",
+        "POST",
+        "/api/v1/auth/register",
+        json={"email": email, "username": f"bench-{suffix}", "password": password},
+    )
+    response = await step(
+        "login", "POST", "/api/v1/auth/login", json={"email": email, "password": password}
+    )
+    tokens = response.json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    await step("me (uncached)", "GET", "/api/v1/users/me", headers=headers)
+    await step("me (cached)", "GET", "/api/v1/users/me", headers=headers)
+    response = await step(
+        "refresh",
+        "POST",
+        "/api/v1/auth/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    await step("logout", "POST", "/api/v1/auth/logout", headers=headers)
+    return all(results)
+
+
+async def cleanup(suffix: str) -> None:
+    """벤치마크 사용자와 Refresh Token 삭제"""
+    async with database.get_session_factory()() as session:
+        user = await user_crud.get_user_by_email(session, f"bench-{suffix}@example.com")
+        if user is not None:
+            await session.execute(
+                delete(RefreshToken).where(RefreshToken.user_id == user.id)
+            )
+            await session.delete(user)
+            await session.commit()
+
+
+async def main(args: argparse.Namespace) -> int:
+    if not settings.JWT_SECRET_KEY:
+        settings.JWT_SECRET_KEY = "benchmark-secret-key-with-at-least-32-bytes"
+    settings.DB_CREATE_SCHEMA = False
+    if args.database_url:
+        database.replace_engine(database.create_engine(args.database_url))
+        database.replace_read_engine(
+            database.create_engine(args.database_url, read_only=True)
+        )
+    engine = database.get_async_engine()
+    if args.create_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    from app.main import create_app
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    suffix = uuid.uuid4().hex[:12]
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            ok = await run_flow(client, suffix)
+    finally:
+        await cleanup(suffix)
+        await database.close_db()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", help="기본값: 설정의 MySQL URL")
+    parser.add_argument(
+        "--create-schema", action="store_true", help="테이블이 없으면 생성 (SQLite 등)"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,132 @@
+"""
+읽기 세션 DB 왕복 수 벤치마크
+
+인증 사용자 조회(get_current_user의 DB 경로)를 기존 방식(쓰기 풀 세션: pre-ping +
+SELECT + COMMIT)과 읽기 세션(autocommit 읽기 풀: SELECT만)으로 반복 실행하여
+조회 1회당 DB 왕복 수(SQL 문 + COMMIT/ROLLBACK + pre-ping)와 지연 시간을 비교합니다.
+사용자 캐시는 끄고 매번 DB에서 조회합니다.
+
+실행 (로컬 DB, 벤치마크 사용자는 종료 시 삭제):
+    uv run python -m benchmarks.bench_read_session --iterations 2000
+    uv run python -m benchmarks.bench_read_session --database-url sqlite+aiosqlite:///bench.db --create-schema
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import SQLModel
+
+from app.api.deps import load_user_for_auth
+from app.core import database
+from app.core.config import settings
+from app.core.query_stats import track_queries
+from app.crud.user import user_crud
+from app.models.user import User
+from benchmarks.common import print_summary, summarize
+
+
+def count_pings(engine: AsyncEngine) -> list[int]:
+    """엔진의 pre-ping 횟수를 세는 카운터 설치 (pre-ping은 SQL 실행 이벤트로 잡히지 않음)"""
+    dialect = engine.sync_engine.dialect
+    do_ping = dialect.do_ping
+    pings = [0]
+
+    def counting_ping(dbapi_connection: Any) -> bool:
+        pings[0] += 1
+        return do_ping(dbapi_connection)
+
+    dialect.do_ping = counting_ping  # type: ignore[method-assign]
+    return pings
+
+
+async def transactional_read(user_id: int) -> None:
+    """기존 방식: 쓰기 풀 세션으로 조회 후 커밋 (get_async_session과 같은 흐름)"""
+    async with database.get_session_factory()() as session:
+        await user_crud.get_user_for_auth(session, user_id)
+        await session.commit()
+
+
+async def read_session_read(user_id: int) -> None:
+    """읽기 세션으로 조회 (get_current_user와 같은 흐름, 커밋 없음)"""
+    async with database.get_read_session_factory()() as session:
+        await load_user_for_auth(session, user_id)
+
+
+async def measure(
+    label: str,
+    read: Callable[[int], Awaitable[None]],
+    user_id: int,
+    iterations: int,
+    pings: list[int],
+) -> None:
+    """반복 실행 후 지연 시간 통계와 조회 1회당 왕복 수 출력"""
+    await read(user_id)  # 연결 준비
+    pings[0] = 0
+    samples = []
+    with track_queries(capture=False) as stats:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await read(user_id)
+            samples.append(time.perf_counter() - started)
+    print_summary(label, summarize(samples))
+    print(
+        f"{'':<24} 조회당 왕복 {(stats.statements + pings[0]) / iterations:.2f}회 "
+        f"(SQL 문 + COMMIT/ROLLBACK {stats.statements / iterations:.2f}, "
+        f"pre-ping {pings[0] / iterations:.2f})"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    settings.USER_CACHE_ENABLED = False
+    if args.database_url:
+        database.replace_engine(database.create_engine(args.database_url))
+        database.replace_read_engine(
+            database.create_engine(args.database_url, read_only=True)
+        )
+    engine = database.get_async_engine()
+    if args.create_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    suffix = uuid.uuid4().hex[:12]
+    async with database.get_session_factory()() as session:
+        user = User(
+            email=f"bench-{suffix}@example.com",
+            username=f"bench-{suffix}",
+            hashed_password="not-a-real-hash",
+        )
+        session.add(user)
+        await session.commit()
+        user_id = user.id
+
+    try:
+        write_pings = count_pings(engine)
+        read_pings = count_pings(database.get_read_engine())
+        await measure(
+            "transactional", transactional_read, user_id, args.iterations, write_pings
+        )
+        await measure(
+            "read session", read_session_read, user_id, args.iterations, read_pings
+        )
+    finally:
+        async with database.get_session_factory()() as session:
+            user = await session.get(User, user_id)
+            if user is not None:
+                await session.delete(user)
+                await session.commit()
+        await database.close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--database-url", help="기본값: 설정의 MySQL URL")
+    parser.add_argument(
+        "--create-schema", action="store_true", help="테이블이 없으면 생성 (SQLite 등)"
+    )
+    asyncio.run(main(parser.parse_args()))
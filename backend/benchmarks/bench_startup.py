@@ -0,0 +1,113 @@
+"""
+애플리케이션 시작 시간 벤치마크
+
+새 프로세스에서 app.main import, create_app(), lifespan 시작/종료 시간을 측정하고
+import + 시작 시간의 중앙값이 예산을 넘으면 종료 코드 1로 실패합니다 (CI 회귀 확인용).
+
+Vault는 지연을 준 가짜 Vault(benchmarks.fake_vault)를 사용합니다.
+--no-db면 DB 연결 준비와 정리 작업을 끄고 import와 Vault 로드만 측정합니다.
+
+실행:
+    uv run python -m benchmarks.bench_startup --no-db
+    uv run python -m benchmarks.bench_startup --runs 10 --budget-ms 1500 --vault-latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+
+async def measure(args: argparse.Namespace) -> dict[str, float]:
+    """현재 프로세스에서 import부터 lifespan 종료까지 단계별 시간(ms) 측정"""
+    started = time.perf_counter()
+    from app.main import create_app
+
+    imported = time.perf_counter()
+    app = create_app()
+    created = time.perf_counter()
+
+    import httpx
+
+    from app.core import vault
+    from app.core.config import settings
+    from benchmarks.fake_vault import FakeVault
+
+    fake = FakeVault(latency=args.vault_latency)
+    vault.vault_client = vault.VaultClient(
+        addr="http://vault", token=fake.token, transport=httpx.ASGITransport(app=fake)
+    )
+    if args.no_db:
+        settings.DB_POOL_WARM_SIZE = 0
+        settings.REFRESH_TOKEN_GC_ENABLED = False
+
+    lifespan_started = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+    stopped = time.perf_counter()
+    return {
+        "import_ms": (imported - started) * 1000,
+        "create_app_ms": (created - imported) * 1000,
+        "startup_ms": (ready - lifespan_started) * 1000,
+        "shutdown_ms": (stopped - ready) * 1000,
+        "total_ms": (ready - lifespan_started + created - started) * 1000,
+    }
+
+
+def run_child(args: argparse.Namespace) -> dict[str, float]:
+    """새 인터프리터에서 측정 (모듈 캐시 없는 콜드 스타트)"""
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.bench_startup",
+        "--child",
+        "--vault-latency",
+        str(args.vault_latency),
+    ]
+    if args.no_db:
+        command.append("--no-db")
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(args: argparse.Namespace) -> int:
+    samples = [run_child(args) for _ in range(args.runs)]
+    for phase in ("import_ms", "create_app_ms", "startup_ms", "shutdown_ms", "total_ms"):
+        values = [sample[phase] for sample in samples]
+        print(
+            f"{phase:<24} p50={statistics.median(values):8.1f}ms  "
+            f"max={max(values):8.1f}ms"
+        )
+
+    total = statistics.median(sample["total_ms"] for sample in samples)
+    if total > args.budget_ms:
+        print(f"예산 초과: import + 시작 {total:.1f}ms > {args.budget_ms:.0f}ms")
+        return 1
+    print(f"예산 이내: import + 시작 {total:.1f}ms <= {args.budget_ms:.0f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="측정 프로세스 수")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=2000.0,
+        help="import + 시작 시간 예산(ms, 중앙값 기준)",
+    )
+    parser.add_argument(
+        "--vault-latency", type=float, default=0.02, help="가짜 Vault 응답 지연(초)"
+    )
+    parser.add_argument(
+        "--no-db", action="store_true", help="DB 연결 준비와 정리 작업 비활성화"
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(asyncio.run(measure(args))))
+    else:
+        sys.exit(main(args))
@@ -0,0 +1,63 @@
+"""
+Access Token 디코딩 비용 마이크로 벤치마크
+
+같은 Access Token을 반복 검증할 때 요청당 디코딩 비용을
+검증 캐시 사용(on) / 미사용(off)으로 비교합니다.
+
+실행:
+    uv run python -m benchmarks.bench_token_decode --iterations 50000
+"""
+
+import argparse
+import time
+
+from app.core.config import settings
+from app.core.security import (
+    clear_token_cache,
+    create_access_token,
+    decode_token_cached,
+)
+
+
+def measure(token: str, iterations: int) -> float:
+    """요청당 평균 디코딩 시간(마이크로초)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        decode_token_cached(token)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main(args: argparse.Namespace) -> None:
+    if not settings.JWT_SECRET_KEY:
+        settings.JWT_SECRET_KEY = "benchmark-secret-key-with-at-least-32-bytes"
+
+    # 무상태 모드 크기의 클레임을 포함하여 실제 토큰 크기에 가깝게 구성
+    token = create_access_token(
+        subject=1,
+        extra_claims={
+            "ver": 0,
+            "usr": {
+                "em": "user@example.com",
+                "un": "benchmark-user",
+                "fn": "Benchmark User",
+                "act": True,
+                "su": False,
+                "ca": "2026-01-01T00:00:00.000000",
+                "ua": "2026-01-01T00:00:00.000000",
+            },
+        },
+    )
+    print(f"token length: {len(token)} bytes")
+
+    for enabled in (False, True):
+        settings.TOKEN_CACHE_ENABLED = enabled
+        clear_token_cache()
+        per_call = measure(token, args.iterations)
+        label = "cache on" if enabled else "cache off"
+        print(f"{label:<10} {per_call:8.2f} us/request  ({args.iterations} iterations)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50000, help="반복 횟수")
+    main(parser.parse_args())
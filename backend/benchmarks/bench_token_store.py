@@ -0,0 +1,166 @@
+"""
+Refresh Token 저장소 처리량 벤치마크
+
+동시 클라이언트가 각자 토큰 체인을 로테이션(/auth/refresh의 저장소 작업)할 때
+저장소별 초당 로테이션 수와 지연 시간을 비교합니다.
+요청 흐름과 같게 로테이션마다 세션을 열고 커밋합니다.
+
+실행:
+    uv run python -m benchmarks.bench_token_store --backends memory sql \\
+        --database-url sqlite+aiosqlite:///bench.db --create-schema
+    uv run python -m benchmarks.bench_token_store --backends sql redis --redis-url redis://localhost:6379/15
+    uv run python -m benchmarks.bench_token_store --token-format opaque
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.config import settings
+from app.core.security import issue_refresh_token
+from app.crud.token_store import TokenStore, create_token_store
+from app.models.user import RefreshToken, User
+from benchmarks.common import print_summary, summarize
+
+
+async def seed_users(engine: AsyncEngine, count: int) -> list[int]:
+    """벤치마크용 사용자 생성 (refresh_tokens 외래 키가 있는 스키마 대비)"""
+    suffix = uuid.uuid4().hex[:12]
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        users = [
+            User(
+                email=f"bench-{suffix}-{i}@example.com",
+                username=f"bench-{suffix}-{i}",
+                hashed_password="not-a-real-hash",
+            )
+            for i in range(count)
+        ]
+        session.add_all(users)
+        await session.commit()
+        return [user.id for user in users]
+
+
+async def cleanup(engine: AsyncEngine, user_ids: list[int]) -> None:
+    """벤치마크 데이터 삭제"""
+    async with AsyncSession(engine) as session:
+        await session.execute(
+            delete(RefreshToken).where(RefreshToken.user_id.in_(user_ids))
+        )
+        await session.execute(delete(User).where(User.id.in_(user_ids)))
+        await session.commit()
+
+
+async def rotate_chain(
+    store: TokenStore,
+    engine: AsyncEngine,
+    user_id: int,
+    rotations: int,
+    latencies: list[float],
+) -> None:
+    """한 클라이언트의 토큰 체인 로테이션"""
+    token = issue_refresh_token(subject=user_id)
+    async with AsyncSession(engine) as session:
+        await store.save(session, user_id, token)
+        await session.commit()
+
+    for _ in range(rotations):
+        new_token = issue_refresh_token(subject=user_id)
+        started = time.perf_counter()
+        # 키-값 저장소는 세션을 사용하지 않으므로 커밋 시 DB 연결도 열리지 않음
+        async with AsyncSession(engine) as session:
+            rotated = await store.rotate(session, token, new_token, user_id=user_id)
+            await session.commit()
+        latencies.append(time.perf_counter() - started)
+        if rotated is None:
+            raise RuntimeError("로테이션 실패")
+        token = new_token
+
+
+async def run_backend(
+    backend: str,
+    engine: AsyncEngine,
+    user_ids: list[int],
+    rotations: int,
+) -> None:
+    store = create_token_store(backend)
+    latencies: list[float] = []
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                rotate_chain(store, engine, user_id, rotations, latencies)
+                for user_id in user_ids
+            )
+        )
+        elapsed = time.perf_counter() - started
+        if backend != "sql":
+            for user_id in user_ids:
+                await store.revoke_all(None, user_id)
+    finally:
+        await store.close()
+
+    print_summary(backend, summarize(latencies))
+    print(f"{'':<24} {len(latencies) / elapsed:10.0f} rotations/s")
+
+
+async def main(args: argparse.Namespace) -> None:
+    if not settings.JWT_SECRET_KEY:
+        settings.JWT_SECRET_KEY = "benchmark-secret-key-with-at-least-32-bytes"
+    if args.redis_url:
+        settings.REDIS_URL = args.redis_url
+    settings.TOKEN_STORE_KEY_PREFIX = f"bench:{uuid.uuid4().hex[:8]}:rt:"
+    settings.REFRESH_TOKEN_FORMAT = args.token_format
+
+    engine = create_async_engine(
+        args.database_url, pool_size=args.clients, max_overflow=0
+    )
+    if args.create_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    user_ids = list(range(1, args.clients + 1))
+    if "sql" in args.backends:
+        user_ids = await seed_users(engine, args.clients)
+    try:
+        for backend in args.backends:
+            await run_backend(backend, engine, user_ids, args.rotations)
+    finally:
+        if "sql" in args.backends:
+            await cleanup(engine, user_ids)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=("sql", "redis", "memory"),
+        default=["sql", "memory"],
+        help="비교할 저장소",
+    )
+    parser.add_argument(
+        "--token-format",
+        choices=("jwt", "opaque"),
+        default=settings.REFRESH_TOKEN_FORMAT,
+        help="Refresh Token 형식",
+    )
+    parser.add_argument("--clients", type=int, default=32, help="동시 클라이언트 수")
+    parser.add_argument(
+        "--rotations", type=int, default=100, help="클라이언트별 로테이션 횟수"
+    )
+    parser.add_argument(
+        "--database-url",
+        default=settings.async_database_url,
+        help="비동기 DB URL (기본값: 설정의 MySQL)",
+    )
+    parser.add_argument(
+        "--create-schema", action="store_true", help="테이블이 없으면 생성"
+    )
+    parser.add_argument("--redis-url", help="Redis URL (기본값: 설정의 REDIS_URL)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,79 @@
+"""
+Vault 시크릿 로드 벤치마크
+
+가짜 Vault(benchmarks.fake_vault)에 왕복 지연을 주고 시작 시 시크릿 로드 시간을
+비교합니다.
+
+- sequential: 인증 확인 후 jwt, database를 차례로 조회 (기존 동기 방식의 요청 순서)
+- concurrent: load_secrets_to_settings (jwt, database 동시 조회, 연결 재사용)
+- cached: 캐시된 시크릿 조회 (요청 처리 중 조회 비용)
+
+실행:
+    uv run python -m benchmarks.bench_vault_load
+    uv run python -m benchmarks.bench_vault_load --latency 0.05 --iterations 20
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core import vault
+from app.core.vault import VaultClient, load_secrets_to_settings
+from benchmarks.common import print_summary, summarize
+from benchmarks.fake_vault import FakeVault
+
+
+async def load_sequential(client: VaultClient) -> None:
+    """인증 확인, jwt, database를 차례로 조회"""
+    await client.is_authenticated()
+    await client.read_kv("jwt")
+    await client.read_kv("database")
+
+
+async def load_concurrent(client: VaultClient) -> None:
+    """load_secrets_to_settings와 같은 동시 조회 (캐시 없이 매번 Vault 왕복)"""
+    client._cache.clear()
+    vault.vault_client = client
+    await load_secrets_to_settings()
+
+
+async def main(args: argparse.Namespace) -> None:
+    fake = FakeVault(latency=args.latency)
+    client = VaultClient(
+        addr="http://vault", token=fake.token, transport=httpx.ASGITransport(app=fake)
+    )
+    original = vault.vault_client
+    try:
+        for label, load in (
+            ("sequential", load_sequential),
+            ("concurrent", load_concurrent),
+        ):
+            latencies = []
+            for _ in range(args.iterations):
+                fake.requests.clear()
+                started = time.perf_counter()
+                await load(client)
+                latencies.append(time.perf_counter() - started)
+            print_summary(label, summarize(latencies))
+            print(f"{'':<24} {sum(fake.requests.values())} Vault 요청/로드")
+
+        latencies = []
+        for _ in range(args.iterations * 100):
+            started = time.perf_counter()
+            await client.get_secret("jwt")
+            latencies.append(time.perf_counter() - started)
+        print_summary("cached", summarize(latencies))
+    finally:
+        vault.vault_client = original
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Vault 응답 지연(초)"
+    )
+    parser.add_argument("--iterations", type=int, default=10, help="로드 반복 횟수")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,45 @@
+"""
+벤치마크 공통 유틸리티
+지연 시간 통계 계산 및 출력
+"""
+
+import math
+from collections.abc import Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    백분위수 계산 (nearest-rank 방식)
+
+    Args:
+        samples: 측정값 목록
+        pct: 백분위 (0~100)
+
+    Returns:
+        백분위수 값 (샘플이 없으면 0.0)
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: Sequence[float]) -> dict[str, float]:
+    """지연 시간(초) 목록을 밀리초 단위 통계로 요약"""
+    return {
+        "count": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": (max(samples) if samples else 0.0) * 1000,
+    }
+
+
+def print_summary(label: str, stats: dict[str, float]) -> None:
+    """통계 한 줄 출력"""
+    print(
+        f"{label:<24} n={int(stats['count']):>5}  "
+        f"p50={stats['p50_ms']:8.2f}ms  p95={stats['p95_ms']:8.2f}ms  "
+        f"p99={stats['p99_ms']:8.2f}ms  max={stats['max_ms']:8.2f}ms"
+    )
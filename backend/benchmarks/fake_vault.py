@@ -0,0 +1,157 @@
+"""
+로컬 검증용 가짜 Vault 서버
+KV v2 읽기(GET /v1/{mount}/data/{path}), 동적 DB 자격 증명 발급
+(GET /v1/database/creds/{role}), lease 폐기, 토큰 조회만 구현한 ASGI 앱
+
+응답마다 지정한 지연을 두어 원격 Vault 왕복을 흉내 내고, 요청 수를 기록합니다.
+httpx.ASGITransport로 프로세스 안에서 사용하거나 uvicorn으로 띄울 수 있습니다.
+
+실행:
+    uv run uvicorn benchmarks.fake_vault:app --port 8200
+    VAULT_ADDR=http://localhost:8200 uv run uvicorn main:app
+    VAULT_ADDR=http://localhost:8200 VAULT_DATABASE_CREDS_PATH=database/creds/app \\
+        uv run uvicorn main:app
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import secrets as secrets_module
+from collections import Counter
+from typing import Any
+
+# 기본 시크릿 (HS256 서명 키, DB 비밀번호)
+DEFAULT_SECRETS: dict[str, dict[str, Any]] = {
+    "secret/jwt": {
+        "secret_key": "fake-vault-secret-key-with-at-least-32-bytes",
+        "algorithm": "HS256",
+    },
+    "secret/database": {"password": ""},
+}
+
+
+class FakeVault:
+    """
+    가짜 Vault ASGI 앱
+
+    Args:
+        secrets: "{mount_point}/{path}" -> 시크릿 데이터
+        latency: 응답 지연(초)
+        token: 허용할 X-Vault-Token (다르면 403)
+        lease_duration: KV 응답의 lease_duration(초, KV는 보통 0)
+        db_lease_duration: 동적 DB 자격 증명 lease 수명(초)
+        db_username: 동적 자격 증명 사용자명 (None이면 발급마다 새 이름, 실제 DB에
+            연결하려면 존재하는 계정 지정)
+        db_password: db_username 지정 시 비밀번호
+    """
+
+    def __init__(
+        self,
+        secrets: dict[str, dict[str, Any]] | None = None,
+        latency: float = 0.0,
+        token: str = "dev-root-token",
+        lease_duration: int = 0,
+        db_lease_duration: int = 3600,
+        db_username: str | None = None,
+        db_password: str = "",
+    ):
+        self.secrets = dict(DEFAULT_SECRETS if secrets is None else secrets)
+        self.latency = latency
+        self.token = token
+        self.lease_duration = lease_duration
+        self.db_lease_duration = db_lease_duration
+        self.db_username = db_username
+        self.db_password = db_password
+        # 발급되어 폐기되지 않은 lease
+        self.leases: set[str] = set()
+        self._lease_numbers = itertools.count(1)
+        self.requests: Counter[str] = Counter()
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        path = scope["path"]
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        self.requests[path] += 1
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            status, response = self._handle(
+                scope["method"], path, dict(scope["headers"]), body
+            )
+        finally:
+            self.concurrent -= 1
+        payload = json.dumps(response).encode() if status != 204 else b""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(payload)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+    def _handle(
+        self, method: str, path: str, headers: dict[bytes, bytes], body: bytes
+    ) -> tuple[int, dict[str, Any]]:
+        if headers.get(b"x-vault-token", b"").decode() != self.token:
+            return 403, {"errors": ["permission denied"]}
+        if path == "/v1/auth/token/lookup-self":
+            return 200, {"data": {"ttl": 0}}
+        if path == "/v1/sys/leases/revoke" and method == "PUT":
+            self.leases.discard(json.loads(body or b"{}").get("lease_id", ""))
+            return 204, {}
+        if path.startswith("/v1/database/creds/") and method == "GET":
+            return 200, self._issue_db_credentials(path.removeprefix("/v1/"))
+
+        mount_point, sep, rest = path.removeprefix("/v1/").partition("/data/")
+        secret = self.secrets.get(f"{mount_point}/{rest}") if sep else None
+        if method != "GET" or secret is None:
+            return 404, {"errors": []}
+        return 200, {
+            "lease_id": "",
+            "lease_duration": self.lease_duration,
+            "renewable": False,
+            "data": {"data": secret, "metadata": {"version": 1}},
+        }
+
+
+    def _issue_db_credentials(self, path: str) -> dict[str, Any]:
+        number = next(self._lease_numbers)
+        lease_id = f"{path}/{number}"
+        self.leases.add(lease_id)
+        return {
+            "lease_id": lease_id,
+            "lease_duration": self.db_lease_duration,
+            "renewable": True,
+            "data": {
+                "username": self.db_username or f"v-app-{number}",
+                "password": (
+                    self.db_password
+                    if self.db_username
+                    else secrets_module.token_urlsafe(16)
+                ),
+            },
+        }
+
+
+# uvicorn 실행용 인스턴스 (FAKE_VAULT_LATENCY로 지연, FAKE_VAULT_DB_*로 동적 자격 증명 지정)
+app = FakeVault(
+    latency=float(os.environ.get("FAKE_VAULT_LATENCY", "0")),
+    db_lease_duration=int(os.environ.get("FAKE_VAULT_DB_LEASE_SECONDS", "3600")),
+    db_username=os.environ.get("FAKE_VAULT_DB_USERNAME"),
+    db_password=os.environ.get("FAKE_VAULT_DB_PASSWORD", ""),
+)
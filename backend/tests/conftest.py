@@ -0,0 +1,29 @@
+"""
+테스트 공통 픽스처
+임시 SQLite 파일 DB로 쓰기 엔진과 읽기(autocommit) 엔진을 교체
+"""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from sqlmodel import SQLModel
+
+from app.core import database
+from app.crud.user import user_cache
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncIterator[None]:
+    """테스트마다 새 SQLite DB (종료 시 엔진 정리)"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    database.replace_engine(database.create_engine(url))
+    database.replace_read_engine(database.create_engine(url, read_only=True))
+    async with database.get_async_engine().begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    user_cache.clear()
+    try:
+        yield
+    finally:
+        user_cache.clear()
+        await database.close_db()
@@ -0,0 +1,37 @@
+"""
+사용자 일괄 INSERT 테스트
+이미 있는 이메일/사용자명은 건너뛰고 새로 생성된 행만 세는지 확인
+"""
+
+from sqlalchemy import func, select
+
+from app.core import database
+from app.crud.user import user_crud
+from app.models.user import User
+
+
+def user_row(email: str, username: str) -> dict[str, str]:
+    return {"email": email, "username": username, "hashed_password": "hash"}
+
+
+async def test_duplicates_are_skipped_and_not_counted(db: None) -> None:
+    async with database.get_session_factory()() as session:
+        inserted = await user_crud.bulk_insert_users(
+            session,
+            [user_row("a@example.com", "alice"), user_row("b@example.com", "bob")],
+        )
+        await session.commit()
+        assert inserted == 2
+
+        inserted = await user_crud.bulk_insert_users(
+            session,
+            [
+                user_row("a@example.com", "alice2"),
+                user_row("c@example.com", "bob"),
+                user_row("d@example.com", "dave"),
+            ],
+        )
+        await session.commit()
+        assert inserted == 1
+        total = await session.execute(select(func.count()).select_from(User))
+        assert total.scalar_one() == 3
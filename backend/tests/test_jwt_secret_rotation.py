@@ -0,0 +1,52 @@
+"""
+Vault JWT 시크릿 갱신 테스트
+
+HS256 서명 키가 바뀌면 이전 키로 서명된 토큰은 검증 캐시에 남아 있어도 거절되어야 합니다.
+"""
+
+import hashlib
+from collections.abc import Iterator
+
+import jwt
+import pytest
+
+from app.core.config import settings
+from app.core.security import (
+    clear_token_cache,
+    create_access_token,
+    decode_token_cached,
+    verified_token_cache,
+)
+from app.core.vault import apply_jwt_secrets
+
+
+@pytest.fixture
+def hs256(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", "HS256")
+    monkeypatch.setattr(
+        settings, "JWT_SECRET_KEY", "old-secret-key-with-at-least-32-bytes"
+    )
+    monkeypatch.setattr(settings, "TOKEN_CACHE_ENABLED", True)
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+def test_rotated_secret_rejects_cached_token(hs256):
+    token = create_access_token(subject=1)
+    assert decode_token_cached(token)["sub"] == "1"
+
+    apply_jwt_secrets({"secret_key": "new-secret-key-with-at-least-32-bytes"})
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_token_cached(token)
+
+
+def test_unchanged_secret_keeps_cache(hs256):
+    token = create_access_token(subject=1)
+    decode_token_cached(token)
+
+    apply_jwt_secrets({"secret_key": settings.JWT_SECRET_KEY, "algorithm": "HS256"})
+
+    key = hashlib.sha256(token.encode()).digest()
+    assert verified_token_cache.get(key) is not None
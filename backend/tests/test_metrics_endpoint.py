@@ -0,0 +1,33 @@
+"""
+/metrics 엔드포인트 노출 테스트
+기본 설정에서는 등록하지 않고, 켠 경우 허용 네트워크에서만 조회할 수 있는지 확인
+"""
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.main import create_app
+
+
+async def get_metrics(client_host: str = "127.0.0.1") -> httpx.Response:
+    transport = httpx.ASGITransport(app=create_app(), client=(client_host, 12345))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await c.get("/metrics")
+
+
+async def test_metrics_endpoint_is_not_mounted_by_default() -> None:
+    assert type(settings).model_fields["METRICS_ENDPOINT_ENABLED"].default is False
+    assert (await get_metrics()).status_code == 404
+
+
+async def test_metrics_endpoint_allows_only_listed_networks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "METRICS_ENDPOINT_ENABLED", True)
+    monkeypatch.setattr(settings, "METRICS_ALLOWED_NETWORKS", ["10.0.0.0/8"])
+
+    allowed = await get_metrics("10.1.2.3")
+    assert allowed.status_code == 200
+    assert "# TYPE" in allowed.text
+    assert (await get_metrics("203.0.113.7")).status_code == 403
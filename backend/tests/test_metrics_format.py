@@ -0,0 +1,28 @@
+"""
+Prometheus 텍스트 포맷 출력 테스트
+라벨 값의 역슬래시, 큰따옴표, 줄바꿈이 이스케이프되어 한 줄로 노출되는지 확인
+"""
+
+from app.core.metrics import Counter, Histogram
+
+
+def test_label_values_are_escaped() -> None:
+    counter = Counter("test_escape_total", "이스케이프 테스트", ("path",))
+    counter.inc(path='a\\b"c\nd')
+
+    lines = counter.render()
+
+    assert 'test_escape_total{path="a\\\\b\\"c\\nd"} 1.0' in lines
+    assert all("\n" not in line for line in lines)
+
+
+def test_histogram_label_values_are_escaped() -> None:
+    histogram = Histogram(
+        "test_escape_seconds", "이스케이프 테스트", ("path",), buckets=(1.0,)
+    )
+    histogram.observe(0.5, path='"x"')
+
+    rendered = "\n".join(histogram.render())
+
+    assert 'test_escape_seconds_count{path="\\"x\\""} 1' in rendered
+    assert 'test_escape_seconds_bucket{path="\\"x\\"",le="1"} 1' in rendered
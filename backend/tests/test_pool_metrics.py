@@ -0,0 +1,57 @@
+"""
+풀 메트릭 engine 라벨 테스트
+쓰기 풀과 읽기 풀의 연결 획득이 각자의 라벨과 사용량, 권장값 설정으로 집계되는지 확인
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.core import database
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.pool import WaitWindowTracker, checkouts_total, pool_usages
+from app.tasks.pool_advisor import PoolSizeAdvisor
+
+
+async def test_checkouts_are_counted_per_engine(db: None) -> None:
+    primary_before = checkouts_total.value(engine="primary")
+    read_before = checkouts_total.value(engine="read")
+
+    async with database.get_read_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert pool_usages["read"].checked_out == 1
+        assert pool_usages["primary"].checked_out == 0
+
+    assert checkouts_total.value(engine="read") == read_before + 1
+    assert checkouts_total.value(engine="primary") == primary_before
+    assert 'db_pool_checked_out{engine="read"} 0' in registry.render()
+
+
+async def test_recreated_pool_keeps_engine_label(db: None) -> None:
+    engine = database.get_read_engine()
+    await engine.dispose()
+    before = checkouts_total.value(engine="read")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    assert checkouts_total.value(engine="read") == before + 1
+
+
+async def test_read_pool_is_advised_against_read_settings(
+    db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 20)
+    monkeypatch.setattr(settings, "DB_READ_POOL_SIZE", 1)
+    tracker = WaitWindowTracker("read")
+    advisor = PoolSizeAdvisor()
+
+    async with database.get_read_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    recommendation = advisor.evaluate(tracker)
+
+    # 쓰기 풀 설정(20) 기준이면 감소 권장, 읽기 풀 설정(1) 기준이면 유지
+    assert recommendation.action == "keep"
+    assert recommendation.pool_size == 1
+    assert advisor.last_recommendations["read"] is recommendation
+    assert "primary" not in advisor.last_recommendations
@@ -0,0 +1,95 @@
+"""
+프로필 수정과 무상태 Access Token 테스트
+인증과 무관한 수정은 기존 토큰을 유지하고, 이메일/사용자명/비밀번호 수정은 기존 토큰을
+무효화하되 응답의 새 토큰으로 계속 사용(로그아웃 포함)할 수 있는지 확인
+"""
+
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.query_stats import track_queries
+from app.crud.user import token_version_floor
+from app.main import create_app
+
+
+@pytest.fixture
+async def client(
+    db: None, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[httpx.AsyncClient]:
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_STATELESS", True)
+    monkeypatch.setattr(settings, "JWT_SECRET_KEY", "test-secret-key" * 3)
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", "HS256")
+    token_version_floor.clear()
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+    token_version_floor.clear()
+
+
+async def register(client: httpx.AsyncClient) -> str:
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "a@example.com",
+            "username": "alice",
+            "password": "password123",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["access_token"]
+
+
+def bearer(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def test_cosmetic_update_keeps_access_token(client: httpx.AsyncClient) -> None:
+    token = await register(client)
+
+    response = await client.put(
+        "/api/v1/users/me", json={"full_name": "B"}, headers=bearer(token)
+    )
+    assert response.status_code == 200
+    new_token = response.json()["access_token"]
+
+    old = await client.get("/api/v1/users/me", headers=bearer(token))
+    assert old.status_code == 200
+    me = await client.get("/api/v1/users/me", headers=bearer(new_token))
+    assert me.json()["full_name"] == "B"
+    logout = await client.post("/api/v1/auth/logout", headers=bearer(token))
+    assert logout.status_code == 204
+
+
+async def test_credential_update_returns_replacement_token(
+    client: httpx.AsyncClient,
+) -> None:
+    token = await register(client)
+
+    response = await client.put(
+        "/api/v1/users/me", json={"password": "password456"}, headers=bearer(token)
+    )
+    assert response.status_code == 200
+    new_token = response.json()["access_token"]
+
+    old = await client.get("/api/v1/users/me", headers=bearer(token))
+    assert old.status_code == 401
+    me = await client.get("/api/v1/users/me", headers=bearer(new_token))
+    assert me.status_code == 200
+    logout = await client.post("/api/v1/auth/logout", headers=bearer(new_token))
+    assert logout.status_code == 204
+
+
+async def test_logout_skips_token_version_update_when_stateful(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_STATELESS", False)
+    token = await register(client)
+
+    with track_queries() as stats:
+        logout = await client.post("/api/v1/auth/logout", headers=bearer(token))
+
+    assert logout.status_code == 204
+    assert not any(sql.startswith("UPDATE users") for sql in stats.captured)
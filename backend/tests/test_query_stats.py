@@ -0,0 +1,34 @@
+"""
+SQL 실행 통계 테스트
+affected_rows가 DML이 바꾼 행만 세고 SELECT 결과는 세지 않는지 확인
+"""
+
+from sqlalchemy import select, update
+
+from app.core import database
+from app.core.query_stats import track_queries
+from app.models.user import User
+
+
+async def test_affected_rows_counts_dml_only(db: None) -> None:
+    async with database.get_session_factory()() as session:
+        session.add_all(
+            User(
+                email=f"u{index}@example.com",
+                username=f"u{index}",
+                hashed_password="x",
+            )
+            for index in range(3)
+        )
+        await session.commit()
+
+        with track_queries() as stats:
+            users = (await session.execute(select(User))).scalars().all()
+        assert len(users) == 3
+        assert stats.affected_rows == 0
+
+        with track_queries() as stats:
+            await session.execute(update(User).values(full_name="renamed"))
+            await session.commit()
+        assert stats.affected_rows == 3
+        assert "3 affected rows" in stats.server_timing()
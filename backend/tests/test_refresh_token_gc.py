@@ -0,0 +1,55 @@
+"""
+Refresh Token 정리 작업 테스트
+무효화된 토큰의 보존 기간을 무효화 시각(revoked_at)부터 세는지 확인
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlmodel import select
+
+from app.core import database
+from app.core.config import settings
+from app.models.user import RefreshToken
+from app.tasks.refresh_token_gc import RefreshTokenGarbageCollector
+
+
+def revoked_token(
+    index: int, created_hours_ago: float, revoked_hours_ago: Optional[float]
+) -> RefreshToken:
+    now = datetime.utcnow()
+    return RefreshToken(
+        user_id=1,
+        token_hash=bytes([index]) * 32,
+        expires_at=now + timedelta(days=7),
+        is_revoked=True,
+        revoked_at=(
+            now - timedelta(hours=revoked_hours_ago)
+            if revoked_hours_ago is not None
+            else None
+        ),
+        created_at=now - timedelta(hours=created_hours_ago),
+    )
+
+
+async def test_revoked_tokens_are_retained_from_revocation(db: None) -> None:
+    retention = settings.REFRESH_TOKEN_GC_RETENTION_HOURS
+    async with database.get_session_factory()() as session:
+        session.add_all(
+            [
+                # 오래전 발급, 방금 무효화: 보존
+                revoked_token(1, retention * 5, 0),
+                # 보존 기간 전에 무효화: 삭제
+                revoked_token(2, retention * 5, retention * 2),
+                # 무효화 시각 없는 행(010 백필 이후 구버전 무효화): 만료 전까지 보존
+                revoked_token(3, retention * 5, None),
+            ]
+        )
+        await session.commit()
+
+    purged = await RefreshTokenGarbageCollector().run_once()
+
+    async with database.get_session_factory()() as session:
+        remaining = (await session.execute(select(RefreshToken.token_hash))).scalars()
+        assert purged == 1
+        assert sorted(remaining) == [bytes([1]) * 32, bytes([3]) * 32]
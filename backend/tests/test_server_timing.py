@@ -0,0 +1,29 @@
+"""
+Server-Timing 헤더 테스트
+기본 설정에서는 DB 통계를 응답 헤더로 노출하지 않는지 확인
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.config import settings
+from app.main import create_app
+
+
+async def get_health(app: FastAPI) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await c.get("/health")
+
+
+async def test_server_timing_is_off_by_default() -> None:
+    assert type(settings).model_fields["SERVER_TIMING_ENABLED"].default is False
+    response = await get_health(create_app())
+    assert "server-timing" not in response.headers
+
+
+async def test_server_timing_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "SERVER_TIMING_ENABLED", True)
+    response = await get_health(create_app())
+    assert response.headers["server-timing"].startswith("db;dur=")
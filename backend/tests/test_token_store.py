@@ -0,0 +1,30 @@
+"""
+Refresh Token 저장소 테스트
+키-값 저장소의 일괄 무효화가 SQL 저장소와 같이 사용자 캐시를 무효화하는지 확인
+"""
+
+import pytest
+
+from app.core import database
+from app.core.config import settings
+from app.core.security import create_refresh_token
+from app.crud.token_store import create_token_store
+from app.crud.user import user_cache, user_crud
+from app.models.user import User
+
+
+async def test_key_value_revoke_all_invalidates_cached_user(
+    db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "JWT_SECRET_KEY", "test-secret-key" * 3)
+    store = create_token_store("memory")
+    async with database.get_session_factory()() as session:
+        user = User(email="kv@example.com", username="kv", hashed_password="x")
+        session.add(user)
+        await session.commit()
+        await user_crud.get_user_for_auth(session, user.id)
+        assert user_cache.get(user.id) is not None
+
+        await store.save(session, user.id, create_refresh_token(user.id))
+        assert await store.revoke_all(session, user.id) == 1
+        assert user_cache.get(user.id) is None
@@ -0,0 +1,70 @@
+"""
+인증 사용자 캐시 무효화 시점 테스트
+
+쓰기 세션은 응답 후에 커밋하므로, flush와 커밋 사이에 들어온 인증 조회가
+커밋 전 행을 다시 캐시해도 커밋 후에는 새 값이 보여야 합니다.
+"""
+
+from app.core import database
+from app.crud.user import user_crud
+from app.models.user import User
+from app.schemas.user import UserUpdate
+
+
+async def create_user() -> int:
+    async with database.get_session_factory()() as session:
+        user = User(
+            email="cache@example.com",
+            username="cache",
+            hashed_password="not-a-real-hash",
+        )
+        session.add(user)
+        await session.commit()
+        return user.id
+
+
+async def load_for_auth(user_id: int) -> User:
+    async with database.get_read_session_factory()() as session:
+        user = await user_crud.get_user_for_auth(session, user_id)
+    assert user is not None
+    return user
+
+
+async def test_soft_delete_visible_after_commit_despite_concurrent_read(db):
+    user_id = await create_user()
+    assert (await load_for_auth(user_id)).is_active
+
+    async with database.get_session_factory()() as session:
+        user = await session.get(User, user_id)
+        await user_crud.delete_user(session, user, soft_delete=True)
+        # flush 후 커밋 전: 다른 요청의 인증 조회가 커밋 전 행을 다시 캐시
+        assert (await load_for_auth(user_id)).is_active
+        await session.commit()
+
+    assert not (await load_for_auth(user_id)).is_active
+
+
+async def test_profile_update_visible_after_commit_despite_concurrent_read(db):
+    user_id = await create_user()
+    await load_for_auth(user_id)
+
+    async with database.get_session_factory()() as session:
+        user = await session.get(User, user_id)
+        await user_crud.update_user(session, user, UserUpdate(full_name="Updated"))
+        assert (await load_for_auth(user_id)).full_name is None
+        await session.commit()
+
+    assert (await load_for_auth(user_id)).full_name == "Updated"
+
+
+async def test_rollback_keeps_cached_user(db):
+    user_id = await create_user()
+    await load_for_auth(user_id)
+
+    async with database.get_session_factory()() as session:
+        user = await session.get(User, user_id)
+        await user_crud.delete_user(session, user, soft_delete=True)
+        await session.rollback()
+        assert not session.info.get("pending_user_invalidations")
+
+    assert (await load_for_auth(user_id)).is_active
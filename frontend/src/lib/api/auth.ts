@@ -10,6 +10,7 @@ import type {
   TokenResponse,
   User,
   UpdateProfileRequest,
+  UpdateProfileResponse,
   RefreshTokenRequest,
 } from "@/types/auth";
 
@@ -65,8 +66,13 @@ export const authApi = {
   /**
    * 프로필 업데이트
    */
-  updateProfile: async (data: UpdateProfileRequest): Promise<User> => {
-    const response = await apiClient.put<User>("/api/v1/users/me", data);
+  updateProfile: async (
+    data: UpdateProfileRequest
+  ): Promise<UpdateProfileResponse> => {
+    const response = await apiClient.put<UpdateProfileResponse>(
+      "/api/v1/users/me",
+      data
+    );
     return response.data;
   },
 
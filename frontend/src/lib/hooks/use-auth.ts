@@ -79,7 +79,11 @@ export function useAuth() {
   // 프로필 업데이트
   const updateProfileMutation = useMutation({
     mutationFn: (data: UpdateProfileRequest) => authApi.updateProfile(data),
-    onSuccess: (updatedUser) => {
+    onSuccess: ({ access_token, ...updatedUser }) => {
+      // 이메일/사용자명/비밀번호 변경 시 기존 Access Token이 무효화되므로 새 토큰으로 교체
+      if (access_token) {
+        useAuthStore.getState().setAccessToken(access_token);
+      }
       useAuthStore.getState().setUser(updatedUser);
       queryClient.invalidateQueries({ queryKey: ["currentUser"] });
       toast.success("프로필 업데이트 완료");
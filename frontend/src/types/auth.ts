@@ -47,6 +47,11 @@ export interface UpdateProfileRequest {
   password?: string;
 }
 
+// 프로필 업데이트 응답 (무상태 Access Token 모드에서는 새 Access Token 포함)
+export interface UpdateProfileResponse extends User {
+  access_token: string | null;
+}
+
 // Refresh Token 요청
 export interface RefreshTokenRequest {
   refresh_token: string;
@@ -0,0 +1,60 @@
+#!/bin/bash
+
+# 읽기 복제본 초기화 스크립트
+# docker-compose --profile replica로 실행한 mysql-replica를 mysql의 복제본으로 설정
+# 주 DB 스냅샷(mysqldump)을 복제본에 복원하고 스냅샷 시점의 binlog 위치부터 복제 시작
+
+set -e
+
+# 색상 정의
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+NC='\033[0m' # No Color
+
+COMPOSE="${COMPOSE:-docker-compose}"
+DATABASE="${MYSQL_DATABASE:-starterkit_db}"
+
+echo -e "${YELLOW}=== 읽기 복제본 초기화 스크립트 ===${NC}"
+
+# 두 MySQL 인스턴스 준비 확인
+for service in mysql mysql-replica; do
+    until ${COMPOSE} exec -T "${service}" sh -c 'mysqladmin ping -uroot -p"$MYSQL_ROOT_PASSWORD" --silent' > /dev/null 2>&1; do
+        echo "${service}가 준비될 때까지 대기 중..."
+        sleep 2
+    done
+done
+echo -e "${GREEN}MySQL 인스턴스가 준비되었습니다.${NC}"
+
+# 복제 연결 정보 설정 (복제 계정은 개발용 root 사용)
+echo -e "${YELLOW}복제 연결 설정 중...${NC}"
+${COMPOSE} exec -T mysql-replica sh -c 'mysql -uroot -p"$MYSQL_ROOT_PASSWORD" -e "
+    STOP REPLICA;
+    RESET REPLICA ALL;
+    CHANGE REPLICATION SOURCE TO
+        SOURCE_HOST='"'"'mysql'"'"',
+        SOURCE_USER='"'"'root'"'"',
+        SOURCE_PASSWORD='"'"'$MYSQL_ROOT_PASSWORD'"'"',
+        GET_SOURCE_PUBLIC_KEY=1;
+"'
+
+# 주 DB 스냅샷 복원 (덤프에 포함된 binlog 위치로 복제 시작점 설정)
+echo -e "${YELLOW}주 DB 스냅샷을 복제본에 복원 중...${NC}"
+${COMPOSE} exec -T mysql sh -c "mysqldump -uroot -p\"\$MYSQL_ROOT_PASSWORD\" --single-transaction --source-data=1 --databases ${DATABASE}" \
+    | ${COMPOSE} exec -T mysql-replica sh -c 'mysql -uroot -p"$MYSQL_ROOT_PASSWORD"'
+
+# 복제 시작
+${COMPOSE} exec -T mysql-replica sh -c 'mysql -uroot -p"$MYSQL_ROOT_PASSWORD" -e "START REPLICA;"'
+sleep 2
+
+# 복제 상태 확인
+STATUS=$(${COMPOSE} exec -T mysql-replica sh -c 'mysql -uroot -p"$MYSQL_ROOT_PASSWORD" -e "SHOW REPLICA STATUS\G"' 2>/dev/null)
+if echo "${STATUS}" | grep -q "Replica_SQL_Running: Yes"; then
+    echo "${STATUS}" | grep -E "Replica_(IO|SQL)_Running:|Seconds_Behind_Source:"
+    echo -e "${GREEN}=== 읽기 복제본 초기화 완료 ===${NC}"
+    echo -e "${YELLOW}backend/.env에 MYSQL_REPLICA_HOST와 MYSQL_REPLICA_PORT=3307을 설정하세요.${NC}"
+else
+    echo "${STATUS}"
+    echo -e "${RED}복제가 시작되지 않았습니다. 위 상태의 Last_*_Error를 확인하세요.${NC}"
+    exit 1
+fi